@@ -0,0 +1,67 @@
+"""
+Бенчмарк потокового экспорта сотрудников в CSV.
+
+Измеряет скорость экспорта (строк в секунду) и пиковое потребление памяти
+во время экспорта в файл, в gzip-поток и в "пустой" поток.
+
+Запуск:
+    python examples/benchmark_csv_export.py --employees 1000000
+"""
+
+import argparse
+import gzip
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmark_utils import build_company
+
+
+def measure(label: str, export) -> None:
+    """Запускает экспорт дважды: для замера времени и для замера памяти."""
+    start = time.perf_counter()
+    rows = export()
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    export()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"{label:<12} {rows:>10} строк  {elapsed:8.2f} с  "
+          f"{rows / elapsed:>12,.0f} строк/с  пик памяти: {peak / 1024:,.0f} КБ")
+
+
+def main():
+    """Основная функция бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    
+    print(f"Создание компании из {args.employees} сотрудников...")
+    company = build_company(args.employees)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "employees.csv")
+        gz_path = os.path.join(tmp, "employees.csv.gz")
+        
+        def to_null():
+            with open(os.devnull, "w", newline="", encoding="utf-8") as f:
+                return company.export_employees_csv(f, args.batch_size)
+        
+        def to_file():
+            return company.export_employees_csv(csv_path, args.batch_size)
+        
+        def to_gzip():
+            with gzip.open(gz_path, "wt", newline="", encoding="utf-8") as f:
+                return company.export_employees_csv(f, args.batch_size)
+        
+        measure("devnull", to_null)
+        measure("файл", to_file)
+        measure("gzip", to_gzip)
+
+
+if __name__ == "__main__":
+    main()
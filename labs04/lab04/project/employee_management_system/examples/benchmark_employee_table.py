@@ -0,0 +1,90 @@
+"""
+Бенчмарк колоночного хранилища EmployeeTable.
+
+Сравнивает полный пересчет фонда оплаты труда через объекты
+(calculate_salary() для каждого сотрудника) с векторизованным расчетом
+по колонкам EmployeeTable. Кэш итоговых зарплат на время прохода по
+объектам выключается, иначе повторные запуски измеряли бы чтение
+сохраненных значений, а не расчет.
+
+Запуск:
+    python examples/benchmark_employee_table.py --employees 1000000
+"""
+
+import argparse
+import math
+import time
+
+from benchmark_utils import build_company
+from src.core.employee_table import EmployeeTable, np
+from src.utils.salary_cache import set_salary_caching, is_salary_caching_enabled
+
+
+def timed(func, repeat: int = 3):
+    """Возвращает результат и лучшее время из нескольких запусков."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def object_pass(company):
+    """Полный пересчет через объекты сотрудников (без кэша зарплат)."""
+    caching = is_salary_caching_enabled()
+    set_salary_caching(False)
+    try:
+        return _object_totals(company)
+    finally:
+        set_salary_caching(caching)
+
+
+def _object_totals(company):
+    total = 0.0
+    by_department = {}
+    for dept in company.get_departments():
+        dept_total = sum(emp.calculate_salary() for emp in dept)
+        by_department[dept.name] = dept_total
+        total += dept_total
+    by_project = {proj.project_id: sum(emp.calculate_salary() for emp in proj.get_team())
+                  for proj in company.get_projects()}
+    return total, by_department, by_project
+
+
+def table_pass(table):
+    """Векторизованный расчет по колонкам."""
+    return table.total_payroll(), table.payroll_by_department(), table.payroll_by_project()
+
+
+def table_pass_cold(table):
+    """Векторизованный расчет с пересчетом колонки зарплат."""
+    table._EmployeeTable__salaries = None
+    return table_pass(table)
+
+
+def main():
+    """Основная функция бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    print(f"Создание компании из {args.employees} сотрудников...")
+    company = build_company(args.employees)
+    
+    (expected, _, _), object_time = timed(lambda: object_pass(company))
+    print(f"Объекты:           {object_time:8.3f} с")
+    
+    backends = [False] + ([True] if np is not None else [])
+    for use_numpy in backends:
+        start = time.perf_counter()
+        table = EmployeeTable.from_company(company, use_numpy=use_numpy)
+        build_time = time.perf_counter() - start
+        (total, _, _), table_time = timed(lambda: table_pass_cold(table))
+        assert math.isclose(total, expected, rel_tol=1e-9)
+        print(f"EmployeeTable/{table.backend:<5} {table_time:8.3f} с  "
+              f"(x{object_time / table_time:.1f}, построение таблицы {build_time:.2f} с)")
+
+
+if __name__ == "__main__":
+    main()
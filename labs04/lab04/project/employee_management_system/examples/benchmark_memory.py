@@ -0,0 +1,113 @@
+"""
+Бенчмарк памяти: сколько байт занимает один сотрудник.
+
+Сравнивает текущую иерархию сотрудников с замороженной копией иерархии
+до перевода на __slots__ (атрибуты в __dict__ экземпляра, собственный
+список слушателей и собственная копия стека технологий у каждого объекта).
+Копия содержит только конструкторы: расположение данных в памяти
+совпадает с прежними классами, а поведение для замера не нужно.
+
+Запуск:
+    python examples/benchmark_memory.py --employees 200000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmark_utils import TECH_STACKS
+from src.core.employee import Employee
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+
+
+# Иерархия до перевода на __slots__ (порядок присваивания атрибутов сохранен)
+
+class LegacyEmployee:
+    """Сотрудник до перевода на __slots__."""
+
+    def __init__(self, employee_id: int, name: str, department: str, base_salary: float):
+        self.__id = employee_id
+        self.__name = name
+        self.__department = department
+        self.__base_salary = base_salary
+        self.__salary_listeners: list = []
+
+
+class LegacyManager(LegacyEmployee):
+    """Менеджер до перевода на __slots__."""
+
+    def __init__(self, employee_id: int, name: str, department: str,
+                 base_salary: float, bonus: float):
+        super().__init__(employee_id, name, department, base_salary)
+        self.__bonus = float(bonus)
+
+
+class LegacyDeveloper(LegacyEmployee):
+    """Разработчик до перевода на __slots__: у каждого своя копия стека."""
+
+    def __init__(self, employee_id: int, name: str, department: str,
+                 base_salary: float, tech_stack: list[str], seniority_level: str):
+        super().__init__(employee_id, name, department, base_salary)
+        self.__tech_stack = tech_stack.copy()
+        self.__seniority_level = seniority_level.lower()
+
+
+class LegacySalesperson(LegacyEmployee):
+    """Продавец до перевода на __slots__."""
+
+    def __init__(self, employee_id: int, name: str, department: str,
+                 base_salary: float, commission_rate: float, sales_volume: float):
+        super().__init__(employee_id, name, department, base_salary)
+        self.__commission_rate = float(commission_rate)
+        self.__sales_volume = float(sales_volume)
+
+
+LEGACY_CLASSES = (LegacyEmployee, LegacyManager, LegacyDeveloper, LegacySalesperson)
+CURRENT_CLASSES = (Employee, Manager, Developer, Salesperson)
+
+
+def bytes_per_employee(classes: tuple, count: int) -> float:
+    """Измеряет прирост памяти на одного сотрудника для набора классов."""
+    employee_cls, manager_cls, developer_cls, salesperson_cls = classes
+
+    def make(i: int, name: str):
+        kind = i % 4
+        if kind == 0:
+            return manager_cls(i + 1, name, "Отдел", 50000.0, 5000.0)
+        if kind == 1:
+            return developer_cls(i + 1, name, "Отдел", 50000.0,
+                                 list(TECH_STACKS[i % len(TECH_STACKS)]), "middle")
+        if kind == 2:
+            return salesperson_cls(i + 1, name, "Отдел", 50000.0, 0.1, 100000.0)
+        return employee_cls(i + 1, name, "Отдел", 50000.0)
+
+    names = [f"Сотрудник {i}" for i in range(count)]
+    objects = []
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(count):
+        objects.append(make(i, names[i]))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Вычитаем указатели в самом списке objects
+    return (after - before) / count - 8
+
+
+def main():
+    """Основная функция бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    args = parser.parse_args()
+
+    before = bytes_per_employee(LEGACY_CLASSES, args.employees)
+    after = bytes_per_employee(CURRENT_CLASSES, args.employees)
+    print(f"До (__dict__):      {before:8.1f} байт на сотрудника")
+    print(f"После (__slots__):  {after:8.1f} байт на сотрудника")
+    print(f"Экономия: {(1 - after / before) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
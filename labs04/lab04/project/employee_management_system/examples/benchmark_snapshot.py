@@ -0,0 +1,56 @@
+"""
+Бенчмарк бинарного снимка компании в сравнении с JSON.
+
+Сравнивает размер файла, время сохранения и время загрузки.
+
+Запуск:
+    python examples/benchmark_snapshot.py --employees 200000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmark_utils import build_company
+from src.core.company import Company
+
+
+def timed(func):
+    """Возвращает результат функции и время ее выполнения."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Основная функция бенчмарка."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--projects", type=int, default=1000)
+    args = parser.parse_args()
+    
+    print(f"Создание компании из {args.employees} сотрудников...")
+    company = build_company(args.employees, project_count=args.projects)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "company.json")
+        snapshot_path = os.path.join(tmp, "company.snap")
+        
+        _, json_save = timed(lambda: company.save_to_json(json_path))
+        _, json_load = timed(lambda: Company.load_from_json(json_path))
+        _, snap_save = timed(lambda: company.save_to_snapshot(snapshot_path))
+        loaded, snap_load = timed(lambda: Company.load_from_snapshot(snapshot_path))
+        assert len(loaded.get_all_employees()) == args.employees
+        
+        json_size = os.path.getsize(json_path)
+        snap_size = os.path.getsize(snapshot_path)
+        print(f"{'Формат':<10} {'Размер, МБ':>12} {'Сохранение, с':>15} {'Загрузка, с':>13}")
+        print(f"{'JSON':<10} {json_size / 2**20:>12.1f} {json_save:>15.2f} {json_load:>13.2f}")
+        print(f"{'Снимок':<10} {snap_size / 2**20:>12.1f} {snap_save:>15.2f} {snap_load:>13.2f}")
+        print(f"Размер меньше в {json_size / snap_size:.1f} раза, "
+              f"загрузка быстрее в {json_load / snap_load:.1f} раза")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Вспомогательные функции для бенчмарков: генерация синтетической компании.
+"""
+
+import os
+import random
+import sys
+
+# Добавляем путь к корню проекта для импорта
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.project import Project
+from src.core.employee import Employee
+from src.employees.manager import Manager
+from src.employees.developer import Developer
+from src.employees.salesperson import Salesperson
+
+
+TECH_STACKS = [
+    ["Python", "SQL"],
+    ["Java", "Spring"],
+    ["JavaScript", "React", "Node.js"],
+    ["Go", "Docker", "Kubernetes"],
+]
+
+
+def build_company(employee_count: int, department_count: int = 10,
+                  project_count: int = 100, team_size: int = 20,
+                  seed: int = 42) -> Company:
+    """
+    Создает компанию с заданным числом сотрудников всех типов.
+    
+    Args:
+        employee_count: Количество сотрудников
+        department_count: Количество отделов
+        project_count: Количество проектов
+        team_size: Размер команды каждого проекта
+        seed: Зерно генератора случайных чисел
+    
+    Returns:
+        Заполненная компания
+    """
+    rng = random.Random(seed)
+    company = Company("BenchmarkCorp")
+    departments = [Department(f"Отдел {i}") for i in range(department_count)]
+    for dept in departments:
+        company.add_department(dept)
+    
+    for emp_id in range(1, employee_count + 1):
+        dept = departments[emp_id % department_count]
+        salary = float(rng.randint(30000, 150000))
+        kind = emp_id % 4
+        if kind == 0:
+            emp = Manager(emp_id, f"Менеджер {emp_id}", dept.name, salary,
+                          float(rng.randint(0, 20000)))
+        elif kind == 1:
+            emp = Developer(emp_id, f"Разработчик {emp_id}", dept.name, salary,
+                            rng.choice(TECH_STACKS),
+                            rng.choice(["junior", "middle", "senior"]))
+        elif kind == 2:
+            emp = Salesperson(emp_id, f"Продавец {emp_id}", dept.name, salary,
+                              rng.choice([0.05, 0.1, 0.15]),
+                              float(rng.randint(0, 500000)))
+        else:
+            emp = Employee(emp_id, f"Сотрудник {emp_id}", dept.name, salary)
+        dept.add_employee(emp)
+    
+    for project_id in range(1, project_count + 1):
+        project = Project(project_id, f"Проект {project_id}", "Синтетический проект",
+                          "2030-12-31", "active")
+        company.add_project(project)
+        for _ in range(min(team_size, employee_count)):
+            emp = company.find_employee_by_id(rng.randint(1, employee_count))
+            project.add_team_member(emp)
+    
+    return company
@@ -5,12 +5,18 @@ from .employee import Employee
 from .department import Department
 from .company import Company
 from .project import Project
+from .employee_table import EmployeeTable
+from .snapshot import CompanySnapshot
+from .mapped_company import MappedCompany
 
 __all__ = [
     'AbstractEmployee',
     'Employee',
     'Department',
     'Company',
-    'Project'
+    'Project',
+    'EmployeeTable',
+    'CompanySnapshot',
+    'MappedCompany'
 ]
 
@@ -4,6 +4,8 @@
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
+from ..utils.salary_cache import record_invalidation
 
 
 class AbstractEmployee(ABC):
@@ -12,8 +14,20 @@ class AbstractEmployee(ABC):
     
     Определяет общий интерфейс и общие атрибуты для всех сотрудников.
     Содержит абстрактные методы, которые должны быть реализованы в дочерних классах.
+    
+    Иерархия сотрудников использует __slots__: у экземпляров нет __dict__,
+    что существенно сокращает память при миллионах загруженных записей.
+    Дочерние классы также должны объявлять __slots__.
+    
+    Итоговая зарплата кэшируется в _salary_cache (см. utils.salary_cache):
+    реализации calculate_salary оборачиваются декоратором cached_salary,
+    а сеттеры полей, влияющих на зарплату, сбрасывают значение через
+    _notify_salary_change.
     """
     
+    __slots__ = ('__id', '__name', '__department', '__base_salary', '__salary_listeners',
+                 '_salary_cache')
+    
     def __init__(self, employee_id: int, name: str, department: str, base_salary: float):
         """
         Конструктор абстрактного класса AbstractEmployee.
@@ -24,10 +38,13 @@ class AbstractEmployee(ABC):
             department: Отдел, в котором работает сотрудник
             base_salary: Базовая зарплата
         """
+        self._salary_cache: Optional[float] = None
         self.__id = employee_id
         self.__name = name
         self.__department = department
         self.__base_salary = base_salary
+        # Кортеж вместо списка: пустой кортеж не занимает отдельной памяти
+        self.__salary_listeners: tuple = ()
     
     @property
     def id(self) -> int:
@@ -83,7 +100,59 @@ class AbstractEmployee(ABC):
             raise ValueError("Зарплата должна быть числом")
         if value <= 0:
             raise ValueError("Зарплата должна быть положительным числом")
+        old_salary = self._salary_snapshot()
         self.__base_salary = float(value)
+        self._notify_salary_change(old_salary)
+    
+    # Уведомления об изменении итоговой зарплаты
+    
+    def add_salary_listener(self, listener) -> None:
+        """
+        Подписывает объект на изменения итоговой зарплаты сотрудника.
+        
+        Слушатель должен реализовывать метод on_salary_changed(employee, delta).
+        Используется отделами и проектами для поддержки агрегатов по зарплате.
+        """
+        self.__salary_listeners += (listener,)
+    
+    def remove_salary_listener(self, listener) -> None:
+        """Отписывает объект от изменений итоговой зарплаты сотрудника."""
+        listeners = list(self.__salary_listeners)
+        if listener in listeners:
+            listeners.remove(listener)
+            self.__salary_listeners = tuple(listeners)
+    
+    def _salary_snapshot(self) -> Optional[float]:
+        """
+        Запоминает итоговую зарплату перед изменением влияющего на нее поля.
+        
+        Returns:
+            Текущая итоговая зарплата или None, если подписчиков нет
+        """
+        if not self.__salary_listeners:
+            return None
+        return self.calculate_salary()
+    
+    def _invalidate_salary(self) -> None:
+        """Сбрасывает сохраненную итоговую зарплату."""
+        if self._salary_cache is not None:
+            self._salary_cache = None
+            record_invalidation()
+    
+    def _notify_salary_change(self, old_salary: Optional[float]) -> None:
+        """
+        Сбрасывает сохраненную зарплату и уведомляет подписчиков об изменении.
+        
+        Args:
+            old_salary: Результат _salary_snapshot() до изменения
+        """
+        self._invalidate_salary()
+        if old_salary is None:
+            return
+        delta = self.calculate_salary() - old_salary
+        if delta:
+            for listener in self.__salary_listeners:
+                listener.on_salary_changed(self, delta)
     
     @abstractmethod
     def calculate_salary(self) -> float:
@@ -105,6 +174,15 @@ class AbstractEmployee(ABC):
         """
         pass
     
+    def get_additional_info(self) -> str:
+        """
+        Возвращает сведения, специфичные для типа сотрудника (для отчетов).
+        
+        Returns:
+            Строка с дополнительной информацией (пустая для базового сотрудника)
+        """
+        return ""
+    
     def __str__(self) -> str:
         """
         Возвращает базовое строковое представление объекта.
@@ -6,17 +6,31 @@
 
 import json
 import csv
-from typing import Optional
+import os
+import heapq
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union
 from datetime import datetime
 from .department import Department
 from .project import Project
 from .abstract_employee import AbstractEmployee
+from .snapshot import CompanySnapshot
 from ..utils.exceptions import (
     DepartmentNotFoundError, 
     ProjectNotFoundError, 
     EmployeeNotFoundError,
     DuplicateIdError
 )
+from ..utils.aggregates import is_verification_enabled, check_aggregate
+from ..utils.json_stream import JsonStreamReader
+from ..utils.query import Query
+from ..utils.streaming_stats import StreamingStats
+from ..utils.rank_index import RankIndex
+
+
+def _salary_sort_key(employee: AbstractEmployee) -> tuple[float, int]:
+    """Ключ упорядочивания по зарплате; при равных зарплатах - по ID."""
+    return employee.calculate_salary(), employee.id
 
 
 class Company:
@@ -26,6 +40,9 @@ class Company:
     Использует агрегацию - содержит отделы и проекты, которые могут существовать независимо.
     """
     
+    # Сотрудник считается перегруженным при участии в стольких проектах и более
+    MAX_PROJECTS_PER_EMPLOYEE = 3
+    
     def __init__(self, name: str):
         """
         Конструктор класса Company.
@@ -35,9 +52,17 @@ class Company:
         """
         self.__name = name
         self.__departments: list[Department] = []
-        self.__projects: list[Project] = []
-        self.__employee_ids: set[int] = set()  # Для проверки уникальности ID
-        self.__project_ids: set[int] = set()   # Для проверки уникальности ID проектов
+        # Индексы для поиска за O(1); поддерживаются при любых изменениях состава
+        self.__departments_by_name: dict[str, Department] = {}
+        self.__projects: dict[int, Project] = {}
+        self.__employees_by_id: dict[int, AbstractEmployee] = {}
+        # Обратный индекс участия: ID сотрудника -> множество ID проектов
+        self.__employee_projects: dict[int, set[int]] = {}
+        # Инкрементально поддерживаемые агрегаты по всей компании
+        self.__total_salary = 0.0
+        self.__type_counts: dict[str, int] = {}
+        # Необязательный индекс порядковых статистик по зарплате (ID -> зарплата)
+        self.__salary_index: Optional[RankIndex] = None
     
     @property
     def name(self) -> str:
@@ -46,31 +71,95 @@ class Company:
     
     def _check_employee_id_unique(self, employee_id: int) -> None:
         """Проверяет уникальность ID сотрудника."""
-        if employee_id in self.__employee_ids:
+        if employee_id in self.__employees_by_id:
             raise DuplicateIdError(f"Сотрудник с ID {employee_id} уже существует")
-        self.__employee_ids.add(employee_id)
     
     def _check_project_id_unique(self, project_id: int) -> None:
         """Проверяет уникальность ID проекта."""
-        if project_id in self.__project_ids:
+        if project_id in self.__projects:
             raise DuplicateIdError(f"Проект с ID {project_id} уже существует")
-        self.__project_ids.add(project_id)
+    
+    def on_employee_added(self, department: Department, employee: AbstractEmployee) -> None:
+        """
+        Обработчик добавления сотрудника в один из отделов компании.
+        
+        Raises:
+            DuplicateIdError: Если сотрудник с таким ID уже есть в компании
+        """
+        self._check_employee_id_unique(employee.id)
+        self._index_employee(employee)
+    
+    def on_employee_removed(self, department: Department, employee: AbstractEmployee) -> None:
+        """Обработчик удаления сотрудника из одного из отделов компании."""
+        if self.__employees_by_id.get(employee.id) is employee:
+            del self.__employees_by_id[employee.id]
+            if self.__salary_index is not None:
+                self.__salary_index.discard(employee.id)
+            if self.__employees_by_id:
+                self.__total_salary -= employee.calculate_salary()
+            else:
+                self.__total_salary = 0.0
+            emp_type = employee.__class__.__name__
+            self.__type_counts[emp_type] -= 1
+            if not self.__type_counts[emp_type]:
+                del self.__type_counts[emp_type]
+    
+    def on_employee_salary_changed(self, department: Department,
+                                   employee: AbstractEmployee, delta: float) -> None:
+        """Обработчик изменения зарплаты сотрудника одного из отделов компании."""
+        self.__total_salary += delta
+        if self.__salary_index is not None:
+            self.__salary_index.update(employee.id, employee.calculate_salary())
+    
+    def _index_employee(self, employee: AbstractEmployee) -> None:
+        """Добавляет сотрудника в индексы и агрегаты компании."""
+        self.__employees_by_id[employee.id] = employee
+        salary = employee.calculate_salary()
+        self.__total_salary += salary
+        if self.__salary_index is not None:
+            self.__salary_index.update(employee.id, salary)
+        emp_type = employee.__class__.__name__
+        self.__type_counts[emp_type] = self.__type_counts.get(emp_type, 0) + 1
+    
+    def on_team_member_added(self, project: Project, employee: AbstractEmployee) -> None:
+        """Обработчик добавления сотрудника в команду проекта компании."""
+        self.__employee_projects.setdefault(employee.id, set()).add(project.project_id)
+    
+    def on_team_member_removed(self, project: Project, employee: AbstractEmployee) -> None:
+        """Обработчик удаления сотрудника из команды проекта компании."""
+        project_ids = self.__employee_projects.get(employee.id)
+        if project_ids is not None:
+            project_ids.discard(project.project_id)
+            if not project_ids:
+                del self.__employee_projects[employee.id]
     
     def add_department(self, department: Department) -> None:
         """Добавляет отдел в компанию."""
         if department not in self.__departments:
-            self.__departments.append(department)
-            # Проверяем уникальность ID всех сотрудников отдела
-            for emp in department.get_employees():
+            # Проверяем уникальность ID всех сотрудников отдела до изменения состояния
+            employees = department.get_employees()
+            for emp in employees:
                 self._check_employee_id_unique(emp.id)
+            for emp in employees:
+                self._index_employee(emp)
+            self.__departments.append(department)
+            self.__departments_by_name.setdefault(department.name, department)
+            department.add_listener(self)
     
     def remove_department(self, department_name: str) -> None:
         """Удаляет отдел из компании."""
         dept = self.find_department(department_name)
-        if dept:
+        if dept is not None:
             if len(dept) > 0:
                 raise ValueError(f"Нельзя удалить отдел '{department_name}': в нем есть сотрудники")
             self.__departments.remove(dept)
+            dept.remove_listener(self)
+            del self.__departments_by_name[department_name]
+            # Если остался другой отдел с тем же названием, индексируем его
+            for other in self.__departments:
+                if other.name == department_name:
+                    self.__departments_by_name[department_name] = other
+                    break
         else:
             raise DepartmentNotFoundError(f"Отдел '{department_name}' не найден")
     
@@ -80,9 +169,12 @@ class Company:
     
     def add_project(self, project: Project) -> None:
         """Добавляет проект в компанию."""
-        if project not in self.__projects:
+        if self.__projects.get(project.project_id) is not project:
             self._check_project_id_unique(project.project_id)
-            self.__projects.append(project)
+            self.__projects[project.project_id] = project
+            for emp in project.get_team():
+                self.on_team_member_added(project, emp)
+            project.add_listener(self)
     
     def remove_project(self, project_id: int) -> None:
         """Удаляет проект из компании."""
@@ -90,51 +182,95 @@ class Company:
         if project:
             if project.get_team_size() > 0:
                 raise ValueError(f"Нельзя удалить проект '{project.name}': над ним работает команда")
-            self.__projects.remove(project)
-            self.__project_ids.discard(project_id)
+            del self.__projects[project_id]
+            project.remove_listener(self)
         else:
             raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
     
     def get_projects(self) -> list[Project]:
         """Возвращает список проектов."""
-        return self.__projects.copy()
+        return list(self.__projects.values())
     
     def get_all_employees(self) -> list[AbstractEmployee]:
         """Возвращает всех сотрудников компании."""
-        employees = []
+        return list(self.iter_employees())
+    
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        """Лениво обходит всех сотрудников компании по отделам без копирования."""
         for dept in self.__departments:
-            employees.extend(dept.get_employees())
-        return employees
+            yield from dept
+    
+    def query(self) -> Query:
+        """
+        Создает ленивый запрос по сотрудникам компании.
+        
+        Запрос выполняется поверх iter_employees без копирования списка
+        сотрудников и может выполняться повторно.
+        
+        Returns:
+            Объект Query
+        """
+        return Query(self.iter_employees)
     
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
-        """Находит сотрудника по ID во всех отделах."""
-        for dept in self.__departments:
-            emp = dept.find_employee_by_id(employee_id)
-            if emp:
-                return emp
-        return None
+        """Находит сотрудника по ID во всех отделах (O(1) по индексу)."""
+        return self.__employees_by_id.get(employee_id)
     
     def find_department(self, name: str) -> Optional[Department]:
-        """Находит отдел по названию."""
-        for dept in self.__departments:
-            if dept.name == name:
-                return dept
-        return None
+        """Находит отдел по названию (O(1) по индексу)."""
+        return self.__departments_by_name.get(name)
     
     def find_project(self, project_id: int) -> Optional[Project]:
-        """Находит проект по ID."""
-        for project in self.__projects:
-            if project.project_id == project_id:
-                return project
-        return None
+        """Находит проект по ID (O(1) по индексу)."""
+        return self.__projects.get(project_id)
+    
+    def get_employee_projects(self, employee_id: int) -> list[Project]:
+        """Возвращает проекты, в которых участвует сотрудник."""
+        return [self.__projects[pid] for pid in self.__employee_projects.get(employee_id, ())]
+    
+    def get_employee_project_count(self, employee_id: int) -> int:
+        """Возвращает количество проектов сотрудника за O(1)."""
+        return len(self.__employee_projects.get(employee_id, ()))
     
     def calculate_total_monthly_cost(self) -> float:
-        """Рассчитывает общие месячные затраты на зарплаты."""
-        return sum(dept.calculate_total_salary() for dept in self.__departments)
+        """Возвращает общие месячные затраты на зарплаты (O(1))."""
+        if is_verification_enabled():
+            self.verify_aggregates()
+        return self.__total_salary
+    
+    def get_employee_type_counts(self) -> dict[str, int]:
+        """Возвращает количество сотрудников каждого типа по всей компании."""
+        if is_verification_enabled():
+            self.verify_aggregates()
+        return dict(self.__type_counts)
+    
+    def verify_aggregates(self) -> None:
+        """
+        Сверяет все агрегаты компании, ее отделов и проектов с полным пересчетом.
+        
+        Raises:
+            AggregateMismatchError: Если хотя бы один агрегат расходится
+        """
+        total = 0.0
+        counts = {}
+        for dept in self.__departments:
+            dept.verify_aggregates()
+            for emp in dept:
+                total += emp.calculate_salary()
+                emp_type = emp.__class__.__name__
+                counts[emp_type] = counts.get(emp_type, 0) + 1
+        for proj in self.__projects.values():
+            proj.verify_aggregates()
+        check_aggregate(f"Затраты компании '{self.__name}'", self.__total_salary, total)
+        check_aggregate(f"Типы сотрудников компании '{self.__name}'", self.__type_counts, counts)
+        if self.__salary_index is not None:
+            check_aggregate(f"Индекс зарплат компании '{self.__name}'",
+                            self.__salary_index.to_dict(),
+                            {emp.id: emp.calculate_salary() for emp in self.iter_employees()})
     
     def get_projects_by_status(self, status: str) -> list[Project]:
         """Фильтрует проекты по статусу."""
-        return [p for p in self.__projects if p.status == status]
+        return [p for p in self.__projects.values() if p.status == status]
     
     def transfer_employee_between_departments(self, employee_id: int, 
                                              from_dept_name: str, 
@@ -154,9 +290,9 @@ class Company:
         from_dept = self.find_department(from_dept_name)
         to_dept = self.find_department(to_dept_name)
         
-        if not from_dept:
+        if from_dept is None:
             raise DepartmentNotFoundError(f"Отдел '{from_dept_name}' не найден")
-        if not to_dept:
+        if to_dept is None:
             raise DepartmentNotFoundError(f"Отдел '{to_dept_name}' не найден")
         
         employee = from_dept.find_employee_by_id(employee_id)
@@ -186,7 +322,7 @@ class Company:
         if not project:
             raise ProjectNotFoundError(f"Проект с ID {project_id} не найден")
         
-        if employee not in project.get_team():
+        if not project.has_team_member(employee_id):
             project.add_team_member(employee)
             return True
         return False
@@ -205,8 +341,7 @@ class Company:
         if not employee:
             raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден")
         
-        project_count = sum(1 for proj in self.__projects if employee in proj.get_team())
-        return project_count < 3
+        return self.get_employee_project_count(employee_id) < self.MAX_PROJECTS_PER_EMPLOYEE
     
     def find_overloaded_employees(self) -> list[AbstractEmployee]:
         """
@@ -216,13 +351,11 @@ class Company:
             Список перегруженных сотрудников
         """
         overloaded = []
-        all_employees = self.get_all_employees()
-        
-        for emp in all_employees:
-            project_count = sum(1 for proj in self.__projects if emp in proj.get_team())
-            if project_count >= 3:
-                overloaded.append(emp)
-        
+        for emp_id, project_ids in self.__employee_projects.items():
+            if len(project_ids) >= self.MAX_PROJECTS_PER_EMPLOYEE:
+                emp = self.__employees_by_id.get(emp_id)
+                if emp is not None:
+                    overloaded.append(emp)
         return overloaded
     
     def get_department_stats(self) -> dict:
@@ -234,15 +367,137 @@ class Company:
         """
         stats = {}
         for dept in self.__departments:
-            employees = dept.get_employees()
+            employee_count = len(dept)
+            total_salary = dept.calculate_total_salary()
             stats[dept.name] = {
-                "employee_count": len(employees),
-                "total_salary": dept.calculate_total_salary(),
-                "average_salary": dept.calculate_total_salary() / len(employees) if employees else 0,
+                "employee_count": employee_count,
+                "total_salary": total_salary,
+                "average_salary": total_salary / employee_count if employee_count else 0,
                 "employee_types": dept.get_employee_count()
             }
         return stats
     
+    def get_salary_statistics(self, thresholds: tuple = (50000, 100000, 150000)) -> dict:
+        """
+        Возвращает распределение зарплат по отделам и по компании.
+        
+        Каждый отдел обходится один раз; статистика компании получается
+        объединением статистик отделов без повторного прохода.
+        
+        Args:
+            thresholds: Границы зарплатных диапазонов
+        
+        Returns:
+            Словарь {"departments": {отдел: сводка}, "company": сводка}
+            (сводка - результат StreamingStats.summary)
+        """
+        departments = {
+            dept.name: StreamingStats(thresholds).update(emp.calculate_salary() for emp in dept)
+            for dept in self.__departments
+        }
+        company = StreamingStats(thresholds)
+        for stats in departments.values():
+            company.merge(stats)
+        return {
+            "departments": {name: stats.summary() for name, stats in departments.items()},
+            "company": company.summary()
+        }
+    
+    # Упорядочивание сотрудников по зарплате
+    
+    def enable_salary_index(self) -> None:
+        """
+        Включает поддерживаемый индекс зарплат (RankIndex).
+        
+        Индекс строится за O(n log n) и далее обновляется при найме, увольнении
+        и изменении зарплат; salary_rank и salary_percentile работают за
+        O(log n), top_earners и bottom_earners - за O(log n + n_результата).
+        """
+        self.__salary_index = RankIndex((emp.id, emp.calculate_salary())
+                                        for emp in self.iter_employees())
+    
+    def disable_salary_index(self) -> None:
+        """Выключает индекс зарплат и освобождает занятую им память."""
+        self.__salary_index = None
+    
+    @property
+    def salary_index_enabled(self) -> bool:
+        """True, если индекс зарплат поддерживается."""
+        return self.__salary_index is not None
+    
+    def _employees_from_index(self, pairs: Iterable[tuple]) -> list[AbstractEmployee]:
+        return [self.__employees_by_id[emp_id] for _, emp_id in pairs]
+    
+    def sorted_by_salary(self, descending: bool = False) -> list[AbstractEmployee]:
+        """
+        Возвращает сотрудников, упорядоченных по итоговой зарплате.
+        
+        В отличие от sorted(employees), где сравнение через __lt__ вызывает
+        calculate_salary() дважды на каждое сравнение, ключ вычисляется
+        один раз для каждого сотрудника (decorate-sort-undecorate).
+        
+        Args:
+            descending: True - по убыванию зарплаты
+        
+        Returns:
+            Список сотрудников; при равных зарплатах порядок определяется ID
+        """
+        if self.__salary_index is not None:
+            return self._employees_from_index(self.__salary_index.items(reverse=descending))
+        return sorted(self.iter_employees(), key=_salary_sort_key, reverse=descending)
+    
+    def top_earners(self, n: int) -> list[AbstractEmployee]:
+        """
+        Возвращает n сотрудников с наибольшей зарплатой (по убыванию).
+        
+        Без индекса используется куча размера n: O(total log n), одно
+        вычисление зарплаты на сотрудника.
+        """
+        if self.__salary_index is not None:
+            return self._employees_from_index(islice(self.__salary_index.items(reverse=True), n))
+        return heapq.nlargest(n, self.iter_employees(), key=_salary_sort_key)
+    
+    def bottom_earners(self, n: int) -> list[AbstractEmployee]:
+        """Возвращает n сотрудников с наименьшей зарплатой (по возрастанию)."""
+        if self.__salary_index is not None:
+            return self._employees_from_index(islice(self.__salary_index.items(), n))
+        return heapq.nsmallest(n, self.iter_employees(), key=_salary_sort_key)
+    
+    def _employee_salary(self, employee_id: int) -> float:
+        """Возвращает итоговую зарплату сотрудника компании."""
+        employee = self.__employees_by_id.get(employee_id)
+        if employee is None:
+            raise EmployeeNotFoundError(f"Сотрудник с ID {employee_id} не найден")
+        return employee.calculate_salary()
+    
+    def salary_rank(self, employee_id: int) -> int:
+        """
+        Возвращает место сотрудника по зарплате в компании (1 - наибольшая).
+        
+        Сотрудники с равной зарплатой делят одно место. С индексом зарплат
+        запрос выполняется за O(log n), без него - за один проход.
+        
+        Raises:
+            EmployeeNotFoundError: Если сотрудник не найден
+        """
+        salary = self._employee_salary(employee_id)
+        if self.__salary_index is not None:
+            return self.__salary_index.rank(salary)
+        return 1 + sum(1 for emp in self.iter_employees() if emp.calculate_salary() > salary)
+    
+    def salary_percentile(self, employee_id: int) -> float:
+        """
+        Возвращает долю сотрудников (в процентах), чья зарплата не выше зарплаты данного.
+        
+        Raises:
+            EmployeeNotFoundError: Если сотрудник не найден
+        """
+        salary = self._employee_salary(employee_id)
+        if self.__salary_index is not None:
+            return self.__salary_index.percentile(salary)
+        not_above = sum(1 for emp in self.iter_employees() if emp.calculate_salary() <= salary)
+        return 100.0 * not_above / len(self.__employees_by_id)
+    
     def get_project_budget_analysis(self) -> dict:
         """
         Анализирует бюджеты проектов.
@@ -252,17 +507,18 @@ class Company:
         """
         analysis = {
             "total_projects": len(self.__projects),
-            "total_budget": sum(proj.calculate_total_salary() for proj in self.__projects),
+            "total_budget": 0,
             "by_status": {},
             "average_team_size": 0,
             "projects": []
         }
         
         total_team_size = 0
-        for proj in self.__projects:
+        for proj in self.__projects.values():
             team_size = proj.get_team_size()
             total_team_size += team_size
             budget = proj.calculate_total_salary()
+            analysis["total_budget"] += budget
             
             status = proj.status
             if status not in analysis["by_status"]:
@@ -281,69 +537,105 @@ class Company:
         analysis["average_team_size"] = total_team_size / len(self.__projects) if self.__projects else 0
         return analysis
     
-    def export_employees_csv(self, filename: str) -> None:
+    EMPLOYEE_CSV_HEADER = [
+        'ID', 'Имя', 'Отдел', 'Тип', 'Базовая зарплата',
+        'Итоговая зарплата', 'Дополнительная информация'
+    ]
+    PROJECT_CSV_HEADER = [
+        'ID проекта', 'Название', 'Описание', 'Статус',
+        'Срок', 'Размер команды', 'Бюджет', 'Состав команды'
+    ]
+    
+    def iter_employee_rows(self) -> Iterator[list]:
+        """Генерирует строки CSV-отчета по сотрудникам без промежуточного списка."""
+        for emp in self.iter_employees():
+            yield [
+                emp.id,
+                emp.name,
+                emp.department,
+                emp.__class__.__name__,
+                emp.base_salary,
+                emp.calculate_salary(),
+                emp.get_additional_info()
+            ]
+    
+    def iter_project_rows(self) -> Iterator[list]:
+        """Генерирует строки CSV-отчета по проектам."""
+        for proj in self.__projects.values():
+            yield [
+                proj.project_id,
+                proj.name,
+                proj.description,
+                proj.status,
+                proj.deadline.strftime('%Y-%m-%d'),
+                proj.get_team_size(),
+                proj.calculate_total_salary(),
+                ', '.join(emp.name for emp in proj.get_team())
+            ]
+    
+    @staticmethod
+    def _write_csv(target: Union[str, os.PathLike, TextIO], header: list,
+                   rows: Iterable[list], batch_size: int) -> int:
         """
-        Экспортирует отчет по сотрудникам в CSV.
+        Записывает строки в CSV пачками фиксированного размера.
         
         Args:
-            filename: Имя файла для сохранения
+            target: Имя файла или открытый текстовый поток (stdout, gzip, pipe)
+            header: Заголовок таблицы
+            rows: Итерируемый источник строк
+            batch_size: Количество строк в одной пачке writerows
+        
+        Returns:
+            Количество записанных строк (без заголовка)
         """
-        employees = self.get_all_employees()
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'w', newline='', encoding='utf-8') as f:
+                return Company._write_csv(f, header, rows, batch_size)
+        
+        writer = csv.writer(target)
+        writer.writerow(header)
+        rows = iter(rows)
+        written = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return written
+            writer.writerows(batch)
+            written += len(batch)
+    
+    def export_employees_csv(self, target: Union[str, os.PathLike, TextIO],
+                             batch_size: int = 1000) -> int:
+        """
+        Экспортирует отчет по сотрудникам в CSV.
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'ID', 'Имя', 'Отдел', 'Тип', 'Базовая зарплата', 
-                'Итоговая зарплата', 'Дополнительная информация'
-            ])
-            
-            for emp in employees:
-                emp_type = emp.__class__.__name__
-                additional_info = ""
-                
-                if emp_type == "Manager":
-                    additional_info = f"Бонус: {emp.bonus}"
-                elif emp_type == "Developer":
-                    additional_info = f"Уровень: {emp.seniority_level}, Технологии: {', '.join(emp.tech_stack)}"
-                elif emp_type == "Salesperson":
-                    additional_info = f"Комиссия: {emp.commission_rate*100}%, Продажи: {emp.sales_volume}"
-                
-                writer.writerow([
-                    emp.id,
-                    emp.name,
-                    emp.department,
-                    emp_type,
-                    emp.base_salary,
-                    emp.calculate_salary(),
-                    additional_info
-                ])
-    
-    def export_projects_csv(self, filename: str) -> None:
+        Строки генерируются лениво и пишутся пачками, поэтому потребление
+        памяти не зависит от числа сотрудников.
+        
+        Args:
+            target: Имя файла или открытый текстовый поток
+                    (sys.stdout, gzip.open(..., 'wt'), канал и т.п.)
+            batch_size: Количество строк в одной пачке
+        
+        Returns:
+            Количество экспортированных сотрудников
+        """
+        return self._write_csv(target, self.EMPLOYEE_CSV_HEADER,
+                               self.iter_employee_rows(), batch_size)
+    
+    def export_projects_csv(self, target: Union[str, os.PathLike, TextIO],
+                            batch_size: int = 1000) -> int:
         """
         Экспортирует отчет по проектам в CSV.
         
         Args:
-            filename: Имя файла для сохранения
-        """
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'ID проекта', 'Название', 'Описание', 'Статус', 
-                'Срок', 'Размер команды', 'Бюджет', 'Состав команды'
-            ])
-            
-            for proj in self.__projects:
-                team_members = ', '.join([emp.name for emp in proj.get_team()])
-                writer.writerow([
-                    proj.project_id,
-                    proj.name,
-                    proj.description,
-                    proj.status,
-                    proj.deadline.strftime('%Y-%m-%d'),
-                    proj.get_team_size(),
-                    proj.calculate_total_salary(),
-                    team_members
-                ])
+            target: Имя файла или открытый текстовый поток
+            batch_size: Количество строк в одной пачке
+        
+        Returns:
+            Количество экспортированных проектов
+        """
+        return self._write_csv(target, self.PROJECT_CSV_HEADER,
+                               self.iter_project_rows(), batch_size)
     
     def generate_financial_report(self) -> str:
         """
@@ -362,7 +654,7 @@ class Company:
         report.append(f"Общие месячные затраты: {self.calculate_total_monthly_cost():.2f}")
         report.append(f"Количество отделов: {len(self.__departments)}")
         report.append(f"Количество проектов: {len(self.__projects)}")
-        report.append(f"Общее количество сотрудников: {len(self.get_all_employees())}")
+        report.append(f"Общее количество сотрудников: {len(self.__employees_by_id)}")
         report.append("")
         
         # Статистика по отделам
@@ -395,7 +687,7 @@ class Company:
             report.append("ПЕРЕГРУЖЕННЫЕ СОТРУДНИКИ (участвуют в 3+ проектах):")
             report.append("-" * 80)
             for emp in overloaded:
-                project_count = sum(1 for proj in self.__projects if emp in proj.get_team())
+                project_count = self.get_employee_project_count(emp.id)
                 report.append(f"  {emp.name} (ID: {emp.id}): участвует в {project_count} проектах")
         report.append("")
         
@@ -413,52 +705,127 @@ class Company:
                 }
                 for dept in self.__departments
             ],
-            "projects": [proj.to_dict() for proj in self.__projects]
+            "projects": [proj.to_dict() for proj in self.__projects.values()]
         }
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
     
+    def save_to_snapshot(self, filename: str) -> None:
+        """
+        Сохраняет компанию в компактный бинарный снимок.
+        
+        Формат описан в модуле snapshot: таблица строк, записи сотрудников
+        фиксированной длины и составы проектов в виде списков ID.
+        """
+        CompanySnapshot.save(self, filename)
+    
     @classmethod
-    def load_from_json(cls, filename: str) -> 'Company':
-        """Загружает компанию из JSON файла."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load_from_snapshot(cls, filename: str) -> 'Company':
+        """Загружает компанию из бинарного снимка."""
+        return CompanySnapshot.load(filename)
+    
+    @classmethod
+    def load_from_json(cls, filename: str,
+                       progress: Optional[Callable[[int, int, int], None]] = None,
+                       progress_every: int = 10000) -> 'Company':
+        """
+        Загружает компанию из JSON файла в потоковом режиме.
         
-        company = cls(data["name"])
+        Отделы, сотрудники и проекты разбираются поэлементно, поэтому
+        потребление памяти определяется размером самой компании, а не
+        размером файла. Команды проектов восстанавливаются по индексу ID.
         
+        Args:
+            filename: Имя JSON файла
+            progress: Необязательный обработчик прогресса
+                      progress(прочитано_байт, всего_байт, загружено_сотрудников)
+            progress_every: Как часто (в сотрудниках) вызывать progress
+        
+        Returns:
+            Загруженная компания
+        """
         # Импортируем классы
         from .employee import Employee
         from ..employees.manager import Manager
         from ..employees.developer import Developer
         from ..employees.salesperson import Salesperson
         
-        # Загружаем отделы
-        for dept_data in data["departments"]:
-            dept = Department(dept_data["name"])
-            for emp_data in dept_data["employees"]:
-                emp_type = emp_data.get("type", "Employee")
-                if emp_type == "Manager":
-                    emp = Manager.from_dict(emp_data)
-                elif emp_type == "Developer":
-                    emp = Developer.from_dict(emp_data)
-                elif emp_type == "Salesperson":
-                    emp = Salesperson.from_dict(emp_data)
+        employee_classes = {
+            "Manager": Manager,
+            "Developer": Developer,
+            "Salesperson": Salesperson
+        }
+        total_bytes = os.path.getsize(filename)
+        company = cls("")
+        loaded = 0
+        # Участники проектов, которые встретились раньше своих отделов
+        pending_team: list[tuple[Project, list[int]]] = []
+        
+        with open(filename, 'rb') as f:
+            reader = JsonStreamReader(f)
+            
+            def load_employees(add: Callable[[AbstractEmployee], None]) -> None:
+                nonlocal loaded
+                for _ in reader.iter_array():
+                    emp_data = reader.read_value()
+                    emp_class = employee_classes.get(emp_data.get("type"), Employee)
+                    add(emp_class.from_dict(emp_data))
+                    loaded += 1
+                    if progress and loaded % progress_every == 0:
+                        progress(reader.bytes_read, total_bytes, loaded)
+            
+            for key in reader.iter_object():
+                if key == "name":
+                    company.__name = reader.read_value()
+                elif key == "departments":
+                    # Загружаем отделы
+                    for _ in reader.iter_array():
+                        dept = None
+                        # Сотрудники, встретившиеся в файле раньше названия отдела
+                        orphans: list[AbstractEmployee] = []
+                        for dept_key in reader.iter_object():
+                            if dept_key == "name":
+                                dept = Department(reader.read_value())
+                                company.add_department(dept)
+                                for emp in orphans:
+                                    dept.add_employee(emp)
+                                orphans.clear()
+                            elif dept_key == "employees":
+                                load_employees(dept.add_employee if dept is not None
+                                               else orphans.append)
+                            else:
+                                reader.skip_value()
+                elif key == "projects":
+                    # Загружаем проекты; из состава команды сохраняются только ID
+                    for _ in reader.iter_array():
+                        proj_data = {}
+                        team_ids = []
+                        for proj_key in reader.iter_object():
+                            if proj_key == "team":
+                                for _ in reader.iter_array():
+                                    team_ids.append(reader.read_value()["id"])
+                            else:
+                                proj_data[proj_key] = reader.read_value()
+                        project = Project.from_dict(proj_data)
+                        missing = []
+                        for emp_id in team_ids:
+                            emp = company.find_employee_by_id(emp_id)
+                            if emp:
+                                project.add_team_member(emp)
+                            else:
+                                missing.append(emp_id)
+                        if missing:
+                            pending_team.append((project, missing))
+                        company.add_project(project)
                 else:
-                    emp = Employee.from_dict(emp_data)
-                dept.add_employee(emp)
-                company.__employee_ids.add(emp.id)
-            company.add_department(dept)
-        
-        # Загружаем проекты
-        for proj_data in data["projects"]:
-            project = Project.from_dict(proj_data)
-            company.__project_ids.add(project.project_id)
-            # Восстанавливаем команду
-            for emp_data in proj_data["team"]:
-                emp_id = emp_data["id"]
+                    reader.skip_value()
+        
+        for project, team_ids in pending_team:
+            for emp_id in team_ids:
                 emp = company.find_employee_by_id(emp_id)
                 if emp:
                     project.add_team_member(emp)
-            company.add_project(project)
         
+        if progress:
+            progress(total_bytes, total_bytes, loaded)
         return company
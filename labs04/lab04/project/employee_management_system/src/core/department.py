@@ -4,8 +4,11 @@
 """
 
 import json
+from itertools import islice
 from typing import Optional
 from .abstract_employee import AbstractEmployee
+from ..utils.aggregates import is_verification_enabled, check_aggregate
+from ..utils.exceptions import DuplicateIdError
 
 
 class Department:
@@ -24,60 +27,148 @@ class Department:
             name: Название отдела
         """
         self.__name = name
-        self.__employees: list[AbstractEmployee] = []
+        # Сотрудники хранятся по ID: словарь сохраняет порядок добавления
+        # и дает поиск/удаление за O(1)
+        self.__employees: dict[int, AbstractEmployee] = {}
+        self.__listeners: list = []
+        # Инкрементально поддерживаемые агрегаты
+        self.__total_salary = 0.0
+        self.__type_counts: dict[str, int] = {}
     
     @property
     def name(self) -> str:
         """Геттер для названия отдела."""
         return self.__name
     
+    def add_listener(self, listener) -> None:
+        """
+        Подписывает объект на изменения состава отдела.
+        
+        Слушатель должен реализовывать методы
+        on_employee_added(department, employee),
+        on_employee_removed(department, employee) и
+        on_employee_salary_changed(department, employee, delta).
+        Используется компанией для поддержки индексов в актуальном состоянии.
+        """
+        if listener not in self.__listeners:
+            self.__listeners.append(listener)
+    
+    def remove_listener(self, listener) -> None:
+        """Отписывает объект от изменений состава отдела."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+    
     def add_employee(self, employee: AbstractEmployee) -> None:
-        """Добавляет сотрудника в отдел."""
-        if employee not in self.__employees:
-            self.__employees.append(employee)
+        """
+        Добавляет сотрудника в отдел.
+        
+        Повторное добавление того же объекта ничего не делает. Слушатели
+        уведомляются до фактического добавления, поэтому исключение
+        в слушателе (например, DuplicateIdError) отменяет операцию.
+        
+        Raises:
+            DuplicateIdError: Если в отделе уже есть другой сотрудник с таким ID
+        """
+        existing = self.__employees.get(employee.id)
+        if existing is employee:
+            return
+        if existing is not None:
+            raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже есть в отделе "
+                                   f"'{self.__name}'")
+        for listener in self.__listeners:
+            listener.on_employee_added(self, employee)
+        self.__employees[employee.id] = employee
+        self.__total_salary += employee.calculate_salary()
+        emp_type = employee.__class__.__name__
+        self.__type_counts[emp_type] = self.__type_counts.get(emp_type, 0) + 1
+        employee.add_salary_listener(self)
     
     def remove_employee(self, employee_id: int) -> None:
         """Удаляет сотрудника из отдела по ID."""
-        self.__employees = [emp for emp in self.__employees if emp.id != employee_id]
+        employee = self.__employees.pop(employee_id, None)
+        if employee is None:
+            return
+        employee.remove_salary_listener(self)
+        if self.__employees:
+            self.__total_salary -= employee.calculate_salary()
+        else:
+            # Сбрасываем накопленную погрешность операций с плавающей точкой
+            self.__total_salary = 0.0
+        emp_type = employee.__class__.__name__
+        self.__type_counts[emp_type] -= 1
+        if not self.__type_counts[emp_type]:
+            del self.__type_counts[emp_type]
+        for listener in self.__listeners:
+            listener.on_employee_removed(self, employee)
+    
+    def on_salary_changed(self, employee: AbstractEmployee, delta: float) -> None:
+        """Обработчик изменения итоговой зарплаты сотрудника отдела."""
+        self.__total_salary += delta
+        for listener in self.__listeners:
+            listener.on_employee_salary_changed(self, employee, delta)
     
     def get_employees(self) -> list[AbstractEmployee]:
         """Возвращает список всех сотрудников отдела."""
-        return self.__employees.copy()
+        return list(self.__employees.values())
     
     def calculate_total_salary(self) -> float:
-        """Вычисляет общую зарплату всех сотрудников отдела."""
-        return sum(emp.calculate_salary() for emp in self.__employees)
+        """Возвращает общую зарплату всех сотрудников отдела (O(1))."""
+        if is_verification_enabled():
+            self.verify_aggregates()
+        return self.__total_salary
     
     def get_employee_count(self) -> dict[str, int]:
         """Возвращает словарь с количеством сотрудников каждого типа."""
+        if is_verification_enabled():
+            self.verify_aggregates()
+        return dict(self.__type_counts)
+    
+    def verify_aggregates(self) -> None:
+        """
+        Сверяет поддерживаемые агрегаты отдела с полным пересчетом.
+        
+        Raises:
+            AggregateMismatchError: Если агрегаты расходятся
+        """
+        total = sum(emp.calculate_salary() for emp in self.__employees.values())
         counts = {}
-        for emp in self.__employees:
+        for emp in self.__employees.values():
             emp_type = emp.__class__.__name__
             counts[emp_type] = counts.get(emp_type, 0) + 1
-        return counts
+        check_aggregate(f"Зарплата отдела '{self.__name}'", self.__total_salary, total)
+        check_aggregate(f"Типы сотрудников отдела '{self.__name}'", self.__type_counts, counts)
     
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """Находит сотрудника по ID."""
-        for emp in self.__employees:
-            if emp.id == employee_id:
-                return emp
-        return None
+        return self.__employees.get(employee_id)
     
     def __len__(self) -> int:
         """Возвращает количество сотрудников в отделе."""
         return len(self.__employees)
     
     def __getitem__(self, key: int) -> AbstractEmployee:
-        """Доступ к сотруднику по индексу."""
-        return self.__employees[key]
+        """Доступ к сотруднику по индексу (или срезу)."""
+        if isinstance(key, slice):
+            return list(self.__employees.values())[key]
+        count = len(self.__employees)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("Индекс сотрудника вне диапазона")
+        # С конца словарь обходится быстрее, чем с начала
+        if key >= count // 2:
+            return next(islice(reversed(self.__employees.values()), count - 1 - key, None))
+        return next(islice(self.__employees.values(), key, None))
     
     def __contains__(self, employee: AbstractEmployee) -> bool:
         """Проверка принадлежности сотрудника отделу."""
-        return employee in self.__employees
+        if not isinstance(employee, AbstractEmployee):
+            return False
+        return employee.id in self.__employees
     
     def __iter__(self):
         """Итератор по сотрудникам отдела."""
-        return iter(self.__employees)
+        return iter(self.__employees.values())
     
     def __str__(self) -> str:
         """Строковое представление отдела."""
@@ -87,7 +178,7 @@ class Department:
         """Сохраняет всех сотрудников отдела в JSON файл."""
         data = {
             "name": self.__name,
-            "employees": [emp.to_dict() for emp in self.__employees]
+            "employees": [emp.to_dict() for emp in self.__employees.values()]
         }
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -4,6 +4,7 @@
 """
 
 from .abstract_employee import AbstractEmployee
+from ..utils.salary_cache import cached_salary
 
 
 class Employee(AbstractEmployee):
@@ -14,6 +15,8 @@ class Employee(AbstractEmployee):
     для расчета зарплаты и получения информации.
     """
     
+    __slots__ = ()
+    
     def __init__(self, employee_id: int, name: str, department: str, base_salary: float):
         """
         Конструктор класса Employee.
@@ -26,6 +29,7 @@ class Employee(AbstractEmployee):
         """
         super().__init__(employee_id, name, department, base_salary)
     
+    @cached_salary
     def calculate_salary(self) -> float:
         """
         Рассчитывает итоговую заработную плату.
@@ -0,0 +1,272 @@
+"""
+Модуль для работы с классом EmployeeTable (колоночное хранилище сотрудников).
+
+Хранит сотрудников в виде типизированных массивов (по одному на атрибут)
+и считает фонд оплаты труда за один векторизованный проход: через NumPy,
+если он установлен, иначе через модуль array стандартной библиотеки.
+"""
+
+from array import array
+from itertools import compress
+from operator import add, mul
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+from .abstract_employee import AbstractEmployee
+
+
+class EmployeeTable:
+    """
+    Класс EmployeeTable - колоночное представление сотрудников.
+
+    Итоговая зарплата любого типа сотрудника выражается одной формулой:
+        base_salary * seniority_coefficient + bonus + sales_volume * commission_rate
+    где неприменимые к типу колонки равны нейтральным значениям
+    (коэффициент 1.0, бонус и продажи 0.0).
+    """
+
+    TYPE_CODES = {
+        "Employee": 0,
+        "Manager": 1,
+        "Developer": 2,
+        "Salesperson": 3
+    }
+    TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        """
+        Конструктор класса EmployeeTable.
+
+        Args:
+            use_numpy: True/False - принудительно выбрать вычислитель,
+                       None - использовать NumPy, если он доступен
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy не установлен")
+        self.__use_numpy = np is not None if use_numpy is None else use_numpy
+
+        # Числовые колонки
+        self.__ids = array('q')
+        self.__base_salary = array('d')
+        self.__type_code = array('b')
+        self.__bonus = array('d')
+        self.__seniority_coefficient = array('d')
+        self.__commission_rate = array('d')
+        self.__sales_volume = array('d')
+        self.__department_code = array('i')
+
+        # Строковые колонки и справочники
+        self.__names: list[str] = []
+        self.__tech_stacks: list[tuple[str, ...]] = []
+        self.__department_names: list[str] = []
+        self.__department_codes: dict[str, int] = {}
+        self.__project_rows: dict[int, array] = {}
+        # Непрерывные диапазоны строк одного отдела: [код, начало, конец)
+        self.__department_runs: list[list[int]] = []
+        self.__salaries = None
+
+    @property
+    def backend(self) -> str:
+        """Название используемого вычислителя ("numpy" или "array")."""
+        return "numpy" if self.__use_numpy else "array"
+
+    def __len__(self) -> int:
+        """Возвращает количество строк таблицы."""
+        return len(self.__ids)
+
+    def _department_code(self, name: str) -> int:
+        """Возвращает код отдела, регистрируя новый отдел при необходимости."""
+        code = self.__department_codes.get(name)
+        if code is None:
+            code = len(self.__department_names)
+            self.__department_codes[name] = code
+            self.__department_names.append(name)
+        return code
+
+    def append(self, employee: AbstractEmployee, department: Optional[str] = None) -> int:
+        """
+        Добавляет сотрудника в таблицу.
+
+        Args:
+            employee: Объект сотрудника
+            department: Название отдела (по умолчанию - employee.department)
+
+        Returns:
+            Номер добавленной строки
+        """
+        emp_type = employee.__class__.__name__
+        if emp_type not in self.TYPE_CODES:
+            raise ValueError(f"Неизвестный тип сотрудника: {emp_type}")
+
+        row = len(self.__ids)
+        self.__ids.append(employee.id)
+        self.__base_salary.append(employee.base_salary)
+        self.__type_code.append(self.TYPE_CODES[emp_type])
+        self.__bonus.append(getattr(employee, "bonus", 0.0))
+        if emp_type == "Developer":
+            coefficient = employee.SENIORITY_COEFFICIENTS[employee.seniority_level]
+            self.__tech_stacks.append(tuple(employee.tech_stack))
+        else:
+            coefficient = 1.0
+            self.__tech_stacks.append(())
+        self.__seniority_coefficient.append(coefficient)
+        self.__commission_rate.append(getattr(employee, "commission_rate", 0.0))
+        self.__sales_volume.append(getattr(employee, "sales_volume", 0.0))
+        dept_code = self._department_code(department or employee.department)
+        self.__department_code.append(dept_code)
+        if self.__department_runs and self.__department_runs[-1][0] == dept_code:
+            self.__department_runs[-1][2] = row + 1
+        else:
+            self.__department_runs.append([dept_code, row, row + 1])
+        self.__names.append(employee.name)
+        self.__salaries = None
+        return row
+
+    def extend(self, employees: Iterable[AbstractEmployee],
+               department: Optional[str] = None) -> None:
+        """Добавляет в таблицу несколько сотрудников."""
+        for employee in employees:
+            self.append(employee, department)
+
+    @classmethod
+    def from_department(cls, department, use_numpy: Optional[bool] = None) -> 'EmployeeTable':
+        """Создает таблицу из сотрудников отдела."""
+        table = cls(use_numpy)
+        table.extend(department, department.name)
+        return table
+
+    @classmethod
+    def from_company(cls, company, use_numpy: Optional[bool] = None) -> 'EmployeeTable':
+        """
+        Создает таблицу из всех сотрудников компании.
+
+        Составы команд проектов сохраняются как массивы номеров строк.
+        """
+        table = cls(use_numpy)
+        rows = {}
+        for dept in company.get_departments():
+            for employee in dept:
+                rows[employee.id] = table.append(employee, dept.name)
+        for project in company.get_projects():
+            table.__project_rows[project.project_id] = array(
+                'q', (rows[emp.id] for emp in project.get_team() if emp.id in rows)
+            )
+        return table
+
+    def to_employees(self) -> list[AbstractEmployee]:
+        """Восстанавливает объекты сотрудников по строкам таблицы."""
+        from .employee import Employee
+        from ..employees.manager import Manager
+        from ..employees.developer import Developer
+        from ..employees.salesperson import Salesperson
+
+        levels = {coef: level for level, coef in Developer.SENIORITY_COEFFICIENTS.items()}
+        employees = []
+        for row in range(len(self)):
+            args = (self.__ids[row], self.__names[row],
+                    self.__department_names[self.__department_code[row]],
+                    self.__base_salary[row])
+            code = self.__type_code[row]
+            if code == self.TYPE_CODES["Manager"]:
+                employee = Manager(*args, self.__bonus[row])
+            elif code == self.TYPE_CODES["Developer"]:
+                employee = Developer(*args, list(self.__tech_stacks[row]),
+                                     levels[self.__seniority_coefficient[row]])
+            elif code == self.TYPE_CODES["Salesperson"]:
+                employee = Salesperson(*args, self.__commission_rate[row],
+                                       self.__sales_volume[row])
+            else:
+                employee = Employee(*args)
+            employees.append(employee)
+        return employees
+
+    def to_departments(self) -> list:
+        """Восстанавливает отделы с объектами сотрудников."""
+        from .department import Department
+
+        departments = [Department(name) for name in self.__department_names]
+        for row, employee in enumerate(self.to_employees()):
+            departments[self.__department_code[row]].add_employee(employee)
+        return departments
+
+    def to_company(self, name: str):
+        """Восстанавливает компанию (отделы и сотрудников) из таблицы."""
+        from .company import Company
+
+        company = Company(name)
+        for dept in self.to_departments():
+            company.add_department(dept)
+        return company
+
+    # Векторизованные расчеты
+
+    def salaries(self):
+        """
+        Возвращает колонку итоговых зарплат, рассчитанную за один проход.
+
+        Returns:
+            numpy.ndarray или array('d') в зависимости от вычислителя
+        """
+        if self.__salaries is None:
+            if self.__use_numpy:
+                base = np.frombuffer(self.__base_salary, dtype=np.float64)
+                coef = np.frombuffer(self.__seniority_coefficient, dtype=np.float64)
+                bonus = np.frombuffer(self.__bonus, dtype=np.float64)
+                rate = np.frombuffer(self.__commission_rate, dtype=np.float64)
+                volume = np.frombuffer(self.__sales_volume, dtype=np.float64)
+                self.__salaries = base * coef + bonus + rate * volume
+            else:
+                self.__salaries = array('d', map(
+                    add,
+                    map(add, map(mul, self.__base_salary, self.__seniority_coefficient),
+                        self.__bonus),
+                    map(mul, self.__commission_rate, self.__sales_volume)
+                ))
+        return self.__salaries
+
+    def total_payroll(self) -> float:
+        """Рассчитывает фонд оплаты труда по всей таблице."""
+        salaries = self.salaries()
+        if self.__use_numpy:
+            return float(salaries.sum())
+        return sum(salaries)
+
+    def payroll_by_department(self) -> dict[str, float]:
+        """Рассчитывает фонд оплаты труда по каждому отделу."""
+        salaries = self.salaries()
+        if self.__use_numpy:
+            codes = np.frombuffer(self.__department_code, dtype=np.int32)
+            totals = np.bincount(codes, weights=salaries,
+                                 minlength=len(self.__department_names))
+            return {name: float(totals[code])
+                    for code, name in enumerate(self.__department_names)}
+        # Строки, добавленные подряд для одного отдела, суммируются срезами
+        totals = [0.0] * len(self.__department_names)
+        for code, start, end in self.__department_runs:
+            totals[code] += sum(salaries[start:end])
+        return dict(zip(self.__department_names, totals))
+
+    def payroll_by_project(self) -> dict[int, float]:
+        """Рассчитывает суммарную зарплату команды каждого проекта."""
+        salaries = self.salaries()
+        if self.__use_numpy:
+            return {project_id: float(salaries[np.frombuffer(rows, dtype=np.int64)].sum())
+                    for project_id, rows in self.__project_rows.items()}
+        return {project_id: sum(map(salaries.__getitem__, rows))
+                for project_id, rows in self.__project_rows.items()}
+
+    def payroll_by_type(self) -> dict[str, float]:
+        """Рассчитывает фонд оплаты труда по типам сотрудников."""
+        salaries = self.salaries()
+        if self.__use_numpy:
+            codes = np.frombuffer(self.__type_code, dtype=np.int8)
+            totals = np.bincount(codes, weights=salaries, minlength=len(self.TYPE_CODES))
+            return {name: float(totals[code]) for code, name in self.TYPE_NAMES.items()}
+        return {
+            name: sum(compress(salaries, map(code.__eq__, self.__type_code)))
+            for code, name in self.TYPE_NAMES.items()
+        }
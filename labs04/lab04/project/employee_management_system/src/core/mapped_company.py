@@ -0,0 +1,257 @@
+"""
+Модуль для работы с классом MappedCompany (компания в отображаемом в память файле).
+
+Предоставляет доступ только для чтения к снимку компании (см. модуль snapshot)
+через mmap: поиск сотрудника, статистика по отделам и фонд оплаты труда
+вычисляются прямо по записям файла, без создания объектов для всех сотрудников.
+Страницы файла отображаются через кэш ОС и разделяются между процессами,
+открывшими один и тот же снимок.
+"""
+
+import mmap
+import os
+from typing import Iterator, Optional, Union
+
+from .abstract_employee import AbstractEmployee
+from .snapshot import CompanySnapshot
+
+
+class MappedCompany:
+    """
+    Класс MappedCompany - представление снимка компании только для чтения.
+
+    Объекты сотрудников создаются лениво, при обращении к конкретной записи,
+    и являются независимыми копиями: их изменение не влияет на файл.
+    Экземпляр можно передавать в дочерние процессы (pickle): процесс
+    откроет тот же файл заново и будет использовать общие страницы.
+    """
+
+    def __init__(self, filename: Union[str, os.PathLike]):
+        """
+        Конструктор класса MappedCompany.
+
+        Args:
+            filename: Имя файла снимка, созданного Company.save_to_snapshot
+        """
+        self.__filename = os.fspath(filename)
+        with open(self.__filename, "rb") as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        sections = CompanySnapshot.read_sections(self.__mmap)
+        self.__sections = sections
+
+        strings = sections[b"STRS"]
+        self.__string_count = CompanySnapshot.U32.unpack_from(strings, 0)[0]
+        self.__string_offsets = strings[4:4 + 8 * (self.__string_count + 1)].cast("Q")
+        self.__string_data = strings[4 + 8 * (self.__string_count + 1):]
+
+        stacks = sections[b"STAK"]
+        stack_count = CompanySnapshot.U32.unpack_from(stacks, 0)[0]
+        self.__stack_offsets = stacks[4:4 + 4 * (stack_count + 1)].cast("I")
+        self.__stack_skills = stacks[4 + 4 * (stack_count + 1):].cast("I")
+
+        self.__employees = sections[b"EMPL"]
+        self.__employee_count = len(self.__employees) // CompanySnapshot.EMPLOYEE_RECORD.size
+        self.__id_index = sections[b"IDIX"]
+        self.__team = sections[b"TEAM"].cast("q")
+        # Список, а не словарь по названию: в компании может быть несколько
+        # отделов с одинаковым названием, у каждого свой диапазон записей
+        self.__departments: list[tuple[str, int, int]] = [
+            (self._string(name), first_row, count)
+            for name, first_row, count in CompanySnapshot.DEPARTMENT_RECORD.iter_unpack(sections[b"DEPT"])
+        ]
+        self.__projects = {
+            record[0]: record
+            for record in CompanySnapshot.PROJECT_RECORD.iter_unpack(sections[b"PROJ"])
+        }
+        # Записи после отделов - участники проектов вне отделов
+        self.__department_rows = sum(count for _, _, count in self.__departments)
+        self.__department_totals: Optional[list[tuple[float, dict]]] = None
+
+        from ..employees.developer import Developer
+        self.__levels = {code: level for level, code in CompanySnapshot.SENIORITY_CODES.items()}
+        self.__coefficients = {code: Developer.SENIORITY_COEFFICIENTS.get(level, 1.0)
+                               for code, level in self.__levels.items()}
+
+    # Жизненный цикл
+
+    def close(self) -> None:
+        """Освобождает отображение файла."""
+        if self.__mmap.closed:
+            return
+        views = [self.__string_offsets, self.__string_data, self.__stack_offsets,
+                 self.__stack_skills, self.__team, *self.__sections.values()]
+        for view in views:
+            view.release()
+        self.__mmap.close()
+
+    def __enter__(self) -> 'MappedCompany':
+        """Поддержка контекстного менеджера."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Закрывает отображение при выходе из блока with."""
+        self.close()
+
+    def __reduce__(self):
+        """Передача в другой процесс по имени файла: отображение создается заново."""
+        return (self.__class__, (self.__filename,))
+
+    # Низкоуровневый доступ к записям
+
+    def _string(self, index: int) -> str:
+        """Декодирует строку из таблицы строк по индексу."""
+        start = self.__string_offsets[index]
+        end = self.__string_offsets[index + 1]
+        return bytes(self.__string_data[start:end]).decode("utf-8")
+
+    def _record(self, row: int) -> tuple:
+        """Возвращает распакованную запись сотрудника по номеру строки."""
+        return CompanySnapshot.EMPLOYEE_RECORD.unpack_from(
+            self.__employees, row * CompanySnapshot.EMPLOYEE_RECORD.size
+        )
+
+    def _find_row(self, employee_id: int) -> Optional[int]:
+        """Ищет номер записи сотрудника бинарным поиском по индексу ID."""
+        record = CompanySnapshot.ID_INDEX_RECORD
+        low, high = 0, self.__employee_count
+        while low < high:
+            middle = (low + high) // 2
+            found_id, row = record.unpack_from(self.__id_index, middle * record.size)
+            if found_id < employee_id:
+                low = middle + 1
+            elif found_id > employee_id:
+                high = middle
+            else:
+                return row
+        return None
+
+    def _salary(self, record: tuple) -> float:
+        """Рассчитывает итоговую зарплату по записи сотрудника."""
+        _, _, _, _, seniority, _, base_salary, bonus, commission_rate, sales_volume = record
+        return base_salary * self.__coefficients[seniority] + bonus + sales_volume * commission_rate
+
+    def _materialize(self, record: tuple) -> AbstractEmployee:
+        """Создает объект сотрудника по записи."""
+        from .employee import Employee
+        from ..employees.manager import Manager
+        from ..employees.developer import Developer
+        from ..employees.salesperson import Salesperson
+
+        (emp_id, name, department, type_code, seniority, stack,
+         base_salary, bonus, commission_rate, sales_volume) = record
+        args = (emp_id, self._string(name), self._string(department), base_salary)
+        if type_code == CompanySnapshot.TYPE_CODES["Manager"]:
+            return Manager(*args, bonus)
+        if type_code == CompanySnapshot.TYPE_CODES["Developer"]:
+            skills = [self._string(self.__stack_skills[i])
+                      for i in range(self.__stack_offsets[stack], self.__stack_offsets[stack + 1])]
+            return Developer(*args, skills, self.__levels[seniority])
+        if type_code == CompanySnapshot.TYPE_CODES["Salesperson"]:
+            return Salesperson(*args, commission_rate, sales_volume)
+        return Employee(*args)
+
+    # Публичный интерфейс, совместимый по смыслу с Company
+
+    @property
+    def name(self) -> str:
+        """Название компании."""
+        return self._string(CompanySnapshot.U32.unpack_from(self.__sections[b"META"], 0)[0])
+
+    def __len__(self) -> int:
+        """Возвращает количество сотрудников отделов в снимке."""
+        return self.__department_rows
+
+    def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
+        """Находит сотрудника отделов по ID (O(log n)) и создает его объект."""
+        row = self._find_row(employee_id)
+        if row is None or row >= self.__department_rows:
+            return None
+        return self._materialize(self._record(row))
+
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        """Лениво обходит всех сотрудников отделов, создавая объекты по одному."""
+        size = CompanySnapshot.EMPLOYEE_RECORD.size
+        for record in CompanySnapshot.EMPLOYEE_RECORD.iter_unpack(
+                self.__employees[:self.__department_rows * size]):
+            yield self._materialize(record)
+
+    def get_department_names(self) -> list[str]:
+        """Возвращает названия отделов (без повторов)."""
+        return list(dict.fromkeys(name for name, _, _ in self.__departments))
+
+    def _department_records(self, index: int) -> Iterator[tuple]:
+        """Обходит записи сотрудников отдела с номером index без создания объектов."""
+        _, first_row, count = self.__departments[index]
+        size = CompanySnapshot.EMPLOYEE_RECORD.size
+        return CompanySnapshot.EMPLOYEE_RECORD.iter_unpack(
+            self.__employees[first_row * size:(first_row + count) * size]
+        )
+
+    def _get_department_totals(self) -> list[tuple[float, dict]]:
+        """
+        Возвращает (фонд оплаты, число сотрудников по типам) для каждой записи DEPT.
+
+        Результаты кэшируются: снимок доступен только для чтения.
+        """
+        if self.__department_totals is None:
+            type_names = {code: name for name, code in CompanySnapshot.TYPE_CODES.items()}
+            totals = []
+            for index in range(len(self.__departments)):
+                total = 0.0
+                types: dict[str, int] = {}
+                for record in self._department_records(index):
+                    total += self._salary(record)
+                    emp_type = type_names[record[3]]
+                    types[emp_type] = types.get(emp_type, 0) + 1
+                totals.append((total, types))
+            self.__department_totals = totals
+        return self.__department_totals
+
+    def get_department_stats(self) -> dict:
+        """
+        Возвращает статистику по отделам в формате Company.get_department_stats.
+
+        Отделы с одинаковым названием объединяются в одну запись статистики.
+        """
+        merged: dict[str, tuple[int, float, dict]] = {}
+        for (name, _, count), (total, types) in zip(self.__departments,
+                                                    self._get_department_totals()):
+            employee_count, total_salary, employee_types = merged.get(name, (0, 0.0, {}))
+            employee_types = dict(employee_types)
+            for emp_type, type_count in types.items():
+                employee_types[emp_type] = employee_types.get(emp_type, 0) + type_count
+            merged[name] = (employee_count + count, total_salary + total, employee_types)
+        return {
+            name: {
+                "employee_count": count,
+                "total_salary": total,
+                "average_salary": total / count if count else 0,
+                "employee_types": types
+            }
+            for name, (count, total, types) in merged.items()
+        }
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Рассчитывает общие месячные затраты на зарплаты по записям файла."""
+        return sum(total for total, _ in self._get_department_totals())
+
+    def get_project_ids(self) -> list[int]:
+        """Возвращает ID проектов."""
+        return list(self.__projects)
+
+    def get_project_team_ids(self, project_id: int) -> list[int]:
+        """Возвращает ID участников команды проекта."""
+        record = self.__projects.get(project_id)
+        if record is None:
+            return []
+        team_offset, team_size = record[5], record[6]
+        return list(self.__team[team_offset:team_offset + team_size])
+
+    def calculate_project_salary(self, project_id: int) -> float:
+        """Рассчитывает суммарную зарплату команды проекта по записям файла."""
+        total = 0.0
+        for employee_id in self.get_project_team_ids(project_id):
+            row = self._find_row(employee_id)
+            if row is not None:
+                total += self._salary(self._record(row))
+        return total
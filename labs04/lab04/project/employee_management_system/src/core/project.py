@@ -6,6 +6,7 @@
 from datetime import datetime
 from .abstract_employee import AbstractEmployee
 from ..utils.exceptions import InvalidStatusError
+from ..utils.aggregates import is_verification_enabled, check_aggregate
 
 
 class Project:
@@ -34,7 +35,10 @@ class Project:
         self.__description = description
         self.__deadline = datetime.strptime(deadline, "%Y-%m-%d")
         self.__status = status
-        self.__team: list[AbstractEmployee] = []
+        # Команда хранится по ID сотрудника: проверка членства за O(1)
+        self.__team: dict[int, AbstractEmployee] = {}
+        self.__listeners: list = []
+        self.__total_salary = 0.0
         
         # Валидация
         if status not in self.VALID_STATUSES:
@@ -65,26 +69,74 @@ class Project:
         """Геттер для статуса проекта."""
         return self.__status
     
+    def add_listener(self, listener) -> None:
+        """
+        Подписывает объект на изменения состава команды.
+        
+        Слушатель должен реализовывать методы
+        on_team_member_added(project, employee) и
+        on_team_member_removed(project, employee).
+        """
+        if listener not in self.__listeners:
+            self.__listeners.append(listener)
+    
+    def remove_listener(self, listener) -> None:
+        """Отписывает объект от изменений состава команды."""
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+    
     def add_team_member(self, employee: AbstractEmployee) -> None:
         """Добавляет сотрудника в команду проекта."""
-        if employee not in self.__team:
-            self.__team.append(employee)
+        if employee.id not in self.__team:
+            self.__team[employee.id] = employee
+            self.__total_salary += employee.calculate_salary()
+            employee.add_salary_listener(self)
+            for listener in self.__listeners:
+                listener.on_team_member_added(self, employee)
     
     def remove_team_member(self, employee_id: int) -> None:
         """Удаляет сотрудника из команды по ID."""
-        self.__team = [emp for emp in self.__team if emp.id != employee_id]
+        employee = self.__team.pop(employee_id, None)
+        if employee is not None:
+            employee.remove_salary_listener(self)
+            if self.__team:
+                self.__total_salary -= employee.calculate_salary()
+            else:
+                self.__total_salary = 0.0
+            for listener in self.__listeners:
+                listener.on_team_member_removed(self, employee)
+    
+    def on_salary_changed(self, employee: AbstractEmployee, delta: float) -> None:
+        """Обработчик изменения итоговой зарплаты участника команды."""
+        self.__total_salary += delta
+    
+    def has_team_member(self, employee_id: int) -> bool:
+        """Проверяет, входит ли сотрудник с указанным ID в команду."""
+        return employee_id in self.__team
     
     def get_team(self) -> list[AbstractEmployee]:
         """Возвращает список команды проекта."""
-        return self.__team.copy()
+        return list(self.__team.values())
     
     def get_team_size(self) -> int:
         """Возвращает размер команды."""
         return len(self.__team)
     
     def calculate_total_salary(self) -> float:
-        """Рассчитывает суммарную зарплату команды."""
-        return sum(emp.calculate_salary() for emp in self.__team)
+        """Возвращает суммарную зарплату команды (O(1))."""
+        if is_verification_enabled():
+            self.verify_aggregates()
+        return self.__total_salary
+    
+    def verify_aggregates(self) -> None:
+        """
+        Сверяет поддерживаемую зарплату команды с полным пересчетом.
+        
+        Raises:
+            AggregateMismatchError: Если значения расходятся
+        """
+        total = sum(emp.calculate_salary() for emp in self.__team.values())
+        check_aggregate(f"Бюджет проекта {self.__project_id}", self.__total_salary, total)
     
     def get_project_info(self) -> str:
         """Возвращает полную информацию о проекте."""
@@ -108,7 +160,7 @@ class Project:
             "description": self.__description,
             "deadline": self.__deadline.strftime("%Y-%m-%d"),
             "status": self.__status,
-            "team": [emp.to_dict() for emp in self.__team]
+            "team": [emp.to_dict() for emp in self.__team.values()]
         }
     
     @classmethod
@@ -0,0 +1,299 @@
+"""
+Модуль для работы с бинарными снимками компании (CompanySnapshot).
+
+Формат снимка (все числа little-endian):
+
+    Заголовок:       магия b"EMSSNAP\\0", версия (u16), число секций (u16)
+    Таблица секций:  для каждой секции - тег (4 байта), смещение (u64), размер (u64)
+
+    STRS  таблица строк: число строк n (u32), n+1 смещений (u64), UTF-8 данные
+    META  название компании: индекс строки (u32)
+    DEPT  отделы: (индекс названия u32, первая строка u32, число сотрудников u32)
+    STAK  стеки технологий: число стеков n (u32), n+1 смещений (u32), индексы строк (u32)
+    EMPL  сотрудники: записи фиксированной длины EMPLOYEE_RECORD
+    PROJ  проекты: записи фиксированной длины PROJECT_RECORD
+    TEAM  составы команд: ID сотрудников (i64) подряд для всех проектов
+    IDIX  индекс по ID: пары (ID i64, номер записи u32), отсортированные по ID
+
+Сотрудники записаны подряд по отделам, поэтому отдел описывается диапазоном
+записей. Каждый сотрудник хранится один раз, проекты ссылаются на него по ID.
+Участники проектов, не входящие ни в один отдел, записываются в EMPL после
+сотрудников всех отделов и не попадают ни в один диапазон DEPT.
+Секции выровнены по 8 байт, массивы чисел хранятся в порядке байт платформы
+(little-endian на x86/ARM), что позволяет читать их через memoryview.cast.
+"""
+
+import os
+import struct
+from array import array
+from typing import Union
+
+from ..utils.exceptions import SnapshotFormatError
+
+
+class CompanySnapshot:
+    """
+    Класс CompanySnapshot сохраняет и загружает компанию в компактном
+    бинарном формате.
+    """
+
+    MAGIC = b"EMSSNAP\0"
+    VERSION = 1
+
+    HEADER = struct.Struct("<8sHH")
+    SECTION = struct.Struct("<4sQQ")
+    U32 = struct.Struct("<I")
+    DEPARTMENT_RECORD = struct.Struct("<III")
+    # id, имя, отдел, тип, уровень, стек, базовая зарплата, бонус, комиссия, продажи
+    EMPLOYEE_RECORD = struct.Struct("<qIIBB2xIdddd")
+    # id, название, описание, срок, статус, смещение команды, размер команды
+    PROJECT_RECORD = struct.Struct("<qIIIIII")
+    ID_INDEX_RECORD = struct.Struct("<qI4x")
+
+    TYPE_CODES = {"Employee": 0, "Manager": 1, "Developer": 2, "Salesperson": 3}
+    SENIORITY_CODES = {"": 0, "junior": 1, "middle": 2, "senior": 3}
+    NO_STACK = 0xFFFFFFFF
+
+    SECTION_ORDER = (b"STRS", b"META", b"DEPT", b"STAK", b"EMPL", b"PROJ", b"TEAM", b"IDIX")
+
+    @classmethod
+    def save(cls, company, filename: Union[str, os.PathLike]) -> None:
+        """
+        Сохраняет компанию в бинарный снимок.
+
+        Args:
+            company: Сохраняемая компания
+            filename: Имя файла снимка
+        """
+        strings: dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        stacks: dict[tuple, int] = {}
+        stack_offsets = array('I', [0])
+        stack_skills = array('I')
+        departments = bytearray()
+        employees = bytearray()
+        id_index = []
+        row = 0
+
+        saved: dict[int, object] = {}
+
+        def pack_employee(emp) -> None:
+            nonlocal row
+            emp_type = emp.__class__.__name__
+            if emp_type not in cls.TYPE_CODES:
+                raise SnapshotFormatError(f"Неподдерживаемый тип сотрудника: {emp_type}")
+            stack_index = cls.NO_STACK
+            seniority = ""
+            if emp_type == "Developer":
+                seniority = emp.seniority_level
+                stack = tuple(emp.tech_stack)
+                stack_index = stacks.get(stack)
+                if stack_index is None:
+                    stack_index = stacks[stack] = len(stacks)
+                    stack_skills.extend(intern(skill) for skill in stack)
+                    stack_offsets.append(len(stack_skills))
+            employees.extend(cls.EMPLOYEE_RECORD.pack(
+                emp.id, intern(emp.name), intern(emp.department),
+                cls.TYPE_CODES[emp_type], cls.SENIORITY_CODES[seniority], stack_index,
+                emp.base_salary, getattr(emp, "bonus", 0.0),
+                getattr(emp, "commission_rate", 0.0), getattr(emp, "sales_volume", 0.0)
+            ))
+            id_index.append((emp.id, row))
+            saved[emp.id] = emp
+            row += 1
+
+        meta = cls.U32.pack(intern(company.name))
+        for dept in company.get_departments():
+            first_row = row
+            for emp in dept:
+                pack_employee(emp)
+            departments += cls.DEPARTMENT_RECORD.pack(intern(dept.name), first_row, row - first_row)
+        department_ids = set(saved)
+
+        projects = bytearray()
+        team = array('q')
+        for proj in company.get_projects():
+            members = []
+            for emp in proj.get_team():
+                # Участник вне отделов сохраняется отдельной записью после отделов
+                if emp.id not in saved:
+                    pack_employee(emp)
+                elif emp.id not in department_ids and saved[emp.id] is not emp:
+                    raise SnapshotFormatError(
+                        f"Разные участники проектов вне отделов имеют ID {emp.id}")
+                members.append(emp.id)
+            projects += cls.PROJECT_RECORD.pack(
+                proj.project_id, intern(proj.name), intern(proj.description),
+                intern(proj.deadline.strftime("%Y-%m-%d")), intern(proj.status),
+                len(team), len(members)
+            )
+            team.extend(members)
+
+        id_index.sort()
+        index = bytearray()
+        for emp_id, emp_row in id_index:
+            index += cls.ID_INDEX_RECORD.pack(emp_id, emp_row)
+
+        sections = {
+            b"STRS": cls._pack_strings(list(strings)),
+            b"META": meta,
+            b"DEPT": bytes(departments),
+            b"STAK": cls.U32.pack(len(stacks)) + stack_offsets.tobytes() + stack_skills.tobytes(),
+            b"EMPL": bytes(employees),
+            b"PROJ": bytes(projects),
+            b"TEAM": team.tobytes(),
+            b"IDIX": bytes(index),
+        }
+
+        with open(filename, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(sections)))
+            offsets = {}
+            offset = cls._align(cls.HEADER.size + cls.SECTION.size * len(sections))
+            for tag in cls.SECTION_ORDER:
+                offsets[tag] = offset
+                f.write(cls.SECTION.pack(tag, offset, len(sections[tag])))
+                offset = cls._align(offset + len(sections[tag]))
+            for tag in cls.SECTION_ORDER:
+                f.write(b"\0" * (offsets[tag] - f.tell()))
+                f.write(sections[tag])
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        """Выравнивает смещение секции по границе 8 байт."""
+        return (offset + 7) & ~7
+
+    @classmethod
+    def _pack_strings(cls, values: list[str]) -> bytes:
+        """Упаковывает таблицу строк: число, смещения и UTF-8 данные."""
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = array('Q', [0])
+        total = 0
+        for data in encoded:
+            total += len(data)
+            offsets.append(total)
+        return cls.U32.pack(len(values)) + offsets.tobytes() + b"".join(encoded)
+
+    @classmethod
+    def read_sections(cls, buffer) -> dict[bytes, memoryview]:
+        """
+        Разбирает заголовок снимка.
+
+        Args:
+            buffer: bytes, bytearray или mmap с содержимым снимка
+
+        Returns:
+            Словарь {тег секции: memoryview на данные секции}
+
+        Raises:
+            SnapshotFormatError: Если файл не является снимком поддерживаемой версии
+        """
+        view = memoryview(buffer)
+        if len(view) < cls.HEADER.size:
+            raise SnapshotFormatError("Файл слишком мал для снимка компании")
+        magic, version, count = cls.HEADER.unpack_from(view, 0)
+        if magic != cls.MAGIC:
+            raise SnapshotFormatError("Неверная сигнатура снимка компании")
+        if version != cls.VERSION:
+            raise SnapshotFormatError(f"Неподдерживаемая версия снимка: {version}")
+        sections = {}
+        for i in range(count):
+            tag, offset, size = cls.SECTION.unpack_from(view, cls.HEADER.size + i * cls.SECTION.size)
+            if offset + size > len(view):
+                raise SnapshotFormatError(f"Секция {tag!r} выходит за пределы файла")
+            sections[tag] = view[offset:offset + size]
+        missing = [tag for tag in cls.SECTION_ORDER if tag not in sections]
+        if missing:
+            raise SnapshotFormatError(f"В снимке отсутствуют секции: {missing}")
+        return sections
+
+    @classmethod
+    def unpack_strings(cls, section: memoryview) -> list[str]:
+        """Распаковывает всю таблицу строк."""
+        count = cls.U32.unpack_from(section, 0)[0]
+        offsets = section[4:4 + 8 * (count + 1)].cast("Q")
+        data = section[4 + 8 * (count + 1):]
+        raw = bytes(data)
+        return [raw[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+    @classmethod
+    def unpack_stacks(cls, section: memoryview, strings: list[str]) -> list[list[str]]:
+        """Распаковывает стеки технологий."""
+        count = cls.U32.unpack_from(section, 0)[0]
+        offsets = section[4:4 + 4 * (count + 1)].cast("I")
+        skills = section[4 + 4 * (count + 1):].cast("I")
+        return [[strings[skills[j]] for j in range(offsets[i], offsets[i + 1])]
+                for i in range(count)]
+
+    @classmethod
+    def load(cls, filename: Union[str, os.PathLike]):
+        """
+        Загружает компанию из бинарного снимка.
+
+        Args:
+            filename: Имя файла снимка
+
+        Returns:
+            Восстановленная компания
+        """
+        from .company import Company
+        from .department import Department
+        from .project import Project
+        from .employee import Employee
+        from ..employees.manager import Manager
+        from ..employees.developer import Developer
+        from ..employees.salesperson import Salesperson
+
+        with open(filename, "rb") as f:
+            buffer = f.read()
+        sections = cls.read_sections(buffer)
+        strings = cls.unpack_strings(sections[b"STRS"])
+        stacks = cls.unpack_stacks(sections[b"STAK"], strings)
+        levels = {code: level for level, code in cls.SENIORITY_CODES.items()}
+
+        def make_employee(record: tuple):
+            (emp_id, name, department, type_code, seniority, stack,
+             base_salary, bonus, commission_rate, sales_volume) = record
+            if type_code == 1:
+                return Manager(emp_id, strings[name], strings[department], base_salary, bonus)
+            if type_code == 2:
+                return Developer(emp_id, strings[name], strings[department], base_salary,
+                                 stacks[stack], levels[seniority])
+            if type_code == 3:
+                return Salesperson(emp_id, strings[name], strings[department], base_salary,
+                                   commission_rate, sales_volume)
+            return Employee(emp_id, strings[name], strings[department], base_salary)
+
+        company = Company(strings[cls.U32.unpack_from(sections[b"META"], 0)[0]])
+        records = cls.EMPLOYEE_RECORD.iter_unpack(sections[b"EMPL"])
+        employees_by_id = {}
+        for name_index, first_row, count in cls.DEPARTMENT_RECORD.iter_unpack(sections[b"DEPT"]):
+            dept = Department(strings[name_index])
+            for _ in range(count):
+                emp = make_employee(next(records))
+                dept.add_employee(emp)
+                employees_by_id[emp.id] = emp
+            company.add_department(dept)
+        # Оставшиеся записи - участники проектов, не входящие ни в один отдел
+        for record in records:
+            emp = make_employee(record)
+            employees_by_id[emp.id] = emp
+
+        team = sections[b"TEAM"].cast("q")
+        for (project_id, name, description, deadline, status,
+             team_offset, team_size) in cls.PROJECT_RECORD.iter_unpack(sections[b"PROJ"]):
+            project = Project(project_id, strings[name], strings[description],
+                              strings[deadline], strings[status])
+            for emp_id in team[team_offset:team_offset + team_size]:
+                emp = employees_by_id.get(emp_id)
+                if emp is None:
+                    raise SnapshotFormatError(
+                        f"Участник проекта {project_id} с ID {emp_id} отсутствует в снимке")
+                project.add_team_member(emp)
+            company.add_project(project)
+        return company
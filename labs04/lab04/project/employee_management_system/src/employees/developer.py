@@ -3,7 +3,19 @@
 Наследуется от Employee.
 """
 
+import sys
+import weakref
 from ..core.employee import Employee
+from ..utils.salary_cache import cached_salary
+
+
+class _TechStack:
+    """Общий для нескольких разработчиков стек технологий (элемент пула)."""
+    
+    __slots__ = ('skills', '__weakref__')
+    
+    def __init__(self, skills: tuple[str, ...]):
+        self.skills = skills
 
 
 class Developer(Employee):
@@ -12,8 +24,14 @@ class Developer(Employee):
     
     Наследуется от Employee и добавляет стек технологий и уровень seniority.
     Зарплата зависит от уровня: junior (x1.0), middle (x1.5), senior (x2.0).
+    
+    Стек технологий хранится в пуле со слабыми ссылками: разработчики
+    с одинаковым стеком разделяют один и тот же объект, а стек, который
+    больше никому не нужен, удаляется из пула сборщиком мусора.
     """
     
+    __slots__ = ('__tech_stack', '__seniority_level')
+    
     # Коэффициенты для расчета зарплаты в зависимости от уровня
     SENIORITY_COEFFICIENTS = {
         "junior": 1.0,
@@ -21,6 +39,20 @@ class Developer(Employee):
         "senior": 2.0
     }
     
+    # Пул общих стеков технологий (запись живет, пока на стек есть ссылки)
+    _tech_stack_pool: 'weakref.WeakValueDictionary[tuple[str, ...], _TechStack]' = \
+        weakref.WeakValueDictionary()
+    
+    @classmethod
+    def _intern_tech_stack(cls, skills) -> _TechStack:
+        """Возвращает общий для всех разработчиков объект с указанным стеком."""
+        key = tuple(sys.intern(skill) for skill in skills)
+        stack = cls._tech_stack_pool.get(key)
+        if stack is None:
+            stack = _TechStack(key)
+            cls._tech_stack_pool[key] = stack
+        return stack
+    
     def __init__(self, employee_id: int, name: str, department: str,
                  base_salary: float, tech_stack: list[str], seniority_level: str):
         """
@@ -40,17 +72,17 @@ class Developer(Employee):
     
     @property
     def tech_stack(self) -> list[str]:
-        """Геттер для стека технологий."""
-        return self.__tech_stack.copy()
+        """Геттер для стека технологий (возвращает копию)."""
+        return list(self.__tech_stack.skills)
     
     @tech_stack.setter
     def tech_stack(self, value: list[str]):
         """Сеттер для стека технологий."""
-        if not isinstance(value, list):
+        if not isinstance(value, (list, tuple)):
             raise ValueError("Стек технологий должен быть списком")
         if not all(isinstance(item, str) for item in value):
             raise ValueError("Все элементы стека технологий должны быть строками")
-        self.__tech_stack = value.copy()
+        self.__tech_stack = self._intern_tech_stack(value)
     
     @property
     def seniority_level(self) -> str:
@@ -66,7 +98,9 @@ class Developer(Employee):
         if value_lower not in self.SENIORITY_COEFFICIENTS:
             raise ValueError(f"Уровень seniority должен быть одним из: "
                            f"{', '.join(self.SENIORITY_COEFFICIENTS.keys())}")
+        old_salary = self._salary_snapshot()
         self.__seniority_level = value_lower
+        self._notify_salary_change(old_salary)
     
     def add_skill(self, new_skill: str) -> None:
         """Добавляет новую технологию в стек разработчика."""
@@ -74,9 +108,11 @@ class Developer(Employee):
             raise ValueError("Технология должна быть строкой")
         if not new_skill.strip():
             raise ValueError("Технология не может быть пустой строкой")
-        if new_skill not in self.__tech_stack:
-            self.__tech_stack.append(new_skill)
+        skills = self.__tech_stack.skills
+        if new_skill not in skills:
+            self.__tech_stack = self._intern_tech_stack(skills + (new_skill,))
     
+    @cached_salary
     def calculate_salary(self) -> float:
         """Рассчитывает итоговую заработную плату разработчика."""
         coefficient = self.SENIORITY_COEFFICIENTS[self.__seniority_level]
@@ -84,19 +120,24 @@ class Developer(Employee):
     
     def get_info(self) -> str:
         """Возвращает полную информацию о разработчике."""
-        tech_stack_str = ", ".join(self.__tech_stack) if self.__tech_stack else "нет"
+        skills = self.__tech_stack.skills
+        tech_stack_str = ", ".join(skills) if skills else "нет"
         return (f"{super().__str__()}, уровень: {self.__seniority_level}, "
                 f"технологии: [{tech_stack_str}], итоговая зарплата: {self.calculate_salary()}")
     
+    def get_additional_info(self) -> str:
+        """Возвращает уровень и стек технологий разработчика для отчетов."""
+        return f"Уровень: {self.__seniority_level}, Технологии: {', '.join(self.__tech_stack.skills)}"
+    
     def __iter__(self):
         """Итератор по стеку технологий разработчика."""
-        return iter(self.__tech_stack)
+        return iter(self.__tech_stack.skills)
     
     def to_dict(self) -> dict:
         """Преобразует объект разработчика в словарь."""
         data = super().to_dict()
         data.update({
-            "tech_stack": self.__tech_stack,
+            "tech_stack": list(self.__tech_stack.skills),
             "seniority_level": self.__seniority_level
         })
         return data
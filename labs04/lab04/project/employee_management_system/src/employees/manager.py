@@ -4,6 +4,7 @@
 """
 
 from ..core.employee import Employee
+from ..utils.salary_cache import cached_salary
 
 
 class Manager(Employee):
@@ -13,6 +14,8 @@ class Manager(Employee):
     Наследуется от Employee и добавляет бонус к базовой зарплате.
     """
     
+    __slots__ = ('__bonus',)
+    
     def __init__(self, employee_id: int, name: str, department: str, 
                  base_salary: float, bonus: float):
         """
@@ -48,8 +51,11 @@ class Manager(Employee):
             raise ValueError("Бонус должен быть числом")
         if value < 0:
             raise ValueError("Бонус не может быть отрицательным")
+        old_salary = self._salary_snapshot()
         self.__bonus = float(value)
+        self._notify_salary_change(old_salary)
     
+    @cached_salary
     def calculate_salary(self) -> float:
         """
         Рассчитывает итоговую заработную плату менеджера.
@@ -71,6 +77,10 @@ class Manager(Employee):
         return (f"{super().__str__()}, бонус: {self.__bonus}, "
                 f"итоговая зарплата: {self.calculate_salary()}")
     
+    def get_additional_info(self) -> str:
+        """Возвращает сведения о бонусе менеджера для отчетов."""
+        return f"Бонус: {self.__bonus}"
+    
     def to_dict(self) -> dict:
         """Преобразует объект менеджера в словарь."""
         data = super().to_dict()
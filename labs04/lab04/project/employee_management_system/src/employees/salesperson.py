@@ -4,6 +4,7 @@
 """
 
 from ..core.employee import Employee
+from ..utils.salary_cache import cached_salary
 
 
 class Salesperson(Employee):
@@ -14,6 +15,8 @@ class Salesperson(Employee):
     Зарплата = базовая_зарплата + (объем_продаж * процент_комиссии).
     """
     
+    __slots__ = ('__commission_rate', '__sales_volume')
+    
     def __init__(self, employee_id: int, name: str, department: str,
                  base_salary: float, commission_rate: float, sales_volume: float):
         """
@@ -43,7 +46,9 @@ class Salesperson(Employee):
             raise ValueError("Процент комиссии должен быть числом")
         if value < 0 or value > 1:
             raise ValueError("Процент комиссии должен быть в диапазоне от 0 до 1")
+        old_salary = self._salary_snapshot()
         self.__commission_rate = float(value)
+        self._notify_salary_change(old_salary)
     
     @property
     def sales_volume(self) -> float:
@@ -57,7 +62,9 @@ class Salesperson(Employee):
             raise ValueError("Объем продаж должен быть числом")
         if value < 0:
             raise ValueError("Объем продаж не может быть отрицательным")
+        old_salary = self._salary_snapshot()
         self.__sales_volume = float(value)
+        self._notify_salary_change(old_salary)
     
     def update_sales(self, new_sales: float) -> None:
         """Добавляет сумму к текущему объему продаж."""
@@ -65,8 +72,11 @@ class Salesperson(Employee):
             raise ValueError("Сумма продаж должна быть числом")
         if new_sales < 0:
             raise ValueError("Сумма продаж не может быть отрицательной")
+        old_salary = self._salary_snapshot()
         self.__sales_volume += new_sales
+        self._notify_salary_change(old_salary)
     
+    @cached_salary
     def calculate_salary(self) -> float:
         """Рассчитывает итоговую заработную плату продавца."""
         return self.base_salary + (self.__sales_volume * self.__commission_rate)
@@ -76,6 +86,10 @@ class Salesperson(Employee):
         return (f"{super().__str__()}, процент комиссии: {self.__commission_rate * 100}%, "
                 f"объем продаж: {self.__sales_volume}, итоговая зарплата: {self.calculate_salary()}")
     
+    def get_additional_info(self) -> str:
+        """Возвращает сведения о комиссии и продажах для отчетов."""
+        return f"Комиссия: {self.__commission_rate*100}%, Продажи: {self.__sales_volume}"
+    
     def to_dict(self) -> dict:
         """Преобразует объект продавца в словарь."""
         data = super().to_dict()
@@ -5,14 +5,47 @@ from .exceptions import (
     DepartmentNotFoundError,
     ProjectNotFoundError,
     InvalidStatusError,
-    DuplicateIdError
+    DuplicateIdError,
+    AggregateMismatchError,
+    SnapshotFormatError
 )
+from .aggregates import (
+    set_verification_mode,
+    is_verification_enabled,
+    check_aggregate
+)
+from .salary_cache import (
+    set_salary_caching,
+    is_salary_caching_enabled,
+    get_salary_cache_stats,
+    reset_salary_cache_stats,
+    cached_salary
+)
+from .query import Query, GroupedQuery, field_getter
+from .streaming_stats import StreamingStats, TDigest
+from .rank_index import RankIndex
 
 __all__ = [
     'EmployeeNotFoundError',
     'DepartmentNotFoundError',
     'ProjectNotFoundError',
     'InvalidStatusError',
-    'DuplicateIdError'
+    'DuplicateIdError',
+    'AggregateMismatchError',
+    'SnapshotFormatError',
+    'set_verification_mode',
+    'is_verification_enabled',
+    'check_aggregate',
+    'set_salary_caching',
+    'is_salary_caching_enabled',
+    'get_salary_cache_stats',
+    'reset_salary_cache_stats',
+    'cached_salary',
+    'Query',
+    'GroupedQuery',
+    'field_getter',
+    'StreamingStats',
+    'TDigest',
+    'RankIndex'
 ]
 
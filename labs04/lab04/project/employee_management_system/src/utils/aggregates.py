@@ -0,0 +1,46 @@
+"""
+Модуль для проверки инкрементально поддерживаемых агрегатов.
+
+Отделы, проекты и компания хранят суммы зарплат и количества сотрудников
+по типам и обновляют их при каждом изменении. В режиме проверки каждое
+чтение агрегата сопровождается полным пересчетом и сравнением.
+"""
+
+import math
+from .exceptions import AggregateMismatchError
+
+
+_verification_enabled = False
+
+
+def set_verification_mode(enabled: bool) -> None:
+    """Включает или выключает проверку агрегатов при каждом чтении."""
+    global _verification_enabled
+    _verification_enabled = bool(enabled)
+
+
+def is_verification_enabled() -> bool:
+    """Возвращает True, если включен режим проверки агрегатов."""
+    return _verification_enabled
+
+
+def check_aggregate(label: str, maintained, recomputed) -> None:
+    """
+    Сравнивает поддерживаемое значение агрегата с полным пересчетом.
+    
+    Args:
+        label: Описание агрегата для сообщения об ошибке
+        maintained: Инкрементально поддерживаемое значение
+        recomputed: Значение, полученное полным пересчетом
+    
+    Raises:
+        AggregateMismatchError: Если значения расходятся
+    """
+    if isinstance(maintained, dict):
+        matches = maintained == recomputed
+    else:
+        matches = math.isclose(maintained, recomputed, rel_tol=1e-9, abs_tol=1e-6)
+    if not matches:
+        raise AggregateMismatchError(
+            f"{label}: поддерживаемое значение {maintained} != пересчитанному {recomputed}"
+        )
@@ -27,3 +27,13 @@ class DuplicateIdError(Exception):
     """Исключение, возникающее при дублировании ID."""
     pass
 
+
+
+class AggregateMismatchError(Exception):
+    """Исключение, возникающее при расхождении агрегата с полным пересчетом."""
+    pass
+
+
+class SnapshotFormatError(Exception):
+    """Исключение, возникающее при поврежденном или несовместимом снимке компании."""
+    pass
@@ -0,0 +1,170 @@
+"""
+Модуль для потокового (инкрементального) чтения JSON.
+
+JsonStreamReader читает файл порциями фиксированного размера и позволяет
+обходить массивы и объекты поэлементно, не загружая весь документ в память.
+В памяти одновременно находится только текущая порция и разбираемый элемент.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator
+
+
+class JsonStreamReader:
+    """
+    Потоковый читатель JSON в стиле "pull".
+
+    Пример обхода массива объектов:
+
+        reader = JsonStreamReader(f)
+        for _ in reader.iter_array():
+            item = reader.read_value()
+
+    Каждая итерация iter_array()/iter_object() требует, чтобы вызывающий код
+    прочитал ровно одно значение (read_value(), iter_array() или iter_object()).
+    """
+
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+    NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 64 * 1024):
+        """
+        Конструктор класса JsonStreamReader.
+
+        Args:
+            stream: Файл, открытый в бинарном режиме
+            chunk_size: Размер порции чтения в байтах
+        """
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.__buf = ""
+        self.__pos = 0
+        self.__eof = False
+        self.__bytes_read = 0
+
+    @property
+    def bytes_read(self) -> int:
+        """Количество прочитанных из потока байт."""
+        return self.__bytes_read
+
+    def _fill(self) -> bool:
+        """
+        Дочитывает следующую порцию в буфер, отбрасывая уже разобранную часть.
+
+        Returns:
+            False, если поток закончился
+        """
+        if self.__eof:
+            return False
+        chunk = self.__stream.read(self.__chunk_size)
+        self.__bytes_read += len(chunk)
+        if not chunk:
+            self.__eof = True
+            text = self.__text_decoder.decode(b"", final=True)
+        else:
+            text = self.__text_decoder.decode(chunk)
+        self.__buf = self.__buf[self.__pos:] + text
+        self.__pos = 0
+        return bool(chunk) or bool(text)
+
+    def _skip_whitespace(self) -> None:
+        """Пропускает пробельные символы, при необходимости дочитывая поток."""
+        while True:
+            self.__pos = self.WHITESPACE.match(self.__buf, self.__pos).end()
+            if self.__pos < len(self.__buf) or not self._fill():
+                return
+
+    def _peek(self) -> str:
+        """Возвращает следующий значащий символ без извлечения ('' в конце потока)."""
+        self._skip_whitespace()
+        if self.__pos < len(self.__buf):
+            return self.__buf[self.__pos]
+        return ""
+
+    def _expect(self, char: str) -> None:
+        """Извлекает следующий значащий символ и проверяет его."""
+        actual = self._peek()
+        if actual != char:
+            raise json.JSONDecodeError(f"Ожидался символ {char!r}, получен {actual!r}",
+                                       self.__buf, self.__pos)
+        self.__pos += 1
+
+    def read_value(self) -> Any:
+        """
+        Читает очередное JSON-значение целиком.
+
+        Returns:
+            Разобранное значение (dict, list, str, число, bool или None)
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buf, self.__pos)
+                # Число, упершееся в конец буфера, может продолжаться
+                # в следующей порции (например, "70000" + ".0")
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    complete = self.NUMBER_CHARS.match(self.__buf, self.__pos).end() < len(self.__buf)
+                else:
+                    complete = True
+                if complete or self.__eof:
+                    self.__pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            self._fill()
+
+    def skip_value(self) -> None:
+        """Пропускает очередное JSON-значение."""
+        self.read_value()
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Обходит JSON-массив поэлементно.
+
+        Yields:
+            None перед каждым элементом; элемент читает вызывающий код
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self.__pos += 1
+            return
+        while True:
+            yield None
+            separator = self._peek()
+            self.__pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError(f"Ожидался ',' или ']', получен {separator!r}",
+                                           self.__buf, self.__pos - 1)
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Обходит JSON-объект по ключам.
+
+        Yields:
+            Ключ; значение по ключу читает вызывающий код
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.__pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Ключ объекта должен быть строкой",
+                                           self.__buf, self.__pos)
+            self._expect(":")
+            yield key
+            separator = self._peek()
+            self.__pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError(f"Ожидался ',' или '}}', получен {separator!r}",
+                                           self.__buf, self.__pos - 1)
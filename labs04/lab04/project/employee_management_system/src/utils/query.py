@@ -0,0 +1,269 @@
+"""
+Модуль ленивых запросов к коллекциям сотрудников и записей.
+
+Query описывает цепочку операций (where, select, top_k, chunk, ...) и
+выполняет ее генераторами за один проход по источнику при итерации:
+промежуточные списки не создаются. Источником может быть любой итерируемый
+объект или функция без аргументов, возвращающая итератор
+(например, Company.iter_employees) - тогда запрос можно выполнять повторно.
+
+Поля задаются функцией или строкой: "name" - атрибут объекта или ключ
+словаря, "calculate_salary()" - вызов метода без аргументов.
+"""
+
+import heapq
+from collections.abc import Mapping
+from itertools import islice
+from operator import attrgetter, itemgetter, methodcaller
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+Field = Union[str, Callable[[Any], Any]]
+
+
+def field_getter(field: Field) -> Callable[[Any], Any]:
+    """
+    Возвращает функцию получения поля.
+
+    Args:
+        field: Функция, имя атрибута/ключа или "метод()"
+
+    Returns:
+        Функция от элемента, возвращающая значение поля
+    """
+    if callable(field):
+        return field
+    if field.endswith("()"):
+        return methodcaller(field[:-2])
+    by_attr = attrgetter(field)
+    by_key = itemgetter(field)
+    return lambda item: by_key(item) if isinstance(item, Mapping) else by_attr(item)
+
+
+class _Accumulator:
+    """Накопитель одного агрегата (count, sum, avg, min, max) за один проход."""
+
+    __slots__ = ('kind', 'getter', 'count', 'value')
+
+    KINDS = ('count', 'sum', 'avg', 'min', 'max')
+
+    def __init__(self, kind: str, getter: Optional[Callable[[Any], Any]]):
+        if kind not in self.KINDS:
+            raise ValueError(f"Неизвестная агрегатная функция: {kind}")
+        self.kind = kind
+        self.getter = getter
+        self.count = 0
+        self.value = None
+
+    def add(self, item) -> None:
+        self.count += 1
+        if self.kind == 'count':
+            return
+        value = self.getter(item)
+        if self.value is None:
+            self.value = value
+        elif self.kind in ('sum', 'avg'):
+            self.value += value
+        elif self.kind == 'min':
+            self.value = min(self.value, value)
+        else:
+            self.value = max(self.value, value)
+
+    def result(self):
+        if self.kind == 'count':
+            return self.count
+        if self.kind == 'sum':
+            return self.value if self.value is not None else 0
+        if self.kind == 'avg':
+            return self.value / self.count if self.count else 0
+        return self.value
+
+
+def _parse_aggregates(specs: dict) -> dict:
+    """Разбирает описания агрегатов: name='count' или name=(поле, 'sum')."""
+    parsed = {}
+    for name, spec in specs.items():
+        if spec == 'count':
+            parsed[name] = ('count', None)
+        else:
+            field, kind = spec
+            parsed[name] = (kind, field_getter(field))
+    return parsed
+
+
+class Query:
+    """
+    Класс Query - неизменяемое описание ленивого запроса.
+
+    Каждый метод-построитель возвращает новый запрос; выполнение происходит
+    только при итерации или вызове завершающего метода (to_list, first,
+    count, aggregate, ...).
+
+    Пример:
+        Query(company.iter_employees) \\
+            .where(lambda e: e.department == "IT") \\
+            .top_k(5, "calculate_salary()") \\
+            .select("name", "calculate_salary()")
+    """
+
+    def __init__(self, source: Union[Iterable, Callable[[], Iterable]], stages: tuple = ()):
+        """
+        Конструктор класса Query.
+
+        Args:
+            source: Итерируемый объект или функция, возвращающая итератор
+            stages: Этапы обработки (функции итератор -> итератор)
+        """
+        self.__source = source
+        self.__stages = stages
+
+    def _then(self, stage: Callable[[Iterator], Iterator]) -> 'Query':
+        return Query(self.__source, self.__stages + (stage,))
+
+    def __iter__(self) -> Iterator:
+        """Выполняет запрос, возвращая итератор результатов."""
+        source = self.__source
+        iterator = iter(source() if callable(source) else source)
+        for stage in self.__stages:
+            iterator = stage(iterator)
+        return iterator
+
+    # Построители
+
+    def where(self, predicate: Optional[Callable[[Any], bool]] = None, **equals) -> 'Query':
+        """
+        Фильтрует элементы.
+
+        Args:
+            predicate: Функция-условие
+            **equals: Условия равенства полей, например department="IT"
+        """
+        getters = [(field_getter(name), value) for name, value in equals.items()]
+
+        def matches(item) -> bool:
+            if predicate is not None and not predicate(item):
+                return False
+            return all(getter(item) == value for getter, value in getters)
+
+        return self._then(lambda iterator: filter(matches, iterator))
+
+    def select(self, *fields: Field, **named: Field) -> 'Query':
+        """
+        Преобразует элементы.
+
+        Одно поле - возвращается его значение; несколько полей - словарь
+        {имя поля: значение}; именованные поля задают ключи словаря явно.
+        """
+        if len(fields) == 1 and not named:
+            getter = field_getter(fields[0])
+            return self._then(lambda iterator: map(getter, iterator))
+        columns = [(name if isinstance(name, str) else getattr(name, '__name__', str(name)),
+                    field_getter(name)) for name in fields]
+        columns += [(name, field_getter(field)) for name, field in named.items()]
+        return self._then(lambda iterator: (
+            {name: getter(item) for name, getter in columns} for item in iterator
+        ))
+
+    def limit(self, n: int) -> 'Query':
+        """Ограничивает результат первыми n элементами (источник дальше не читается)."""
+        return self._then(lambda iterator: islice(iterator, n))
+
+    def top_k(self, k: int, key: Field, largest: bool = True) -> 'Query':
+        """
+        Оставляет k элементов с наибольшим (или наименьшим) значением ключа.
+
+        Используется куча размера k: один проход, O(n log k), значение ключа
+        вычисляется для каждого элемента один раз.
+        """
+        getter = field_getter(key)
+        select = heapq.nlargest if largest else heapq.nsmallest
+
+        def stage(iterator: Iterator) -> Iterator:
+            decorated = ((getter(item), index, item) for index, item in enumerate(iterator))
+            return (item for _, _, item in select(k, decorated))
+
+        return self._then(stage)
+
+    def chunk(self, size: int) -> 'Query':
+        """Группирует элементы в списки по size штук (последний может быть короче)."""
+        if size <= 0:
+            raise ValueError("Размер порции должен быть положительным")
+
+        def stage(iterator: Iterator) -> Iterator[list]:
+            while True:
+                batch = list(islice(iterator, size))
+                if not batch:
+                    return
+                yield batch
+
+        return self._then(stage)
+
+    def group_by(self, key: Field) -> 'GroupedQuery':
+        """Группирует элементы по ключу; результат получают через aggregate()."""
+        return GroupedQuery(self, field_getter(key))
+
+    # Завершающие методы
+
+    def to_list(self) -> list:
+        """Выполняет запрос и возвращает список результатов."""
+        return list(self)
+
+    def first(self, default=None):
+        """Возвращает первый результат (дальше источник не читается)."""
+        return next(iter(self), default)
+
+    def count(self) -> int:
+        """Возвращает количество результатов."""
+        return sum(1 for _ in self)
+
+    def aggregate(self, **specs) -> dict:
+        """
+        Вычисляет агрегаты за один проход.
+
+        Args:
+            **specs: name='count' или name=(поле, 'sum'|'avg'|'min'|'max')
+
+        Returns:
+            Словарь {имя агрегата: значение}
+        """
+        parsed = _parse_aggregates(specs)
+        accumulators = {name: _Accumulator(kind, getter) for name, (kind, getter) in parsed.items()}
+        for item in self:
+            for accumulator in accumulators.values():
+                accumulator.add(item)
+        return {name: accumulator.result() for name, accumulator in accumulators.items()}
+
+
+class GroupedQuery:
+    """Запрос, сгруппированный по ключу."""
+
+    def __init__(self, query: Query, key: Callable[[Any], Any]):
+        self.__query = query
+        self.__key = key
+
+    def aggregate(self, **specs) -> dict:
+        """
+        Вычисляет агрегаты по группам за один проход без хранения элементов.
+
+        Returns:
+            Словарь {ключ группы: {имя агрегата: значение}}
+        """
+        parsed = _parse_aggregates(specs)
+        groups: dict = {}
+        for item in self.__query:
+            group_key = self.__key(item)
+            accumulators = groups.get(group_key)
+            if accumulators is None:
+                accumulators = groups[group_key] = [
+                    (name, _Accumulator(kind, getter)) for name, (kind, getter) in parsed.items()
+                ]
+            for _, accumulator in accumulators:
+                accumulator.add(item)
+        return {group_key: {name: accumulator.result() for name, accumulator in accumulators}
+                for group_key, accumulators in groups.items()}
+
+    def to_dict(self) -> dict:
+        """Возвращает {ключ группы: список элементов}."""
+        groups: dict = {}
+        for item in self.__query:
+            groups.setdefault(self.__key(item), []).append(item)
+        return groups
@@ -0,0 +1,205 @@
+"""
+Модуль упорядоченного индекса значений с запросами ранга и перцентиля.
+
+RankIndex хранит пары (значение, ключ) в отсортированных блоках ограниченного
+размера; количества элементов в блоках поддерживаются деревом Фенвика.
+Ранг, перцентиль и k-й по порядку элемент находятся за O(log n), вставка и
+удаление - за O(log n) плюс сдвиг внутри одного блока.
+"""
+
+import math
+from bisect import bisect_left, insort
+from typing import Hashable, Iterable, Iterator, Optional
+
+
+class RankIndex:
+    """
+    Класс RankIndex - поддерживаемый индекс порядковых статистик.
+
+    Каждому ключу (например, ID сотрудника) соответствует одно значение
+    (например, итоговая зарплата). Ключи должны быть сравнимы между собой:
+    при равных значениях порядок определяется ключом.
+    """
+
+    # Блок делится пополам, когда в нем становится больше 2 * LOAD элементов
+    LOAD = 1000
+
+    def __init__(self, items: Iterable[tuple[Hashable, float]] = ()):
+        """
+        Конструктор класса RankIndex.
+
+        Args:
+            items: Пары (ключ, значение) для начального заполнения
+        """
+        self.__values: dict = dict(items)
+        pairs = sorted((value, key) for key, value in self.__values.items())
+        self.__blocks: list[list[tuple]] = [pairs[i:i + self.LOAD]
+                                            for i in range(0, len(pairs), self.LOAD)]
+        self.__maxes: list[tuple] = [block[-1] for block in self.__blocks]
+        # Дерево Фенвика по размерам блоков; None - требуется перестроение
+        self.__tree: Optional[list[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__values
+
+    def get(self, key, default=None) -> Optional[float]:
+        """Возвращает значение для ключа."""
+        return self.__values.get(key, default)
+
+    def to_dict(self) -> dict:
+        """Возвращает словарь {ключ: значение}."""
+        return dict(self.__values)
+
+    # Дерево Фенвика
+
+    def _tree(self) -> list[int]:
+        """Возвращает дерево Фенвика, при необходимости перестраивая его за O(число блоков)."""
+        if self.__tree is None:
+            tree = [len(block) for block in self.__blocks]
+            for i in range(1, len(tree) + 1):
+                parent = i + (i & -i)
+                if parent <= len(tree):
+                    tree[parent - 1] += tree[i - 1]
+            self.__tree = tree
+        return self.__tree
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        tree = self.__tree
+        if tree is None:
+            return
+        i = block_index + 1
+        while i <= len(tree):
+            tree[i - 1] += delta
+            i += i & -i
+
+    def _count_before_block(self, block_index: int) -> int:
+        """Количество элементов в блоках с номерами меньше block_index."""
+        tree = self._tree()
+        total = 0
+        i = block_index
+        while i > 0:
+            total += tree[i - 1]
+            i &= i - 1
+        return total
+
+    # Изменение
+
+    def update(self, key, value: float) -> None:
+        """Добавляет ключ или изменяет его значение."""
+        if key in self.__values:
+            self._remove_pair((self.__values[key], key))
+        self.__values[key] = value
+        self._insert_pair((value, key))
+
+    def discard(self, key) -> None:
+        """Удаляет ключ, если он есть."""
+        if key in self.__values:
+            self._remove_pair((self.__values.pop(key), key))
+
+    def _insert_pair(self, pair: tuple) -> None:
+        blocks, maxes = self.__blocks, self.__maxes
+        if not blocks:
+            blocks.append([pair])
+            maxes.append(pair)
+            self.__tree = None
+            return
+        i = bisect_left(maxes, pair)
+        if i == len(blocks):
+            i -= 1
+            blocks[i].append(pair)
+            maxes[i] = pair
+        else:
+            insort(blocks[i], pair)
+        block = blocks[i]
+        if len(block) > 2 * self.LOAD:
+            blocks[i:i + 1] = [block[:self.LOAD], block[self.LOAD:]]
+            maxes[i:i + 1] = [block[self.LOAD - 1], block[-1]]
+            self.__tree = None
+        else:
+            self._tree_add(i, 1)
+
+    def _remove_pair(self, pair: tuple) -> None:
+        blocks, maxes = self.__blocks, self.__maxes
+        i = bisect_left(maxes, pair)
+        block = blocks[i]
+        del block[bisect_left(block, pair)]
+        if block:
+            maxes[i] = block[-1]
+            self._tree_add(i, -1)
+        else:
+            del blocks[i]
+            del maxes[i]
+            self.__tree = None
+
+    # Запросы
+
+    def count_less(self, value: float) -> int:
+        """Количество значений строго меньше value (O(log n))."""
+        probe = (value,)
+        i = bisect_left(self.__maxes, probe)
+        count = self._count_before_block(i)
+        if i < len(self.__blocks):
+            count += bisect_left(self.__blocks[i], probe)
+        return count
+
+    def count_less_equal(self, value: float) -> int:
+        """Количество значений, не превосходящих value (O(log n))."""
+        return self.count_less(math.nextafter(value, math.inf))
+
+    def count_greater(self, value: float) -> int:
+        """Количество значений строго больше value (O(log n))."""
+        return len(self.__values) - self.count_less_equal(value)
+
+    def rank(self, value: float) -> int:
+        """
+        Место значения при упорядочивании по убыванию.
+
+        Равные значения получают одинаковое место (1 + число больших значений).
+        """
+        return self.count_greater(value) + 1
+
+    def percentile(self, value: float) -> float:
+        """Доля значений, не превосходящих value, в процентах."""
+        if not self.__values:
+            return 0.0
+        return 100.0 * self.count_less_equal(value) / len(self.__values)
+
+    def select(self, k: int) -> tuple:
+        """
+        Возвращает k-й по возрастанию элемент (нумерация с 0) за O(log n).
+
+        Returns:
+            Пара (значение, ключ)
+        """
+        if not 0 <= k < len(self.__values):
+            raise IndexError("Номер элемента вне диапазона")
+        tree = self._tree()
+        position, remaining = 0, k
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            following = position + step
+            if following <= len(tree) and tree[following - 1] <= remaining:
+                position = following
+                remaining -= tree[following - 1]
+            step >>= 1
+        return self.__blocks[position][remaining]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Значение уровня q (0..1) по ближайшему меньшему рангу; None, если индекс пуст."""
+        if not 0 <= q <= 1:
+            raise ValueError("Уровень квантиля должен быть от 0 до 1")
+        if not self.__values:
+            return None
+        return self.select(int(q * (len(self.__values) - 1)))[0]
+
+    def items(self, reverse: bool = False) -> Iterator[tuple]:
+        """Обходит пары (значение, ключ) по возрастанию (или по убыванию)."""
+        if reverse:
+            for block in reversed(self.__blocks):
+                yield from reversed(block)
+        else:
+            for block in self.__blocks:
+                yield from block
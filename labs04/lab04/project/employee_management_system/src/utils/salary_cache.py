@@ -0,0 +1,82 @@
+"""
+Модуль кэширования итоговой зарплаты сотрудников.
+
+Результат calculate_salary() хранится в самом сотруднике и сбрасывается
+сеттерами полей, влияющих на зарплату (через _notify_salary_change).
+Сравнения, сортировки, отчеты и агрегаты повторно используют сохраненное
+значение. Кэширование можно выключить для отладки; счетчики показывают,
+как часто зарплата пересчитывается.
+"""
+
+from functools import wraps
+
+
+_caching_enabled = True
+
+_stats = {'hits': 0, 'recomputes': 0, 'invalidations': 0}
+
+
+def set_salary_caching(enabled: bool) -> None:
+    """Включает или выключает кэширование итоговой зарплаты."""
+    global _caching_enabled
+    _caching_enabled = bool(enabled)
+
+
+def is_salary_caching_enabled() -> bool:
+    """Возвращает True, если кэширование итоговой зарплаты включено."""
+    return _caching_enabled
+
+
+def get_salary_cache_stats() -> dict:
+    """
+    Возвращает счетчики кэша зарплат.
+
+    Returns:
+        Словарь с количеством попаданий (hits), пересчетов (recomputes),
+        сбросов (invalidations) и долей пересчетов среди всех вызовов
+        (recompute_rate)
+    """
+    stats = dict(_stats)
+    calls = stats['hits'] + stats['recomputes']
+    stats['recompute_rate'] = stats['recomputes'] / calls if calls else 0.0
+    return stats
+
+
+def reset_salary_cache_stats() -> None:
+    """Обнуляет счетчики кэша зарплат."""
+    for name in _stats:
+        _stats[name] = 0
+
+
+def record_invalidation() -> None:
+    """Учитывает сброс сохраненной зарплаты сотрудника."""
+    _stats['invalidations'] += 1
+
+
+def cached_salary(method):
+    """
+    Декоратор calculate_salary: сохраняет результат в атрибуте _salary_cache.
+
+    Применяется к окончательной реализации calculate_salary каждого класса
+    сотрудника. Значение сбрасывается методом _invalidate_salary().
+
+    Args:
+        method: Метод расчета итоговой зарплаты
+
+    Returns:
+        Метод, возвращающий сохраненное значение, пока оно не сброшено
+    """
+    @wraps(method)
+    def wrapper(self) -> float:
+        if _caching_enabled:
+            cached = self._salary_cache
+            if cached is not None:
+                _stats['hits'] += 1
+                return cached
+        _stats['recomputes'] += 1
+        value = method(self)
+        if _caching_enabled:
+            self._salary_cache = value
+        return value
+
+    return wrapper
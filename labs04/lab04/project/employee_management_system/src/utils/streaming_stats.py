@@ -0,0 +1,290 @@
+"""
+Модуль потоковой статистики (один проход, объединяемые частичные результаты).
+
+StreamingStats считает количество, сумму, среднее и дисперсию (алгоритм
+Уэлфорда), минимум, максимум, распределение по порогам и приближенные
+квантили (t-digest) за один проход по данным неограниченной длины.
+Память не зависит от числа значений. Частичные результаты (например, по
+отделам) объединяются методом merge в итог по компании.
+"""
+
+import bisect
+import math
+from typing import Iterable, Optional, Sequence
+
+
+class TDigest:
+    """
+    Класс TDigest - сжатое представление распределения для оценки квантилей.
+
+    Значения хранятся кластерами (центроидами) со средним и весом; у краев
+    распределения кластеры мельче, поэтому хвостовые квантили (p95, p99)
+    оцениваются точнее. Размер ограничен параметром compression.
+    """
+
+    def __init__(self, compression: float = 100):
+        """
+        Конструктор класса TDigest.
+
+        Args:
+            compression: Параметр сжатия (больше - точнее и больше кластеров)
+        """
+        self.__compression = compression
+        self.__centroids: list[list[float]] = []
+        self.__buffer: list[list[float]] = []
+        self.__buffer_limit = max(32, int(compression) * 5)
+        self.__total = 0.0
+        self.__min = math.inf
+        self.__max = -math.inf
+
+    @property
+    def compression(self) -> float:
+        """Параметр сжатия."""
+        return self.__compression
+
+    @property
+    def count(self) -> float:
+        """Общий вес (количество) добавленных значений."""
+        return self.__total
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Добавляет значение с заданным весом."""
+        self.__buffer.append([value, weight])
+        self.__total += weight
+        if value < self.__min:
+            self.__min = value
+        if value > self.__max:
+            self.__max = value
+        if len(self.__buffer) >= self.__buffer_limit:
+            self._compress()
+
+    def merge(self, other: 'TDigest') -> None:
+        """Добавляет к дайджесту все кластеры другого дайджеста."""
+        other._compress()
+        self.__buffer.extend([mean, weight] for mean, weight in other.__centroids)
+        self.__total += other.__total
+        self.__min = min(self.__min, other.__min)
+        self.__max = max(self.__max, other.__max)
+        self._compress()
+
+    def _k(self, q: float) -> float:
+        """Функция масштаба k1: мелкие кластеры у краев распределения."""
+        return self.__compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inverse(self, k: float) -> float:
+        return (math.sin(k * 2 * math.pi / self.__compression) + 1) / 2
+
+    def _compress(self) -> None:
+        """Сливает буфер с кластерами, укрупняя их в пределах функции масштаба."""
+        if not self.__buffer:
+            return
+        points = sorted(self.__centroids + self.__buffer)
+        self.__buffer = []
+        total = sum(weight for _, weight in points)
+        merged = []
+        current_mean, current_weight = points[0]
+        weight_before = 0.0
+        limit = self._k_inverse(self._k(0.0) + 1) * total
+        for mean, weight in points[1:]:
+            if weight_before + current_weight + weight <= limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                merged.append([current_mean, current_weight])
+                weight_before += current_weight
+                limit = self._k_inverse(min(self._k(weight_before / total) + 1,
+                                            self._k(1.0))) * total
+                current_mean, current_weight = mean, weight
+        merged.append([current_mean, current_weight])
+        self.__centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Оценивает квантиль распределения.
+
+        Args:
+            q: Уровень квантиля от 0 до 1
+
+        Returns:
+            Оценка квантиля или None, если значений нет
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Уровень квантиля должен быть от 0 до 1")
+        self._compress()
+        if not self.__centroids:
+            return None
+        if q == 0:
+            return self.__min
+        if q == 1:
+            return self.__max
+        target = q * self.__total
+        # Центр каждого кластера - в середине его веса; между центрами
+        # и крайними значениями - линейная интерполяция
+        previous_position, previous_value = 0.0, self.__min
+        cumulative = 0.0
+        for mean, weight in self.__centroids:
+            position = cumulative + weight / 2
+            if target < position:
+                span = position - previous_position
+                fraction = (target - previous_position) / span if span else 0.0
+                return previous_value + fraction * (mean - previous_value)
+            previous_position, previous_value = position, mean
+            cumulative += weight
+        span = self.__total - previous_position
+        fraction = (target - previous_position) / span if span else 0.0
+        return previous_value + fraction * (self.__max - previous_value)
+
+
+class StreamingStats:
+    """
+    Класс StreamingStats - однопроходный объединяемый агрегатор чисел.
+    """
+
+    def __init__(self, thresholds: Sequence[float] = (), compression: float = 100):
+        """
+        Конструктор класса StreamingStats.
+
+        Args:
+            thresholds: Возрастающие пороги для подсчета распределения
+                        (например, границы зарплатных диапазонов)
+            compression: Параметр сжатия t-digest для квантилей
+        """
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError("Пороги должны быть упорядочены по возрастанию")
+        self.__thresholds = tuple(thresholds)
+        self.__bucket_counts = [0] * (len(self.__thresholds) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__min: Optional[float] = None
+        self.__max: Optional[float] = None
+        self.__digest = TDigest(compression)
+
+    def add(self, value: float) -> None:
+        """Добавляет одно значение."""
+        self.__count += 1
+        self.__total += value
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (value - self.__mean)
+        if self.__min is None or value < self.__min:
+            self.__min = value
+        if self.__max is None or value > self.__max:
+            self.__max = value
+        self.__bucket_counts[bisect.bisect_right(self.__thresholds, value)] += 1
+        self.__digest.add(value)
+
+    def update(self, values: Iterable[float]) -> 'StreamingStats':
+        """Добавляет все значения из итерируемого объекта (в том числе генератора)."""
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: 'StreamingStats') -> 'StreamingStats':
+        """
+        Объединяет с другим агрегатором (параллельная формула Чана).
+
+        Args:
+            other: Агрегатор с теми же порогами
+
+        Returns:
+            self
+        """
+        if other.__thresholds != self.__thresholds:
+            raise ValueError("Объединять можно только агрегаторы с одинаковыми порогами")
+        if other.__count == 0:
+            return self
+        count = self.__count + other.__count
+        delta = other.__mean - self.__mean
+        self.__mean += delta * other.__count / count
+        self.__m2 += other.__m2 + delta * delta * self.__count * other.__count / count
+        self.__count = count
+        self.__total += other.__total
+        self.__min = other.__min if self.__min is None else min(self.__min, other.__min)
+        self.__max = other.__max if self.__max is None else max(self.__max, other.__max)
+        self.__bucket_counts = [a + b for a, b in zip(self.__bucket_counts, other.__bucket_counts)]
+        self.__digest.merge(other.__digest)
+        return self
+
+    @classmethod
+    def combine(cls, parts: Iterable['StreamingStats']) -> 'StreamingStats':
+        """Объединяет несколько частичных агрегаторов в новый."""
+        result = None
+        for part in parts:
+            if result is None:
+                result = cls(part.__thresholds, part.__digest.compression)
+            result.merge(part)
+        return result if result is not None else cls()
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        return self.__total
+
+    @property
+    def mean(self) -> float:
+        return self.__mean
+
+    @property
+    def variance(self) -> float:
+        """Дисперсия генеральной совокупности."""
+        return self.__m2 / self.__count if self.__count else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """Выборочная (несмещенная) дисперсия."""
+        return self.__m2 / (self.__count - 1) if self.__count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> Optional[float]:
+        return self.__min
+
+    @property
+    def max(self) -> Optional[float]:
+        return self.__max
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Приближенный квантиль уровня q (0..1)."""
+        return self.__digest.quantile(q)
+
+    def threshold_counts(self) -> dict[str, int]:
+        """
+        Возвращает количество значений в диапазонах между порогами.
+
+        Returns:
+            Словарь {"< t1": n, "t1..t2": n, ..., ">= tk": n}
+        """
+        if not self.__thresholds:
+            return {"all": self.__count}
+        labels = [f"< {self.__thresholds[0]:g}"]
+        labels += [f"{low:g}..{high:g}" for low, high in zip(self.__thresholds, self.__thresholds[1:])]
+        labels.append(f">= {self.__thresholds[-1]:g}")
+        return dict(zip(labels, self.__bucket_counts))
+
+    def count_at_least(self, threshold: float) -> int:
+        """Количество значений, не меньших одного из заданных порогов."""
+        index = self.__thresholds.index(threshold)
+        return sum(self.__bucket_counts[index + 1:])
+
+    def summary(self) -> dict:
+        """Возвращает все показатели словарем."""
+        return {
+            "count": self.__count,
+            "total": self.__total,
+            "mean": self.__mean,
+            "stddev": self.stddev,
+            "min": self.__min,
+            "max": self.__max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": self.threshold_counts()
+        }
@@ -0,0 +1,52 @@
+import argparse
+import time
+from itertools import islice
+
+from primes import primes, nth_prime
+
+# Сравнение сегментированного решета с прежним генератором (перебор делителей)
+# Запуск: python benchmark_primes.py --count 100000
+
+
+def trial_division_prime_generator():
+    num = 2
+    while True:
+        is_prime = True
+        for i in range(2, int(num ** 0.5) + 1):
+            if num % i == 0:
+                is_prime = False
+                break
+        if is_prime:
+            yield num
+        num += 1
+
+
+def measure(generator, count):
+    start = time.perf_counter()
+    last = None
+    for last in islice(generator, count):
+        pass
+    return time.perf_counter() - start, last
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк генераторов простых чисел")
+    parser.add_argument("--count", type=int, default=100000, help="сколько простых чисел получить")
+    parser.add_argument("--skip-trial", action="store_true", help="не запускать перебор делителей")
+    args = parser.parse_args()
+
+    print(f"Первые {args.count} простых чисел:")
+    sieve_time, sieve_last = measure(primes(), args.count)
+    print(f"  {'Решето (сегменты)':<22} {sieve_time:8.3f} с  последнее: {sieve_last}")
+    if not args.skip_trial:
+        trial_time, trial_last = measure(trial_division_prime_generator(), args.count)
+        print(f"  {'Перебор делителей':<22} {trial_time:8.3f} с  последнее: {trial_last}  "
+              f"(решето быстрее в {trial_time / sieve_time:.0f} раз)")
+
+    start = time.perf_counter()
+    value = nth_prime(1_000_000)
+    print(f"nth_prime(1 000 000) = {value} за {time.perf_counter() - start:.3f} с")
+
+
+if __name__ == "__main__":
+    main()
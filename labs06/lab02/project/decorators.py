@@ -1,12 +1,14 @@
 import time
 from functools import wraps
 
+from memoization import memoize
+
 def timer(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         print(f"Функция {func.__name__} выполнилась за {end_time - start_time:.4f} секунд")
         return result
     return wrapper
@@ -30,18 +32,9 @@ def slow_function():
 def greet(name):
     print(f"Привет, {name}!")
 
-def cache(func):
-    cached_results = {}
-    
-    @wraps(func)
-    def wrapper(*args):
-        if args in cached_results:
-            print(f"Используется кэшированный результат для {args}")
-            return cached_results[args]
-        result = func(*args)
-        cached_results[args] = result
-        return result
-    return wrapper
+def cache(func=None, **options):
+    # Ограниченный потокобезопасный кэш, см. memoization.memoize
+    return memoize(func, **options)
 
 @cache
 def expensive_operation(x):
@@ -57,4 +50,5 @@ print("Кэшированные вычисления:")
 print(expensive_operation(5))
 print(expensive_operation(5))
 print(expensive_operation(10))
+print(expensive_operation.cache_info())
 
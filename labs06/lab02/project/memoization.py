@@ -0,0 +1,346 @@
+import asyncio
+import inspect
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'expirations',
+                                     'coalesced', 'uncacheable', 'maxsize', 'currsize'])
+
+_NOT_FOUND = object()
+# Разделитель позиционных и именованных аргументов в ключе кэша
+_KWD_MARK = object()
+
+
+# Хранилища: get/put/pop/clear, put возвращает число вытесненных записей
+
+class LRUStore:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+
+    def get(self, key):
+        entry = self.data.get(key, _NOT_FOUND)
+        if entry is not _NOT_FOUND:
+            self.data.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.data[key] = entry
+        self.data.move_to_end(key)
+        evicted = 0
+        while self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def pop(self, key):
+        self.data.pop(key, None)
+
+    def clear(self):
+        self.data.clear()
+
+    def __len__(self):
+        return len(self.data)
+
+
+class LFUStore:
+    # O(1) LFU: ключи сгруппированы по частоте, внутри группы - порядок LRU
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = {}
+        self.freq = {}
+        self.buckets = {}
+        self.min_freq = 0
+
+    def _touch(self, key):
+        count = self.freq[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_freq == count:
+                self.min_freq = count + 1
+        self.freq[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key):
+        entry = self.data.get(key, _NOT_FOUND)
+        if entry is not _NOT_FOUND:
+            self._touch(key)
+        return entry
+
+    def put(self, key, entry):
+        if key in self.data:
+            self.data[key] = entry
+            self._touch(key)
+            return 0
+        evicted = 0
+        if self.maxsize is not None:
+            while self.data and len(self.data) >= self.maxsize:
+                victim, _ = self.buckets[self.min_freq].popitem(last=False)
+                if not self.buckets[self.min_freq]:
+                    del self.buckets[self.min_freq]
+                del self.data[victim]
+                del self.freq[victim]
+                evicted += 1
+                if self.data:
+                    self.min_freq = min(self.buckets)
+            if self.maxsize <= 0:
+                return evicted
+        self.data[key] = entry
+        self.freq[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_freq = 1
+        return evicted
+
+    def pop(self, key):
+        if key not in self.data:
+            return
+        count = self.freq.pop(key)
+        del self.data[key]
+        del self.buckets[count][key]
+        if not self.buckets[count]:
+            del self.buckets[count]
+        self.min_freq = min(self.buckets) if self.buckets else 0
+
+    def clear(self):
+        self.data.clear()
+        self.freq.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+
+    def __len__(self):
+        return len(self.data)
+
+
+STORES = {'lru': LRUStore, 'lfu': LFUStore}
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Memoizer:
+    def __init__(self, func, maxsize, policy, ttl, typed, single_flight, clock):
+        if policy not in STORES:
+            raise ValueError(f"Неизвестная политика вытеснения: {policy}")
+        self.func = func
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.typed = typed
+        self.single_flight = single_flight
+        self.clock = clock
+        self.store = STORES[policy](maxsize)
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.stats = dict.fromkeys(['hits', 'misses', 'evictions', 'expirations',
+                                    'coalesced', 'uncacheable'], 0)
+        self.signature = inspect.signature(func)
+        # Быстрый путь: только позиционные аргументы, заданные полностью
+        params = list(self.signature.parameters.values())
+        simple = all(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params)
+        self.positional_count = len(params) if simple else -1
+
+    def make_key(self, args, kwargs):
+        # f(1, 2), f(1, b=2) и f(1) при b=2 по умолчанию дают один ключ
+        if kwargs or len(args) != self.positional_count:
+            bound = self.signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args
+            kwargs = bound.kwargs
+        items = sorted(kwargs.items())
+        key = args
+        if items:
+            # Без разделителя f((1,), (('x', 2),)) и f(1, x=2) дали бы один ключ
+            key += (_KWD_MARK,) + tuple(items)
+        if self.typed:
+            key += tuple(type(value) for value in args)
+            if items:
+                key += tuple(type(value) for _, value in items)
+        hash(key)
+        return key
+
+    def lookup(self, key):
+        # Вызывается под self.lock
+        entry = self.store.get(key)
+        if entry is _NOT_FOUND:
+            return _NOT_FOUND
+        value, expires = entry
+        if expires is not None and self.clock() >= expires:
+            self.store.pop(key)
+            self.stats['expirations'] += 1
+            return _NOT_FOUND
+        self.stats['hits'] += 1
+        return value
+
+    def store_result(self, key, value):
+        # Вызывается под self.lock
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        self.stats['evictions'] += self.store.put(key, (value, expires))
+
+    def call(self, args, kwargs):
+        try:
+            key = self.make_key(args, kwargs)
+        except TypeError:
+            with self.lock:
+                self.stats['uncacheable'] += 1
+            return self.func(*args, **kwargs)
+
+        with self.lock:
+            value = self.lookup(key)
+            if value is not _NOT_FOUND:
+                return value
+            flight = self.flights.get(key) if self.single_flight else None
+            if flight is not None:
+                self.stats['coalesced'] += 1
+            else:
+                self.stats['misses'] += 1
+                if self.single_flight:
+                    self.flights[key] = leader = _Flight()
+
+        if flight is not None:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            value = self.func(*args, **kwargs)
+        except BaseException as error:
+            if self.single_flight:
+                with self.lock:
+                    del self.flights[key]
+                leader.error = error
+                leader.event.set()
+            raise
+        with self.lock:
+            self.store_result(key, value)
+            if self.single_flight:
+                del self.flights[key]
+        if self.single_flight:
+            leader.result = value
+            leader.event.set()
+        return value
+
+    async def call_async(self, args, kwargs):
+        try:
+            key = self.make_key(args, kwargs)
+        except TypeError:
+            with self.lock:
+                self.stats['uncacheable'] += 1
+            return await self.func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            value = self.lookup(key)
+            if value is not _NOT_FOUND:
+                return value
+            flight = self.flights.get(key) if self.single_flight else None
+            if flight is not None and flight.get_loop() is loop:
+                self.stats['coalesced'] += 1
+            else:
+                flight = None
+                self.stats['misses'] += 1
+                if self.single_flight:
+                    self.flights[key] = leader = loop.create_future()
+
+        if flight is not None:
+            return await asyncio.shield(flight)
+
+        try:
+            value = await self.func(*args, **kwargs)
+        except BaseException as error:
+            if self.single_flight:
+                with self.lock:
+                    if self.flights.get(key) is leader:
+                        del self.flights[key]
+                if isinstance(error, asyncio.CancelledError):
+                    leader.cancel()
+                else:
+                    leader.set_exception(error)
+                    leader.exception()  # ожидающих может не быть
+            raise
+        with self.lock:
+            self.store_result(key, value)
+            if self.single_flight and self.flights.get(key) is leader:
+                del self.flights[key]
+        if self.single_flight:
+            leader.set_result(value)
+        return value
+
+    def cache_info(self):
+        with self.lock:
+            return CacheInfo(maxsize=self.maxsize, currsize=len(self.store), **self.stats)
+
+    def cache_clear(self):
+        with self.lock:
+            self.store.clear()
+            for name in self.stats:
+                self.stats[name] = 0
+
+
+def memoize(func=None, *, maxsize=128, policy='lru', ttl=None, typed=False,
+            single_flight=True, clock=time.monotonic):
+    # Использование: @memoize или @memoize(maxsize=1000, policy='lfu', ttl=60)
+    # maxsize=None - без ограничения размера, ttl в секундах
+    def decorator(func):
+        memo = _Memoizer(func, maxsize, policy, ttl, typed, single_flight, clock)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await memo.call_async(args, kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return memo.call(args, kwargs)
+
+        wrapper.cache_info = memo.cache_info
+        wrapper.cache_clear = memo.cache_clear
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+if __name__ == "__main__":
+    @memoize(maxsize=2, policy='lfu')
+    def square(x):
+        return x * x
+
+    for value in [1, 1, 2, 3, 1, 2]:
+        square(value)
+    print(f"LFU: {square.cache_info()}")
+
+    calls = []
+
+    @memoize(ttl=0.05)
+    def slow_salary(base, bonus=0):
+        calls.append(base)
+        time.sleep(0.1)
+        return base + bonus
+
+    threads = [threading.Thread(target=slow_salary, args=(1000,), kwargs={'bonus': 0})
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    slow_salary(1000)
+    print(f"Single-flight: вычислений {len(calls)}, {slow_salary.cache_info()}")
+
+    @memoize
+    async def fetch(x):
+        await asyncio.sleep(0.01)
+        return x * 10
+
+    async def demo():
+        return await asyncio.gather(*(fetch(7) for _ in range(10)))
+
+    print(f"Async: {asyncio.run(demo())[0]}, {fetch.cache_info()}")
@@ -1,4 +1,5 @@
-from functools import reduce
+from structured_logging import log_calls, get_default_logger
+from primes import primes
 
 students = [
     {'name': 'Alice', 'grade': 85, 'age': 20},
@@ -9,43 +10,34 @@ students = [
 ]
 
 def analyze_students(students):
-    if not students:
-        return {'avg_grade': 0, 'excellent': [], 'total': 0}
-    
-    grades = [s['grade'] for s in students]
-    avg_grade = reduce(lambda x, y: x + y, grades) / len(grades)
-    excellent = [s for s in students if s['grade'] >= 90]
-    total = len(students)
+    # Один проход: сумма, количество и отличники считаются одновременно,
+    # поэтому students может быть и генератором
+    total = 0
+    grade_sum = 0
+    excellent = []
+    for s in students:
+        total += 1
+        grade_sum += s['grade']
+        if s['grade'] >= 90:
+            excellent.append(s)
     
     return {
-        'avg_grade': avg_grade,
+        'avg_grade': grade_sum / total if total else 0,
         'excellent': excellent,
         'total': total
     }
 
-def logger(func):
-    def wrapper(*args, **kwargs):
-        print(f"Вызов функции {func.__name__} с аргументами: {args}, {kwargs}")
-        result = func(*args, **kwargs)
-        print(f"Результат: {result}")
-        return result
-    return wrapper
+def logger(func=None, **options):
+    # Вывод выполняется фоновым потоком, см. structured_logging.log_calls
+    return log_calls(func, **options)
 
 @logger
 def add(a, b):
     return a + b
 
 def prime_generator():
-    num = 2
-    while True:
-        is_prime = True
-        for i in range(2, int(num ** 0.5) + 1):
-            if num % i == 0:
-                is_prime = False
-                break
-        if is_prime:
-            yield num
-        num += 1
+    # Сегментированное решето Эратосфена, см. primes.py
+    yield from primes()
 
 print("=== Практические задания ===")
 result = analyze_students(students)
@@ -53,6 +45,7 @@ print(f"Анализ студентов: {result}")
 
 print("\nДекоратор логирования:")
 add(5, 3)
+get_default_logger().flush()
 
 print("\nГенератор простых чисел (первые 10):")
 prime_gen = prime_generator()
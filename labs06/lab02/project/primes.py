@@ -0,0 +1,73 @@
+from itertools import chain, compress, islice
+from math import isqrt
+
+# Сегментированное решето Эратосфена: числа просеиваются блоками по
+# segment_size, на каждый блок - один bytearray. Базовые простые (до корня из
+# верхней границы блока) берутся из такого же генератора, поэтому память
+# ограничена O(segment_size + sqrt(n)).
+
+SEGMENT_SIZE = 1 << 16
+# Базовые простые для следующих блоков берутся из того же генератора; при
+# меньших блоках ему самому пришлось бы заглядывать вперед без конца
+MIN_SEGMENT_SIZE = 16
+
+
+def _check_segment_size(segment_size):
+    if segment_size < MIN_SEGMENT_SIZE:
+        raise ValueError(f"Размер сегмента должен быть не меньше {MIN_SEGMENT_SIZE}")
+
+
+def _sieve_segments(limit=None, segment_size=SEGMENT_SIZE):
+    # Возвращает списки простых по сегментам; limit - граница (не включительно)
+    sieve = bytearray([1]) * segment_size
+    sieve[0:2] = b"\x00\x00"
+    for p in range(2, isqrt(segment_size - 1) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, segment_size, p)))
+    first = range(segment_size if limit is None else min(limit, segment_size))
+    yield list(compress(first, sieve))
+
+    base_primes = []
+    base_source = primes(segment_size) if limit is None or limit > segment_size else iter(())
+    next_base = next(base_source, None)
+    low = segment_size
+    while limit is None or low < limit:
+        high = low + segment_size if limit is None else min(low + segment_size, limit)
+        while next_base is not None and next_base * next_base < high:
+            base_primes.append(next_base)
+            next_base = next(base_source, None)
+        size = high - low
+        sieve = bytearray([1]) * size
+        for p in base_primes:
+            start = max(p * p, (low + p - 1) // p * p) - low
+            if start < size:
+                sieve[start::p] = bytes((size - 1 - start) // p + 1)
+        yield list(compress(range(low, high), sieve))
+        low = high
+
+
+def primes(segment_size=SEGMENT_SIZE):
+    # Бесконечный генератор простых чисел (тот же интерфейс, что у prime_generator)
+    _check_segment_size(segment_size)
+    return chain.from_iterable(_sieve_segments(None, segment_size))
+
+
+def primes_up_to(n, segment_size=SEGMENT_SIZE):
+    # Список простых чисел, не превосходящих n
+    _check_segment_size(segment_size)
+    if n < 2:
+        return []
+    return list(chain.from_iterable(_sieve_segments(n + 1, segment_size)))
+
+
+def nth_prime(k, segment_size=SEGMENT_SIZE):
+    # k-е простое число (nth_prime(1) == 2)
+    if k < 1:
+        raise ValueError("Номер простого числа должен быть положительным")
+    return next(islice(primes(segment_size), k - 1, None))
+
+
+if __name__ == "__main__":
+    print(f"Первые 10: {list(islice(primes(), 10))}")
+    print(f"До 50: {primes_up_to(50)}")
+    print(f"Миллионное простое: {nth_prime(1_000_000)}")
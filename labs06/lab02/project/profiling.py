@@ -0,0 +1,221 @@
+import json
+import math
+import os
+import threading
+from functools import wraps
+from time import perf_counter_ns
+
+# Управление без изменения кода - через переменные окружения:
+#   PROFILE_ENABLED=0      - отключить замеры (декоратор просто вызывает функцию)
+#   PROFILE_SAMPLE_RATE=0.1 - замерять примерно каждый десятый вызов
+# Во время работы можно вызвать configure(...) или configure_from_env()
+
+
+class _Config:
+    enabled = True
+    sample_every = 1
+
+
+config = _Config()
+
+
+def configure(enabled=None, sample_rate=None):
+    if enabled is not None:
+        config.enabled = bool(enabled)
+    if sample_rate is not None:
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate должен быть в диапазоне (0, 1]")
+        config.sample_every = max(1, round(1 / sample_rate))
+
+
+def configure_from_env():
+    enabled = os.environ.get('PROFILE_ENABLED')
+    sample_rate = os.environ.get('PROFILE_SAMPLE_RATE')
+    configure(enabled=None if enabled is None else enabled.lower() not in ('0', 'false', 'no', 'off'),
+              sample_rate=None if sample_rate is None else float(sample_rate))
+
+
+class Histogram:
+    # Лог-линейная гистограмма в стиле HDR: значения до 2**SUB_BITS хранятся
+    # точно, дальше каждая степень двойки делится на 2**(SUB_BITS-1)
+    # интервалов, относительная погрешность не превышает 2**-(SUB_BITS-1)
+    SUB_BITS = 7
+    HALF = 1 << (SUB_BITS - 1)
+
+    def __init__(self):
+        self.counts = {}
+
+    @classmethod
+    def index(cls, value):
+        if value < (1 << cls.SUB_BITS):
+            return value
+        shift = value.bit_length() - cls.SUB_BITS
+        return shift * cls.HALF + (value >> shift)
+
+    @classmethod
+    def bounds(cls, index):
+        if index < (1 << cls.SUB_BITS):
+            return index, index
+        shift = index // cls.HALF - 1
+        mantissa = index - shift * cls.HALF
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value):
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def percentiles(self, *quantiles):
+        total = sum(self.counts.values())
+        if not total:
+            return [0] * len(quantiles)
+        ordered = sorted(self.counts.items())
+        result = []
+        for quantile in quantiles:
+            rank = max(1, math.ceil(quantile * total))
+            seen = 0
+            for index, count in ordered:
+                seen += count
+                if seen >= rank:
+                    low, high = self.bounds(index)
+                    result.append((low + high) // 2)
+                    break
+        return result
+
+
+class FunctionStats:
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = Histogram()
+
+    def reset(self):
+        # Обнуление на месте: обертки profile хранят ссылку на этот объект
+        with self.lock:
+            self.calls = 0
+            self.count = 0
+            self.total_ns = 0
+            self.min_ns = None
+            self.max_ns = 0
+            self.histogram = Histogram()
+
+    def record(self, elapsed):
+        with self.lock:
+            self.count += 1
+            self.total_ns += elapsed
+            if self.min_ns is None or elapsed < self.min_ns:
+                self.min_ns = elapsed
+            if elapsed > self.max_ns:
+                self.max_ns = elapsed
+            self.histogram.record(elapsed)
+
+    def summary(self):
+        with self.lock:
+            p50, p95, p99 = self.histogram.percentiles(0.5, 0.95, 0.99)
+            return {
+                'name': self.name,
+                'calls': self.calls,
+                'count': self.count,
+                'total_ns': self.total_ns,
+                'mean_ns': self.total_ns // self.count if self.count else 0,
+                'min_ns': self.min_ns or 0,
+                'max_ns': self.max_ns,
+                'p50_ns': p50,
+                'p95_ns': p95,
+                'p99_ns': p99
+            }
+
+
+class ProfileRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def get(self, name):
+        stats = self.stats.get(name)
+        if stats is None:
+            with self.lock:
+                stats = self.stats.setdefault(name, FunctionStats(name))
+        return stats
+
+    def summary(self, name=None):
+        if name is not None:
+            return self.stats[name].summary()
+        return [stats.summary() for stats in list(self.stats.values())]
+
+    def reset(self):
+        with self.lock:
+            stats = list(self.stats.values())
+        for function_stats in stats:
+            function_stats.reset()
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.summary(), ensure_ascii=False, **kwargs)
+
+    def report(self, sort_by='total_ns'):
+        rows = sorted(self.summary(), key=lambda row: row[sort_by], reverse=True)
+        header = f"{'Функция':<30} {'вызовов':>9} {'замеров':>9} {'всего, мс':>11} " \
+                 f"{'мин, мкс':>10} {'p50, мкс':>10} {'p95, мкс':>10} {'p99, мкс':>10} {'макс, мкс':>10}"
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            lines.append(
+                f"{row['name']:<30} {row['calls']:>9} {row['count']:>9} {row['total_ns'] / 1e6:>11.3f} "
+                f"{row['min_ns'] / 1e3:>10.2f} {row['p50_ns'] / 1e3:>10.2f} {row['p95_ns'] / 1e3:>10.2f} "
+                f"{row['p99_ns'] / 1e3:>10.2f} {row['max_ns'] / 1e3:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+registry = ProfileRegistry()
+
+
+def profile(func=None, *, name=None, registry=registry):
+    # Использование: @profile или @profile(name="payroll")
+    def decorator(func):
+        stats = registry.get(name or f"{func.__module__}.{func.__qualname__}")
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not config.enabled:
+                return func(*args, **kwargs)
+            # Счетчик вызовов без блокировки: при гонке сдвигается лишь момент выборки
+            stats.calls += 1
+            if stats.calls % config.sample_every:
+                return func(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.record(perf_counter_ns() - start)
+
+        wrapper.profile_stats = stats
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+configure_from_env()
+
+
+if __name__ == "__main__":
+    @profile
+    def fast(x):
+        return x * 2
+
+    @profile(name="sorted_list")
+    def sort_list(n):
+        return sorted(range(n, 0, -1))
+
+    for i in range(100000):
+        fast(i)
+    for n in range(1, 2000, 10):
+        sort_list(n)
+
+    print(registry.report())
+    print(registry.to_json(indent=2)[:300])
@@ -0,0 +1,156 @@
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+from functools import wraps
+
+# Неблокирующее структурированное логирование: вызывающий поток только кладет
+# запись (словарь с исходными объектами) в ограниченную очередь, а
+# форматирование и вывод выполняет фоновый поток. Если очередь заполнена,
+# запись отбрасывается и учитывается в счетчике, вызывающий поток не ждет.
+
+
+def json_formatter(record):
+    # Аргументы и результат превращаются в строки только здесь, в фоновом потоке
+    return json.dumps(record, ensure_ascii=False, default=repr)
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = burst or max(1, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StructuredLogger:
+    _STOP = object()
+
+    def __init__(self, sink=None, formatter=json_formatter, maxsize=10000):
+        self.sink = sink or (lambda line: print(line, file=sys.stdout))
+        self.formatter = formatter
+        self.queue = queue.Queue(maxsize)
+        self.counters = {'enqueued': 0, 'written': 0, 'dropped_full': 0,
+                         'dropped_rate': 0, 'errors': 0}
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._drain, name="structured-logger", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def increment(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def log(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.increment('dropped_full')
+            return False
+        self.increment('enqueued')
+        return True
+
+    def _drain(self):
+        while True:
+            record = self.queue.get()
+            try:
+                if record is self._STOP:
+                    return
+                self.sink(self.formatter(record))
+                self.increment('written')
+            except Exception:
+                self.increment('errors')
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        # Ждет, пока фоновый поток выведет все поставленные в очередь записи
+        if self.thread.is_alive():
+            self.queue.join()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(self._STOP)
+            self.thread.join()
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+        stats['queued'] = self.queue.qsize()
+        return stats
+
+
+default_logger = None
+
+
+def get_default_logger():
+    global default_logger
+    if default_logger is None:
+        default_logger = StructuredLogger()
+    return default_logger
+
+
+def log_calls(func=None, *, logger=None, level='INFO', rate=None, burst=None, log_result=True):
+    # Использование: @log_calls или @log_calls(rate=100, burst=20, level='DEBUG')
+    # rate - не более rate записей в секунду для функции (сверх - отбрасываются)
+    def decorator(func):
+        limiter = TokenBucket(rate, burst) if rate else None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            target = logger or get_default_logger()
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                outcome = {'event': 'error', 'error': error}
+                raise
+            else:
+                outcome = {'event': 'call', 'result': result} if log_result else {'event': 'call'}
+                return result
+            finally:
+                if limiter is None or limiter.allow():
+                    record = {'time': time.time(), 'level': level, 'function': func.__qualname__,
+                              'args': args, 'kwargs': kwargs,
+                              'duration_ns': time.perf_counter_ns() - start}
+                    record.update(outcome)
+                    target.log(record)
+                else:
+                    target.increment('dropped_rate')
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+if __name__ == "__main__":
+    lines = []
+    demo_logger = StructuredLogger(sink=lines.append, maxsize=100)
+
+    @log_calls(logger=demo_logger, rate=50, burst=50)
+    def salary(base, bonus=0):
+        return base + bonus
+
+    start = time.perf_counter()
+    for i in range(10000):
+        salary(i, bonus=10)
+    elapsed = time.perf_counter() - start
+    demo_logger.flush()
+    print(f"10000 вызовов за {elapsed * 1000:.1f} мс, {demo_logger.stats()}")
+    print(lines[0])
@@ -0,0 +1,43 @@
+"""
+Тестирование ключей кэша декоратора memoize
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from memoization import memoize
+
+
+class TestMemoizeKey:
+    """Тесты построения ключа кэша"""
+
+    def test_positional_tuple_does_not_collide_with_kwargs(self):
+        """f((1,), (('x', 2),)) и f(1, x=2) кэшируются раздельно"""
+        @memoize
+        def f(*args, **kwargs):
+            return args, kwargs
+
+        assert f((1,), (('x', 2),)) == (((1,), (('x', 2),)), {})
+        assert f(1, x=2) == ((1,), {'x': 2})
+        assert f.cache_info().misses == 2
+
+    def test_typed_positional_tuple_does_not_collide_with_kwargs(self):
+        """То же для typed=True"""
+        @memoize(typed=True)
+        def f(*args, **kwargs):
+            return args, kwargs
+
+        assert f((1,), (('x', 2),)) == (((1,), (('x', 2),)), {})
+        assert f(1, x=2) == ((1,), {'x': 2})
+        assert f.cache_info().misses == 2
+
+    def test_keyword_and_positional_call_share_key(self):
+        """f(1, 2), f(1, b=2) и f(1) при b=2 по умолчанию дают один ключ"""
+        @memoize
+        def f(a, b=2):
+            return a + b
+
+        assert f(1, 2) == f(1, b=2) == f(1) == 3
+        assert f.cache_info().misses == 1
@@ -6,3 +6,5 @@ from .salesperson import Salesperson
 from .department import Department
 from .project import Project
 from .company import Company
+from .salary_cache import (set_salary_caching, is_salary_caching_enabled,
+                           get_salary_cache_stats, reset_salary_cache_stats)
@@ -2,11 +2,14 @@
 
 from abc import ABC, abstractmethod
 
+from .salary_cache import record_invalidation
+
 
 class AbstractEmployee(ABC):
     """Абстрактный класс для всех типов сотрудников"""
 
     def __init__(self, employee_id: int, name: str, department: str, base_salary: float):
+        self._salary_cache = None
         self.id = employee_id
         self.name = name
         self._department = department
@@ -51,9 +54,16 @@ class AbstractEmployee(ABC):
             raise ValueError("Зарплата не может быть отрицательной")
         old_salary = getattr(self, '_base_salary', None)
         self._base_salary = float(value)
+        self._invalidate_salary()
         if old_salary is not None:
             self._notify(f"Зарплата изменена: {old_salary} -> {value}")
 
+    def _invalidate_salary(self):
+        # Вызывается при изменении любого поля, влияющего на итоговую зарплату
+        if self._salary_cache is not None:
+            self._salary_cache = None
+            record_invalidation()
+
     def add_observer(self, observer):
         self._observers.append(observer)
 
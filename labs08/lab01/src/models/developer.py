@@ -1,6 +1,7 @@
 """Класс разработчика"""
 
 from .employee import Employee
+from .salary_cache import cached_salary
 
 
 class Developer(Employee):
@@ -26,11 +27,13 @@ class Developer(Employee):
     def seniority(self, value: str):
         if value.lower() in self.SENIORITY_COEF:
             self._seniority = value.lower()
+            self._invalidate_salary()
 
     def add_skill(self, skill: str):
         if skill not in self._tech_stack:
             self._tech_stack.append(skill)
 
+    @cached_salary
     def calculate_salary(self) -> float:
         coef = self.SENIORITY_COEF.get(self._seniority, 1.0)
         return self._base_salary * coef + self.calculate_bonus()
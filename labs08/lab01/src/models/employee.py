@@ -1,6 +1,7 @@
 """Класс обычного сотрудника"""
 
 from .abstract_employee import AbstractEmployee
+from .salary_cache import cached_salary
 
 
 class Employee(AbstractEmployee):
@@ -12,12 +13,14 @@ class Employee(AbstractEmployee):
 
     def set_bonus_strategy(self, strategy):
         self._bonus_strategy = strategy
+        self._invalidate_salary()
 
     def calculate_bonus(self) -> float:
         if self._bonus_strategy:
             return self._bonus_strategy.calculate(self)
         return 0.0
 
+    @cached_salary
     def calculate_salary(self) -> float:
         return self._base_salary + self.calculate_bonus()
 
@@ -1,6 +1,7 @@
 """Класс менеджера"""
 
 from .employee import Employee
+from .salary_cache import cached_salary
 
 
 class Manager(Employee):
@@ -20,7 +21,9 @@ class Manager(Employee):
         if value < 0:
             raise ValueError("Бонус не может быть отрицательным")
         self._bonus = float(value)
+        self._invalidate_salary()
 
+    @cached_salary
     def calculate_salary(self) -> float:
         return self._base_salary + self._bonus + self.calculate_bonus()
 
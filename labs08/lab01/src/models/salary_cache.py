@@ -0,0 +1,51 @@
+"""Кэширование итоговой зарплаты сотрудников"""
+
+from functools import wraps
+
+_caching_enabled = True
+_stats = {"hits": 0, "recomputes": 0, "invalidations": 0}
+
+
+def set_salary_caching(enabled: bool):
+    """Включает или выключает кэширование (выключение удобно для отладки)"""
+    global _caching_enabled
+    _caching_enabled = bool(enabled)
+
+
+def is_salary_caching_enabled() -> bool:
+    return _caching_enabled
+
+
+def get_salary_cache_stats() -> dict:
+    stats = dict(_stats)
+    calls = stats["hits"] + stats["recomputes"]
+    stats["recompute_rate"] = stats["recomputes"] / calls if calls else 0.0
+    return stats
+
+
+def reset_salary_cache_stats():
+    for name in _stats:
+        _stats[name] = 0
+
+
+def record_invalidation():
+    _stats["invalidations"] += 1
+
+
+def cached_salary(method):
+    """Декоратор calculate_salary: результат хранится в _salary_cache до сброса"""
+
+    @wraps(method)
+    def wrapper(self) -> float:
+        if _caching_enabled:
+            cached = self._salary_cache
+            if cached is not None:
+                _stats["hits"] += 1
+                return cached
+        _stats["recomputes"] += 1
+        value = method(self)
+        if _caching_enabled:
+            self._salary_cache = value
+        return value
+
+    return wrapper
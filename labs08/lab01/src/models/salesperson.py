@@ -1,6 +1,7 @@
 """Класс продавца"""
 
 from .employee import Employee
+from .salary_cache import cached_salary
 
 
 class Salesperson(Employee):
@@ -22,7 +23,9 @@ class Salesperson(Employee):
 
     def update_sales(self, amount: float):
         self._sales += amount
+        self._invalidate_salary()
 
+    @cached_salary
     def calculate_salary(self) -> float:
         commission = self._sales * self._commission_rate
         return self._base_salary + commission + self.calculate_bonus()
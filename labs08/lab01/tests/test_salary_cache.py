@@ -0,0 +1,114 @@
+"""
+Тестирование кэширования итоговой зарплаты и его инвалидации
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import (Employee, Manager, Developer, Salesperson, Department,
+                    set_salary_caching, is_salary_caching_enabled,
+                    get_salary_cache_stats, reset_salary_cache_stats)
+from patterns.strategy import PerformanceBonus, ProjectBonus
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """Каждый тест начинается с обнуленных счетчиков и включенным кэшем"""
+    reset_salary_cache_stats()
+    set_salary_caching(True)
+    yield
+    set_salary_caching(True)
+
+
+class TestSalaryCache:
+    """Тесты кэша итоговой зарплаты"""
+
+    def test_repeated_calls_use_cache(self):
+        """Повторный вызов не пересчитывает зарплату"""
+        emp = Developer(1, "Alice", "IT", 5000, seniority="senior")
+        assert emp.calculate_salary() == 10000
+        assert emp.calculate_salary() == 10000
+        stats = get_salary_cache_stats()
+        assert stats["recomputes"] == 1
+        assert stats["hits"] == 1
+        assert stats["recompute_rate"] == 0.5
+
+    def test_base_salary_setter_invalidates(self):
+        """Изменение базовой зарплаты сбрасывает кэш"""
+        emp = Employee(1, "Alice", "IT", 5000)
+        emp.calculate_salary()
+        emp.base_salary = 7000
+        assert emp.calculate_salary() == 7000
+        assert get_salary_cache_stats()["invalidations"] == 1
+
+    def test_manager_bonus_setter_invalidates(self):
+        """Изменение бонуса менеджера сбрасывает кэш"""
+        manager = Manager(1, "John", "Management", 5000, 1000)
+        assert manager.calculate_salary() == 6000
+        manager.bonus = 2000
+        assert manager.calculate_salary() == 7000
+
+    def test_developer_seniority_setter_invalidates(self):
+        """Изменение уровня разработчика сбрасывает кэш"""
+        dev = Developer(1, "Alice", "IT", 5000, seniority="junior")
+        assert dev.calculate_salary() == 5000
+        dev.seniority = "middle"
+        assert dev.calculate_salary() == 7500
+
+    def test_salesperson_update_sales_invalidates(self):
+        """Новые продажи сбрасывают кэш"""
+        sp = Salesperson(1, "Bob", "Sales", 3000, 0.1, 10000)
+        assert sp.calculate_salary() == 4000
+        sp.update_sales(5000)
+        assert sp.calculate_salary() == 4500
+
+    def test_strategy_change_invalidates(self):
+        """Смена стратегии бонуса сбрасывает кэш"""
+        emp = Employee(1, "John", "IT", 5000)
+        assert emp.calculate_salary() == 5000
+        emp.set_bonus_strategy(PerformanceBonus(0.2))
+        assert emp.calculate_salary() == 6000
+        emp.set_bonus_strategy(ProjectBonus(500))
+        assert emp.calculate_salary() == 5500
+
+    def test_strategy_sees_new_base_salary(self):
+        """Бонус от базовой зарплаты пересчитывается после ее изменения"""
+        emp = Manager(1, "John", "Management", 5000, 1000)
+        emp.set_bonus_strategy(PerformanceBonus(0.1))
+        assert emp.calculate_salary() == 6500
+        emp.base_salary = 10000
+        assert emp.calculate_salary() == 12000
+
+    def test_sorting_and_totals_reuse_cache(self):
+        """Сортировка и сумма по отделу не пересчитывают неизмененные зарплаты"""
+        dept = Department("IT")
+        employees = [Developer(i, f"Dev{i}", "IT", 1000 * i, seniority="middle")
+                     for i in range(1, 21)]
+        for emp in employees:
+            dept.add_employee(emp)
+        sorted(employees)
+        dept.calculate_total_salary()
+        assert get_salary_cache_stats()["recomputes"] == len(employees)
+
+    def test_disabled_caching_always_recomputes(self):
+        """При выключенном кэше зарплата считается при каждом вызове"""
+        set_salary_caching(False)
+        assert not is_salary_caching_enabled()
+        emp = Employee(1, "Alice", "IT", 5000)
+        emp.calculate_salary()
+        emp.calculate_salary()
+        stats = get_salary_cache_stats()
+        assert stats["recomputes"] == 2
+        assert stats["hits"] == 0
+
+    def test_reenabled_cache_is_not_stale(self):
+        """Изменения при выключенном кэше не оставляют устаревших значений"""
+        emp = Employee(1, "Alice", "IT", 5000)
+        emp.calculate_salary()
+        set_salary_caching(False)
+        emp.base_salary = 8000
+        set_salary_caching(True)
+        assert emp.calculate_salary() == 8000
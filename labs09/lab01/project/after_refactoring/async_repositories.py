@@ -0,0 +1,224 @@
+"""
+Асинхронные репозитории (asyncio) и адаптеры между синхронным
+и асинхронным интерфейсами
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from interfaces import IEmployeeRepository, IAsyncEmployeeRepository
+from repositories import FileEmployeeRepository
+
+
+class AsyncInMemoryEmployeeRepository(IAsyncEmployeeRepository):
+    """Асинхронный репозиторий в памяти"""
+
+    def __init__(self, stream_chunk_size: int = 1000):
+        self._employees = {}
+        self._stream_chunk_size = stream_chunk_size
+
+    async def save(self, employee):
+        self._employees[employee.id] = employee
+
+    async def find_by_id(self, emp_id: int):
+        return self._employees.get(emp_id)
+
+    async def get_all(self) -> list:
+        return list(self._employees.values())
+
+    async def delete(self, emp_id: int):
+        self._employees.pop(emp_id, None)
+
+    async def stream_all(self):
+        employees = list(self._employees.values())
+        for start in range(0, len(employees), self._stream_chunk_size):
+            for emp in employees[start:start + self._stream_chunk_size]:
+                yield emp
+            await asyncio.sleep(0)  # отдаем управление циклу событий между порциями
+
+
+class AsyncFileEmployeeRepository(IAsyncEmployeeRepository):
+    """Асинхронный репозиторий с сохранением в файл
+
+    Файловые операции FileEmployeeRepository выполняются в пуле из
+    max_workers потоков и не блокируют цикл событий. Сохранения,
+    пришедшие во время записи на диск, копятся и записываются следующим
+    одним пакетом (save_many), поэтому параллельные save() дают одну запись.
+    Создается через await AsyncFileEmployeeRepository.open(filename).
+    """
+
+    def __init__(self, repository: FileEmployeeRepository, executor: ThreadPoolExecutor,
+                 stream_chunk_size: int = 1000):
+        self._repository = repository
+        self._executor = executor
+        self._stream_chunk_size = stream_chunk_size
+        self._pending = {}
+        # Пакет, который сейчас записывается в пуле потоков (виден поиску до завершения записи)
+        self._inflight = {}
+        self._pending_batch = None
+        self._flush_task = None
+
+    @classmethod
+    async def open(cls, filename: str, max_workers: int = 1, **options):
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        loop = asyncio.get_running_loop()
+        repository = await loop.run_in_executor(
+            executor, lambda: FileEmployeeRepository(filename, **options))
+        return cls(repository, executor)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _flush_pending(self):
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            batch, self._pending_batch = self._pending_batch, None
+            self._inflight = pending
+            try:
+                results = await self._run(self._repository.save_many, list(pending.values()))
+            except Exception as error:
+                batch.set_exception(error)
+            else:
+                batch.set_result({result.key: result for result in results})
+            finally:
+                self._inflight = {}
+        self._flush_task = None
+
+    async def save(self, employee):
+        loop = asyncio.get_running_loop()
+        self._pending[employee.id] = employee
+        if self._pending_batch is None:
+            self._pending_batch = loop.create_future()
+        batch = self._pending_batch
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_pending())
+        # shield: отмена одного save() не отменяет запись всего пакета
+        result = (await asyncio.shield(batch)).get(employee.id)
+        if result is not None and not result.ok:
+            raise result.error
+
+    async def find_by_id(self, emp_id: int):
+        emp = self._pending.get(emp_id)
+        if emp is None:
+            emp = self._inflight.get(emp_id)
+        if emp is not None:
+            return emp
+        return self._repository.find_by_id(emp_id)
+
+    async def get_all(self) -> list:
+        # Обход словаря репозитория - в потоке пула, где выполняются и записи в него
+        employees = {emp.id: emp for emp in await self._run(self._repository.get_all)}
+        employees.update(self._inflight)
+        employees.update(self._pending)
+        return list(employees.values())
+
+    async def delete(self, emp_id: int):
+        await self.flush()
+        await self._run(self._repository.delete, emp_id)
+
+    async def stream_all(self):
+        employees = await self.get_all()
+        for start in range(0, len(employees), self._stream_chunk_size):
+            for emp in employees[start:start + self._stream_chunk_size]:
+                yield emp
+            await asyncio.sleep(0)
+
+    async def flush(self):
+        """Дожидается записи накопленных сохранений и сбрасывает журнал на диск"""
+        while self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        await self._run(self._repository.flush)
+
+    async def close(self):
+        while self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        await self._run(self._repository.close)
+        self._executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class SyncToAsyncRepository(IAsyncEmployeeRepository):
+    """Адаптер: синхронный репозиторий под асинхронным интерфейсом
+
+    Вызовы выполняются в пуле потоков, чтобы не блокировать цикл событий
+    """
+
+    def __init__(self, repository: IEmployeeRepository, executor: ThreadPoolExecutor = None,
+                 stream_chunk_size: int = 1000):
+        self._repository = repository
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._stream_chunk_size = stream_chunk_size
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def save(self, employee):
+        await self._run(self._repository.save, employee)
+
+    async def find_by_id(self, emp_id: int):
+        return await self._run(self._repository.find_by_id, emp_id)
+
+    async def get_all(self) -> list:
+        return await self._run(self._repository.get_all)
+
+    async def delete(self, emp_id: int):
+        await self._run(self._repository.delete, emp_id)
+
+    async def stream_all(self):
+        employees = await self.get_all()
+        for start in range(0, len(employees), self._stream_chunk_size):
+            for emp in employees[start:start + self._stream_chunk_size]:
+                yield emp
+            await asyncio.sleep(0)
+
+
+class AsyncToSyncRepository(IEmployeeRepository):
+    """Адаптер: асинхронный репозиторий под синхронным интерфейсом
+
+    Корутины выполняются в переданном цикле событий (работающем в другом
+    потоке) или в собственном фоновом цикле. Вызывать из потока этого
+    цикла нельзя - это привело бы к взаимной блокировке.
+    """
+
+    def __init__(self, repository: IAsyncEmployeeRepository, loop: asyncio.AbstractEventLoop = None):
+        self._repository = repository
+        self._own_loop = loop is None
+        if self._own_loop:
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=loop.run_forever, daemon=True)
+            self._thread.start()
+        self._loop = loop
+
+    def _run(self, coroutine):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coroutine.close()
+            raise RuntimeError("AsyncToSyncRepository нельзя вызывать из потока его цикла событий")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def save(self, employee):
+        self._run(self._repository.save(employee))
+
+    def find_by_id(self, emp_id: int):
+        return self._run(self._repository.find_by_id(emp_id))
+
+    def get_all(self) -> list:
+        return self._run(self._repository.get_all())
+
+    def delete(self, emp_id: int):
+        self._run(self._repository.delete(emp_id))
+
+    def close(self):
+        if self._own_loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
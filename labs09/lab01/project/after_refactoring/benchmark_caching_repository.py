@@ -0,0 +1,85 @@
+"""
+Бенчмарк CachingEmployeeRepository при обращениях по закону Ципфа
+Медленный репозиторий имитируется задержкой на каждый find_by_id
+
+Запуск: python benchmark_caching_repository.py --lookups 20000 --latency-ms 0.2
+"""
+
+import argparse
+import itertools
+import random
+import threading
+import time
+
+from employees import Employee
+from repositories import InMemoryEmployeeRepository
+from caching_repository import CachingEmployeeRepository
+
+
+class SlowRepository(InMemoryEmployeeRepository):
+    """Репозиторий в памяти с искусственной задержкой чтения"""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self._latency = latency
+
+    def find_by_id(self, emp_id: int):
+        time.sleep(self._latency)
+        return super().find_by_id(emp_id)
+
+
+def zipf_ids(count: int, population: int, exponent: float, seed: int = 42) -> list:
+    weights = [1 / rank ** exponent for rank in range(1, population + 1)]
+    cumulative = list(itertools.accumulate(weights))
+    ids = list(range(1, population + 1))
+    rnd = random.Random(seed)
+    rnd.shuffle(ids)  # популярные id не должны идти подряд
+    return rnd.choices(ids, cum_weights=cumulative, k=count)
+
+
+def run(repository, ids: list, threads: int) -> float:
+    parts = [ids[i::threads] for i in range(threads)]
+
+    def worker(part):
+        for emp_id in part:
+            repository.find_by_id(emp_id)
+
+    pool = [threading.Thread(target=worker, args=(part,)) for part in parts]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк кэширующего репозитория")
+    parser.add_argument("--employees", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--exponent", type=float, default=1.1, help="параметр распределения Ципфа")
+    parser.add_argument("--latency-ms", type=float, default=0.2)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    backend = SlowRepository(args.latency_ms / 1000)
+    # Часть id отсутствует, чтобы проявился негативный кэш
+    for emp_id in range(1, args.employees + 1):
+        if emp_id % 10:
+            backend.save(Employee(emp_id, f"Сотрудник {emp_id}", "IT", 50000))
+    ids = zipf_ids(args.lookups, args.employees, args.exponent)
+    print(f"Сотрудников: {args.employees}, обращений: {args.lookups}, "
+          f"s = {args.exponent}, потоков: {args.threads}")
+
+    elapsed = run(backend, ids, args.threads)
+    print(f"{'Без кэша':<26} {elapsed:8.3f} с")
+    for max_size in (1000, 10000):
+        cache = CachingEmployeeRepository(backend, max_size=max_size, negative_ttl=60)
+        elapsed = run(cache, ids, args.threads)
+        stats = cache.stats()
+        print(f"{'LRU ' + str(max_size):<26} {elapsed:8.3f} с  попаданий {stats['hit_rate']:.1%}, "
+              f"вытеснений {stats['evictions']}")
+
+
+if __name__ == "__main__":
+    main()
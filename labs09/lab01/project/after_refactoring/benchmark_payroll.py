@@ -0,0 +1,99 @@
+"""
+Бенчмарк параллельного расчета ФОТ
+Сравнивает FinancialCalculator и ParallelPayrollCalculator с разным числом процессов
+
+Пул создается один раз на калькулятор: время первого вызова (с запуском
+пула) выводится отдельно, затем - лучшее время повторных вызовов
+
+Запуск: python benchmark_payroll.py --employees 200000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from employees import Employee, Manager, Developer, Salesperson
+from salary_strategies import (
+    BaseSalaryStrategy, ManagerSalaryStrategy,
+    DeveloperSalaryStrategy, SalespersonSalaryStrategy
+)
+from department import Department
+from managers import FinancialCalculator
+from parallel_payroll import ParallelPayrollCalculator
+
+
+def build_departments(employee_count: int, department_count: int, seed: int = 42) -> list:
+    rnd = random.Random(seed)
+    strategies = {
+        Employee: BaseSalaryStrategy(),
+        Manager: ManagerSalaryStrategy(),
+        Developer: DeveloperSalaryStrategy(),
+        Salesperson: SalespersonSalaryStrategy()
+    }
+    departments = [Department(f"Отдел {i}") for i in range(department_count)]
+    for emp_id in range(1, employee_count + 1):
+        dept = departments[emp_id % department_count]
+        base = float(rnd.randrange(30000, 150000, 500))
+        kind = rnd.choice(list(strategies))
+        strategy = strategies[kind]
+        if kind is Manager:
+            emp = Manager(emp_id, f"Сотрудник {emp_id}", dept.name, base,
+                          bonus=float(rnd.randrange(0, 50000, 1000)), salary_strategy=strategy)
+        elif kind is Developer:
+            emp = Developer(emp_id, f"Сотрудник {emp_id}", dept.name, base,
+                            rnd.choice(["junior", "middle", "senior"]), salary_strategy=strategy)
+        elif kind is Salesperson:
+            emp = Salesperson(emp_id, f"Сотрудник {emp_id}", dept.name, base,
+                              commission_rate=rnd.choice([0.05, 0.1, 0.15]),
+                              sales_volume=float(rnd.randrange(0, 500000, 1000)),
+                              salary_strategy=strategy)
+        else:
+            emp = Employee(emp_id, f"Сотрудник {emp_id}", dept.name, base, salary_strategy=strategy)
+        dept.add_employee(emp)
+    return departments
+
+
+def measure(func, repeat: int):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк параллельного расчета ФОТ")
+    parser.add_argument("--employees", type=int, default=200000)
+    parser.add_argument("--departments", type=int, default=16)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    departments = build_departments(args.employees, args.departments)
+    cpu_count = os.cpu_count() or 1
+    print(f"Сотрудников: {args.employees}, отделов: {args.departments}, ядер: {cpu_count}")
+
+    serial_time, serial_result = measure(
+        lambda: FinancialCalculator.get_salary_by_department(departments), args.repeat)
+    print(f"{'FinancialCalculator':<28} {serial_time:8.3f} с  x1.00")
+
+    worker_counts = sorted({1, 2, 4, 8, cpu_count})
+    for workers in worker_counts:
+        with ParallelPayrollCalculator(max_workers=workers, chunk_size=args.chunk_size,
+                                       serial_threshold=0) as calculator:
+            startup, _ = measure(
+                lambda: calculator.get_salary_by_department(departments), 1)
+            elapsed, result = measure(
+                lambda: calculator.get_salary_by_department(departments), args.repeat)
+        mismatch = max(abs(result[name] - serial_result[name]) for name in serial_result)
+        print(f"{'Параллельно, процессов: ' + str(workers):<28} {elapsed:8.3f} с  "
+              f"x{serial_time / elapsed:.2f}  (первый вызов {startup:.3f} с, "
+              f"расхождение {mismatch:.2e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Бенчмарк конкурентного доступа к репозиториям из нескольких потоков
+Сравнивает InMemoryEmployeeRepository под одной общей блокировкой
+и ConcurrentEmployeeRepository (шарды, copy-on-write только для снимков)
+
+Запуск: python benchmark_repository_contention.py --threads 8 --employees 10000
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from employees import Employee
+from repositories import InMemoryEmployeeRepository, ConcurrentEmployeeRepository
+
+
+class GlobalLockRepository:
+    """InMemoryEmployeeRepository, защищенный одной блокировкой (базовый вариант)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._repository = InMemoryEmployeeRepository()
+
+    def save(self, employee):
+        with self._lock:
+            self._repository.save(employee)
+
+    def delete(self, emp_id: int):
+        with self._lock:
+            self._repository.delete(emp_id)
+
+    def find_by_id(self, emp_id: int):
+        with self._lock:
+            return self._repository.find_by_id(emp_id)
+
+    def get_all(self) -> list:
+        with self._lock:
+            return self._repository.get_all()
+
+    def __iter__(self):
+        return iter(self.get_all())
+
+
+def worker(repository, employees: list, operations: int, scan_every: int, seed: int, errors: list):
+    rnd = random.Random(seed)
+    try:
+        for step in range(operations):
+            emp = rnd.choice(employees)
+            roll = rnd.random()
+            if step % scan_every == 0:
+                sum(1 for _ in repository)
+            elif roll < 0.7:
+                repository.find_by_id(emp.id)
+            elif roll < 0.9:
+                repository.save(emp)
+            else:
+                repository.delete(emp.id)
+    except Exception as error:  # гонки проявляются исключениями при обходе
+        errors.append(error)
+
+
+def run(repository, employees: list, threads: int, operations: int, scan_every: int) -> tuple:
+    for emp in employees:
+        repository.save(emp)
+    errors = []
+    pool = [threading.Thread(target=worker,
+                             args=(repository, employees, operations, scan_every, seed, errors))
+            for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк конкурентного доступа к репозиториям")
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--operations", type=int, default=20000, help="операций на поток")
+    parser.add_argument("--scan-every", type=int, default=1000, help="полный обход каждые N операций")
+    parser.add_argument("--shards", type=int, default=64)
+    args = parser.parse_args()
+
+    employees = [Employee(i, f"Сотрудник {i}", "IT", 50000) for i in range(args.employees)]
+    total_ops = args.threads * args.operations
+    print(f"Сотрудников: {args.employees}, потоков: {args.threads}, операций: {total_ops}")
+
+    for title, repository in (("Одна блокировка", GlobalLockRepository()),
+                              (f"Шарды ({args.shards})", ConcurrentEmployeeRepository(args.shards))):
+        elapsed, errors = run(repository, employees, args.threads, args.operations, args.scan_every)
+        print(f"{title:<18} {elapsed:8.3f} с  {total_ops / elapsed:12,.0f} оп/с  ошибок: {len(errors)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Микробенчмарки расчета зарплаты для каждой стратегии
+Сравнивает вызов через kwargs (strategy.calculate(**params)) и
+закэшированный калькулятор (employee.calculate_salary())
+
+Запуск: python benchmark_salary_dispatch.py --number 1000000
+"""
+
+import argparse
+import timeit
+
+from employees import Employee, Manager, Developer, Salesperson
+from salary_strategies import (
+    BaseSalaryStrategy, ManagerSalaryStrategy,
+    DeveloperSalaryStrategy, SalespersonSalaryStrategy
+)
+
+
+def build_cases() -> list:
+    return [
+        ("BaseSalaryStrategy", Employee(1, "Сергей", "Продажи", 35000,
+                                        salary_strategy=BaseSalaryStrategy())),
+        ("ManagerSalaryStrategy", Manager(2, "Петр", "IT", 80000, bonus=20000,
+                                          salary_strategy=ManagerSalaryStrategy())),
+        ("DeveloperSalaryStrategy", Developer(3, "Иван", "IT", 50000, "senior",
+                                              salary_strategy=DeveloperSalaryStrategy())),
+        ("SalespersonSalaryStrategy", Salesperson(4, "Анна", "Продажи", 40000, 0.1, 100000,
+                                                  salary_strategy=SalespersonSalaryStrategy())),
+    ]
+
+
+def kwargs_dispatch(employee):
+    # Прежний путь: новый словарь параметров и разбор kwargs на каждый вызов
+    return employee.salary_strategy.calculate(employee.base_salary, **employee._get_salary_params())
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Микробенчмарки стратегий расчета зарплаты")
+    parser.add_argument("--number", type=int, default=1000000, help="вызовов в одном замере")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Стратегия':<28} {'kwargs, нс':>12} {'bind, нс':>12} {'ускорение':>10}")
+    for title, employee in build_cases():
+        assert kwargs_dispatch(employee) == employee.calculate_salary()
+        old = best_of(lambda: kwargs_dispatch(employee), args.number, args.repeat)
+        new = best_of(employee.calculate_salary, args.number, args.repeat)
+        print(f"{title:<28} {old:>12.1f} {new:>12.1f} {old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Бенчмарк SqliteEmployeeRepository против FileEmployeeRepository
+Массовая загрузка, повторное открытие, поиск по id и по отделу
+
+Запуск: python benchmark_sqlite_repository.py --employees 1000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from employees import Employee, Manager, Developer, Salesperson
+from repositories import FileEmployeeRepository, SqliteEmployeeRepository
+
+DEPARTMENTS = ["IT", "Продажи", "Финансы", "HR", "Маркетинг", "Поддержка"]
+
+
+def build_employees(count: int, seed: int = 42) -> list:
+    rnd = random.Random(seed)
+    employees = []
+    for emp_id in range(1, count + 1):
+        dept = DEPARTMENTS[emp_id % len(DEPARTMENTS)]
+        base = float(rnd.randrange(30000, 150000, 500))
+        kind = emp_id % 4
+        if kind == 0:
+            emp = Manager(emp_id, f"Сотрудник {emp_id}", dept, base, bonus=10000.0)
+        elif kind == 1:
+            emp = Developer(emp_id, f"Сотрудник {emp_id}", dept, base,
+                            rnd.choice(["junior", "middle", "senior"]), ["Python", "SQL"])
+        elif kind == 2:
+            emp = Salesperson(emp_id, f"Сотрудник {emp_id}", dept, base, 0.1, 200000.0)
+        else:
+            emp = Employee(emp_id, f"Сотрудник {emp_id}", dept, base)
+        employees.append(emp)
+    return employees
+
+
+def timed(title: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {title:<32} {time.perf_counter() - start:8.3f} с")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк SQLite-репозитория")
+    parser.add_argument("--employees", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    employees = build_employees(args.employees)
+    ids = random.Random(1).sample(range(1, args.employees + 1), min(args.lookups, args.employees))
+    workdir = tempfile.mkdtemp()
+    print(f"Сотрудников: {args.employees}, поисков по id: {len(ids)}")
+    try:
+        print("FileEmployeeRepository (WAL):")
+        path = os.path.join(workdir, "employees.json")
+        repository = FileEmployeeRepository(path, sync_mode='close')
+
+        def load_file():
+            for emp in employees:
+                repository.save(emp)
+            repository.close()
+        timed("Массовая загрузка", load_file)
+        repository = timed("Открытие (восстановление)", lambda: FileEmployeeRepository(path))
+        timed("Поиск по id", lambda: [repository.find_by_id(i) for i in ids])
+        timed("Поиск по отделу (перебор)",
+              lambda: [e for e in repository.get_all() if e.department == "IT"])
+        repository.close()
+
+        print("SqliteEmployeeRepository:")
+        path = os.path.join(workdir, "employees.db")
+        repository = SqliteEmployeeRepository(path)
+        timed("Массовая загрузка", lambda: repository.save_many(employees))
+        repository.close()
+        repository = timed("Открытие", lambda: SqliteEmployeeRepository(path))
+        timed("Поиск по id", lambda: [repository.find_by_id(i) for i in ids])
+        timed("Поиск по отделу (индекс)", lambda: repository.find_by_department("IT"))
+        repository.close()
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Кэширующий репозиторий (паттерн Декоратор поверх IEmployeeRepository)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from interfaces import IEmployeeRepository
+
+_MISSING = object()  # отметка об отсутствии сотрудника (негативный кэш)
+
+
+class CachingEmployeeRepository(IEmployeeRepository):
+    """Кэш чтений find_by_id поверх любого репозитория
+
+    max_size - емкость LRU-кэша, ttl - время жизни записи в секундах
+    (None - без ограничения), negative_ttl - время жизни отметки
+    "не найден" (0 - не кэшировать отсутствующих).
+
+    write_policy:
+        'through' - save/delete сразу выполняются в репозитории;
+        'behind'  - save обновляет кэш и ставит запись в очередь, очередь
+                    сбрасывается пакетом save_many фоновым потоком раз в
+                    flush_interval секунд, при накоплении batch_size записей
+                    и при flush()/close(). Ошибка фонового сброса не теряется:
+                    она сохраняется в last_flush_error и учитывается в
+                    stats()['flush_errors'], а записи остаются в очереди.
+    """
+
+    WRITE_POLICIES = ('through', 'behind')
+
+    def __init__(self, repository: IEmployeeRepository, max_size: int = 10000,
+                 ttl: float = None, negative_ttl: float = 0, write_policy: str = 'through',
+                 flush_interval: float = 1.0, batch_size: int = 1000, clock=time.monotonic):
+        if write_policy not in self.WRITE_POLICIES:
+            raise ValueError(f"Неизвестная политика записи: {write_policy}")
+        self._repository = repository
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._write_policy = write_policy
+        self._batch_size = batch_size
+        self._clock = clock
+        self._cache = OrderedDict()  # id -> (сотрудник или _MISSING, срок годности)
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._stats = {'hits': 0, 'misses': 0, 'negative_hits': 0,
+                       'evictions': 0, 'expirations': 0, 'writes': 0}
+        self._pending = {}
+        self._inflight = {}  # пакет, который сейчас записывается save_many
+        self._flush_errors = 0
+        self.last_flush_error = None
+        self._write_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = None
+        if write_policy == 'behind':
+            self._flush_interval = flush_interval
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+
+    # Кэш
+
+    def _expires(self, ttl: float):
+        return None if ttl is None else self._clock() + ttl
+
+    def _put(self, emp_id: int, value, ttl: float):
+        self._cache[emp_id] = (value, self._expires(ttl))
+        self._cache.move_to_end(emp_id)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _lookup(self, emp_id: int):
+        """Возвращает значение из кэша или None, если записи нет или она устарела"""
+        entry = self._cache.get(emp_id)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and self._clock() >= expires:
+            del self._cache[emp_id]
+            self._stats['expirations'] += 1
+            return None
+        self._cache.move_to_end(emp_id)
+        return value
+
+    def find_by_id(self, emp_id: int):
+        with self._lock:
+            value = self._lookup(emp_id)
+            if value is _MISSING:
+                self._stats['negative_hits'] += 1
+                return None
+            if value is None:
+                # Вытесненная из кэша, но еще не записанная версия
+                value = self._pending.get(emp_id)
+            if value is None:
+                value = self._inflight.get(emp_id)
+            if value is not None:
+                self._stats['hits'] += 1
+                return value
+            self._stats['misses'] += 1
+            generation = self._generation
+
+        employee = self._repository.find_by_id(emp_id)
+
+        with self._lock:
+            # Запись во время чтения из репозитория делает результат устаревшим
+            if generation == self._generation:
+                if employee is not None:
+                    self._put(emp_id, employee, self._ttl)
+                elif self._negative_ttl:
+                    self._put(emp_id, _MISSING, self._negative_ttl)
+        return employee
+
+    def invalidate(self, emp_id: int = None):
+        """Удаляет запись (или весь кэш) без изменения репозитория"""
+        with self._lock:
+            self._generation += 1
+            if emp_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(emp_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._cache)
+            stats['pending'] = len(self._pending) + len(self._inflight)
+            stats['flush_errors'] = self._flush_errors
+        lookups = stats['hits'] + stats['negative_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['negative_hits']) / lookups if lookups else 0.0
+        return stats
+
+    # Запись
+
+    def save(self, employee):
+        if self._write_policy == 'through':
+            self._save_through(employee)
+            return
+        with self._lock:
+            self._generation += 1
+            self._put(employee.id, employee, self._ttl)
+            self._pending[employee.id] = employee
+            flush_now = len(self._pending) >= self._batch_size
+        if flush_now:
+            self.flush()
+
+    def _save_through(self, employee):
+        """Сначала репозиторий, затем кэш
+
+        Записи в репозиторий идут под _write_lock, поэтому кэш получает
+        версию последней завершившейся записи; если за время записи кэш
+        сбрасывали (invalidate), запись в нем удаляется.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._generation += 1
+                generation = self._generation
+            try:
+                self._repository.save(employee)
+            except BaseException:
+                # Состояние в репозитории неизвестно - прежняя версия в кэше ненадежна
+                with self._lock:
+                    self._cache.pop(employee.id, None)
+                raise
+            with self._lock:
+                self._stats['writes'] += 1
+                if generation == self._generation:
+                    self._put(employee.id, employee, self._ttl)
+                else:
+                    self._cache.pop(employee.id, None)
+
+    def delete(self, emp_id: int):
+        with self._lock:
+            self._generation += 1
+            self._cache.pop(emp_id, None)
+            self._pending.pop(emp_id, None)
+            self._inflight.pop(emp_id, None)
+        with self._write_lock:
+            self._repository.delete(emp_id)
+        with self._lock:
+            # Чтение, начатое до удаления в репозитории, могло закэшировать старую версию
+            self._generation += 1
+            self._cache.pop(emp_id, None)
+
+    def get_all(self) -> list:
+        self.flush()
+        return self._repository.get_all()
+
+    def flush(self):
+        """Записывает накопленные при write_policy='behind' изменения"""
+        with self._write_lock:
+            with self._lock:
+                # Пакет остается видимым для find_by_id, пока save_many не завершится
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+            if not pending:
+                return
+            try:
+                results = self._repository.save_many(list(pending.values()))
+            except BaseException:
+                with self._lock:
+                    for emp_id, employee in pending.items():
+                        self._pending.setdefault(emp_id, employee)
+                    self._inflight = {}
+                raise
+            with self._lock:
+                self._inflight = {}
+                for result in results:
+                    if result.ok:
+                        self._stats['writes'] += 1
+                    else:
+                        # Несохраненный сотрудник не должен оставаться в кэше
+                        self._cache.pop(result.key, None)
+
+    def _flush_loop(self):
+        while not self._closed.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as error:
+                # Записи остаются в очереди до следующей попытки
+                with self._lock:
+                    self._flush_errors += 1
+                    self.last_flush_error = error
+            else:
+                self.last_flush_error = None
+
+    def close(self):
+        """Останавливает фоновый сброс и записывает очередь (ошибка записи пробрасывается)"""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -18,6 +18,7 @@ class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ISerializable):
         self._department = department
         self._base_salary = base_salary
         self._salary_strategy = salary_strategy or BaseSalaryStrategy()
+        self._calculator = None
 
     @property
     def id(self) -> int:
@@ -35,13 +36,36 @@ class AbstractEmployee(ISalaryCalculable, IInfoProvidable, ISerializable):
     def base_salary(self) -> float:
         return self._base_salary
 
+    @property
+    def salary_strategy(self) -> SalaryStrategy:
+        return self._salary_strategy
+
+    @salary_strategy.setter
+    def salary_strategy(self, strategy: SalaryStrategy):
+        self._salary_strategy = strategy
+        self._invalidate_salary()
+
     def calculate_salary(self) -> float:
-        return self._salary_strategy.calculate(self._base_salary, **self._get_salary_params())
+        calculator = self._calculator
+        if calculator is None:
+            calculator = self._calculator = self._salary_strategy.bind(
+                self._base_salary, **self._get_salary_params())
+        return calculator()
+
+    def _invalidate_salary(self):
+        """Вызывается при изменении любого параметра расчета зарплаты"""
+        self._calculator = None
 
     def _get_salary_params(self) -> dict:
         """Переопределяется в дочерних классах"""
         return {}
 
+    def __getstate__(self) -> dict:
+        # Калькулятор - замыкание, его нельзя сериализовать; он пересоздается при расчете
+        state = self.__dict__.copy()
+        state['_calculator'] = None
+        return state
+
     @abstractmethod
     def get_info(self) -> str:
         pass
@@ -146,6 +170,7 @@ class Salesperson(AbstractEmployee):
 
     def update_sales(self, amount: float):
         self._sales_volume += amount
+        self._invalidate_salary()
 
     def _get_salary_params(self) -> dict:
         return {
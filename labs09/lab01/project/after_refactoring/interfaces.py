@@ -3,6 +3,7 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 
 
 class ISalaryCalculable(ABC):
@@ -37,6 +38,13 @@ class ISerializable(ABC):
         pass
 
 
+BatchResult = namedtuple('BatchResult', ['key', 'ok', 'value', 'error'])
+BatchResult.__doc__ = """Результат пакетной операции для одного элемента
+
+key - id сотрудника, ok - успех, value - найденный сотрудник, error - исключение
+"""
+
+
 class IEmployeeRepository(ABC):
     """Интерфейс репозитория сотрудников (DIP)"""
 
@@ -51,3 +59,72 @@ class IEmployeeRepository(ABC):
     @abstractmethod
     def get_all(self) -> list:
         pass
+
+    @abstractmethod
+    def delete(self, emp_id: int):
+        pass
+
+    def save_many(self, employees) -> list:
+        """Сохраняет сотрудников; ошибка одного не прерывает остальных"""
+        results = []
+        for emp in employees:
+            try:
+                self.save(emp)
+                results.append(BatchResult(emp.id, True, emp, None))
+            except Exception as error:
+                results.append(BatchResult(getattr(emp, 'id', None), False, emp, error))
+        return results
+
+    def find_many(self, emp_ids) -> list:
+        """Ищет сотрудников по списку id (ok=False, если сотрудник не найден)"""
+        results = []
+        for emp_id in emp_ids:
+            try:
+                emp = self.find_by_id(emp_id)
+            except Exception as error:
+                results.append(BatchResult(emp_id, False, None, error))
+                continue
+            if emp is None:
+                results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+            else:
+                results.append(BatchResult(emp_id, True, emp, None))
+        return results
+
+    def delete_many(self, emp_ids) -> list:
+        """Удаляет сотрудников по списку id (ok=False, если сотрудник не найден)"""
+        results = []
+        for emp_id in emp_ids:
+            try:
+                if self.find_by_id(emp_id) is None:
+                    results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+                    continue
+                self.delete(emp_id)
+                results.append(BatchResult(emp_id, True, None, None))
+            except Exception as error:
+                results.append(BatchResult(emp_id, False, None, error))
+        return results
+
+
+class IAsyncEmployeeRepository(ABC):
+    """Асинхронный интерфейс репозитория сотрудников (для asyncio)"""
+
+    @abstractmethod
+    async def save(self, employee):
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, emp_id: int):
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> list:
+        pass
+
+    @abstractmethod
+    async def delete(self, emp_id: int):
+        pass
+
+    @abstractmethod
+    def stream_all(self):
+        """Асинхронный итератор по сотрудникам (async for)"""
+        pass
@@ -48,8 +48,9 @@ def main():
         print("Ошибки:", errors)
 
     # Сохраняем в репозиторий (DIP)
-    for emp in [emp1, emp2, emp3, emp4, emp5]:
-        repository.save(emp)
+    for result in repository.save_many([emp1, emp2, emp3, emp4, emp5]):
+        if not result.ok:
+            print(f"Не удалось сохранить сотрудника {result.key}: {result.error}")
 
     # Создаем отделы
     it_dept = Department("IT")
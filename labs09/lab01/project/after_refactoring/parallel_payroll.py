@@ -0,0 +1,89 @@
+"""
+Параллельный расчет фонда оплаты труда (пул процессов)
+Сотрудники делятся на порции, порции считаются в отдельных процессах
+"""
+
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _calculate_chunk(employees) -> float:
+    """Считает сумму зарплат порции сотрудников (выполняется в дочернем процессе)"""
+    return math.fsum(emp.calculate_salary() for emp in employees)
+
+
+class ParallelPayrollCalculator:
+    """Расчет ФОТ на пуле процессов с последовательным режимом для малых объемов
+
+    Интерфейс совпадает с FinancialCalculator.calculate_total_salary и
+    get_salary_by_department. Порции суммируются через math.fsum и
+    объединяются в фиксированном порядке, поэтому результат не зависит
+    от числа процессов и порядка их завершения и совпадает с
+    последовательным режимом.
+
+    Пул создается при первом параллельном расчете и переиспользуется до
+    close(). Каждая порция передается процессу внутри своей задачи, поэтому
+    калькулятор можно вызывать из нескольких потоков одновременно.
+    """
+
+    def __init__(self, max_workers: int = None, chunk_size: int = 10000,
+                 serial_threshold: int = 50000):
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._serial_threshold = serial_threshold
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+    def close(self):
+        """Останавливает пул процессов"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _split(self, groups: list) -> list:
+        """Делит списки сотрудников на порции: [(номер группы, порция), ...]"""
+        chunks = []
+        for index, employees in enumerate(groups):
+            for start in range(0, len(employees), self._chunk_size):
+                chunks.append((index, employees[start:start + self._chunk_size]))
+        return chunks
+
+    def _calculate_groups(self, groups: list) -> list:
+        """Возвращает сумму зарплат для каждого списка сотрудников"""
+        chunks = self._split(groups)
+        total_count = sum(len(employees) for employees in groups)
+        if total_count < self._serial_threshold:
+            sums = [_calculate_chunk(chunk) for _, chunk in chunks]
+        else:
+            # map сохраняет порядок порций независимо от порядка завершения
+            sums = list(self._get_executor().map(_calculate_chunk,
+                                                 [chunk for _, chunk in chunks]))
+
+        partials = [[] for _ in groups]
+        for (index, _), chunk_sum in zip(chunks, sums):
+            partials[index].append(chunk_sum)
+        return [math.fsum(values) for values in partials]
+
+    def calculate_total_salary(self, employees: list) -> float:
+        return self._calculate_groups([list(employees)])[0]
+
+    def get_salary_by_department(self, departments: list) -> dict:
+        totals = self._calculate_groups([dept.get_employees() for dept in departments])
+        result = {}
+        for dept, total in zip(departments, totals):
+            result[dept.name] = total
+        return result
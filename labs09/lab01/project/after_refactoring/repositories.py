@@ -2,7 +2,14 @@
 Репозитории (DIP - инверсия зависимостей)
 """
 
-from interfaces import IEmployeeRepository
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from interfaces import IEmployeeRepository, BatchResult
 
 
 class InMemoryEmployeeRepository(IEmployeeRepository):
@@ -24,17 +31,184 @@ class InMemoryEmployeeRepository(IEmployeeRepository):
         if emp_id in self._employees:
             del self._employees[emp_id]
 
+    def save_many(self, employees) -> list:
+        results = []
+        for emp in employees:
+            try:
+                self._employees[emp.id] = emp
+                results.append(BatchResult(emp.id, True, emp, None))
+            except Exception as error:
+                results.append(BatchResult(getattr(emp, 'id', None), False, emp, error))
+        return results
+
+    def find_many(self, emp_ids) -> list:
+        results = []
+        for emp_id in emp_ids:
+            emp = self._employees.get(emp_id)
+            if emp is None:
+                results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+            else:
+                results.append(BatchResult(emp_id, True, emp, None))
+        return results
+
+    def delete_many(self, emp_ids) -> list:
+        results = []
+        for emp_id in emp_ids:
+            if self._employees.pop(emp_id, None) is None:
+                results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+            else:
+                results.append(BatchResult(emp_id, True, None, None))
+        return results
+
 
 class FileEmployeeRepository(IEmployeeRepository):
-    """Репозиторий с сохранением в файл"""
+    """Репозиторий с сохранением в файл через журнал упреждающей записи (WAL)
+
+    Изменения дописываются в журнал <filename>.wal по одной JSON-строке
+    ({"op": "upsert", "employee": {...}} или {"op": "delete", "id": ...}),
+    поэтому сохранение стоит O(1), а не перезапись всего файла.
+    Файл filename хранит снимок в прежнем формате {'employees': [...]};
+    compact() переносит журнал в снимок. При открытии снимок загружается,
+    журнал проигрывается, недописанная при сбое последняя строка отбрасывается;
+    поврежденная строка в середине журнала вызывает ValueError.
+
+    sync_mode - когда выполнять fsync журнала:
+        'always'   - после каждой записи;
+        'interval' - не чаще раза в sync_interval_ms; запись, после которой
+                     fsync не выполнен, ставит таймер, поэтому данные попадают
+                     на диск не позже чем через sync_interval_ms;
+        'close'    - только при close()/flush() (данные в буфере ОС могут
+                     потеряться при сбое питания, но не при падении процесса
+                     после flush()).
+    """
 
-    def __init__(self, filename: str):
+    SYNC_MODES = ('always', 'interval', 'close')
+
+    def __init__(self, filename: str, sync_mode: str = 'interval', sync_interval_ms: int = 100,
+                 compact_ratio: float = 2.0, compact_min_records: int = 10000):
+        if sync_mode not in self.SYNC_MODES:
+            raise ValueError(f"Неизвестный режим синхронизации: {sync_mode}")
         self._filename = filename
+        self._wal_filename = filename + '.wal'
+        self._sync_mode = sync_mode
+        self._sync_interval = sync_interval_ms / 1000
+        self._compact_ratio = compact_ratio
+        self._compact_min_records = compact_min_records
         self._employees = {}
+        self._wal_records = 0
+        self._recover()
+        self._wal = open(self._wal_filename, 'a', encoding='utf-8')
+        self._last_sync = time.monotonic()
+        # Таймер отложенного fsync для режима 'interval' работает в своем потоке
+        self._wal_lock = threading.RLock()
+        self._sync_timer = None
+
+    def _recover(self):
+        from serializers import JsonSerializer, EmployeeSerializer
+        tmp_filename = self._filename + '.tmp'
+        if os.path.exists(tmp_filename):  # сбой во время compact() до замены снимка
+            os.remove(tmp_filename)
+        if os.path.exists(self._filename):
+            for data in JsonSerializer.load(self._filename).get('employees', []):
+                self._employees[data['id']] = EmployeeSerializer.deserialize(data)
+        if not os.path.exists(self._wal_filename):
+            return
+        valid_size = 0
+        with open(self._wal_filename, 'rb') as f:
+            for number, line in enumerate(f, 1):
+                if not line.endswith(b'\n'):
+                    break  # строка без перевода строки может быть только последней
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    raise ValueError(f"Журнал {self._wal_filename} поврежден "
+                                     f"в строке {number}") from None
+                self._apply(record)
+                self._wal_records += 1
+                valid_size += len(line)
+        if valid_size != os.path.getsize(self._wal_filename):
+            with open(self._wal_filename, 'r+b') as f:
+                f.truncate(valid_size)
+
+    def _apply(self, record: dict):
+        from serializers import EmployeeSerializer
+        if record['op'] == 'upsert':
+            employee = EmployeeSerializer.deserialize(record['employee'])
+            self._employees[employee.id] = employee
+        elif record['op'] == 'delete':
+            self._employees.pop(record['id'], None)
+
+    def _append(self, *records: dict):
+        if not records:
+            return
+        with self._wal_lock:
+            self._wal.write(''.join(json.dumps(record, ensure_ascii=False) + '\n'
+                                    for record in records))
+            self._wal_records += len(records)
+            if self._sync_mode == 'always':
+                self._sync()
+            elif self._sync_mode == 'interval':
+                elapsed = time.monotonic() - self._last_sync
+                if elapsed >= self._sync_interval:
+                    self._sync()
+                elif self._sync_timer is None:
+                    self._sync_timer = threading.Timer(self._sync_interval - elapsed,
+                                                       self._timed_sync)
+                    self._sync_timer.daemon = True
+                    self._sync_timer.start()
+            if self._wal_records > max(self._compact_min_records,
+                                       self._compact_ratio * len(self._employees)):
+                self.compact()
+
+    def _timed_sync(self):
+        with self._wal_lock:
+            self._sync_timer = None
+            if not self._wal.closed:
+                self._sync()
+
+    def _sync(self):
+        with self._wal_lock:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._last_sync = time.monotonic()
 
     def save(self, employee):
         self._employees[employee.id] = employee
-        self._save_to_file()
+        self._append({'op': 'upsert', 'employee': employee.to_dict()})
+
+    def delete(self, emp_id: int):
+        if emp_id in self._employees:
+            del self._employees[emp_id]
+            self._append({'op': 'delete', 'id': emp_id})
+
+    def save_many(self, employees) -> list:
+        """Сохраняет сотрудников одной записью в журнал"""
+        results = []
+        records = []
+        for emp in employees:
+            try:
+                record = {'op': 'upsert', 'employee': emp.to_dict()}
+            except Exception as error:
+                results.append(BatchResult(getattr(emp, 'id', None), False, emp, error))
+                continue
+            self._employees[emp.id] = emp
+            records.append(record)
+            results.append(BatchResult(emp.id, True, emp, None))
+        self._append(*records)
+        return results
+
+    def delete_many(self, emp_ids) -> list:
+        """Удаляет сотрудников одной записью в журнал"""
+        results = []
+        records = []
+        for emp_id in emp_ids:
+            if self._employees.pop(emp_id, None) is None:
+                results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+            else:
+                records.append({'op': 'delete', 'id': emp_id})
+                results.append(BatchResult(emp_id, True, None, None))
+        self._append(*records)
+        return results
 
     def find_by_id(self, emp_id: int):
         return self._employees.get(emp_id)
@@ -42,7 +216,425 @@ class FileEmployeeRepository(IEmployeeRepository):
     def get_all(self) -> list:
         return list(self._employees.values())
 
-    def _save_to_file(self):
-        from serializers import JsonSerializer
-        data = [emp.to_dict() for emp in self._employees.values()]
-        JsonSerializer.save({'employees': data}, self._filename)
+    def flush(self):
+        """Принудительно сбрасывает журнал на диск"""
+        self._sync()
+
+    def compact(self):
+        """Записывает снимок всех сотрудников и очищает журнал"""
+        with self._wal_lock:
+            self._sync()
+            tmp_filename = self._filename + '.tmp'
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump({'employees': [emp.to_dict() for emp in self._employees.values()]},
+                          f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self._filename)
+            # Сбой до очистки журнала безопасен: повторное проигрывание идемпотентно
+            self._wal.truncate(0)
+            self._wal.seek(0)
+            self._sync()
+            self._wal_records = 0
+
+    def close(self):
+        with self._wal_lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if not self._wal.closed:
+                self._sync()
+                self._wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ConcurrentEmployeeRepository(IEmployeeRepository):
+    """Потокобезопасный репозиторий в памяти
+
+    Сотрудники распределены по шардам по id, у каждого шарда своя блокировка;
+    запись блокирует только свой шард и изменяет его словарь на месте.
+    Снимок и ленивый обход не копируют данные, а помечают словари шардов
+    как разделяемые: следующая запись в такой шард сначала копирует его
+    (copy-on-write), поэтому снимок и обход не видят последующих изменений.
+    """
+
+    def __init__(self, shard_count: int = 64):
+        self._shard_count = shard_count
+        self._locks = [threading.Lock() for _ in range(shard_count)]
+        self._shards = [{} for _ in range(shard_count)]
+        self._shared = [False] * shard_count
+        self._generations = [0] * shard_count
+
+    def _shard_index(self, emp_id: int) -> int:
+        return hash(emp_id) % self._shard_count
+
+    def _writable_shard(self, index: int) -> dict:
+        """Возвращает словарь шарда для записи (вызывается под блокировкой шарда)"""
+        if self._shared[index]:
+            self._shards[index] = dict(self._shards[index])
+            self._shared[index] = False
+        return self._shards[index]
+
+    def _share_shard(self, index: int) -> dict:
+        """Отдает словарь шарда снимку (вызывается под блокировкой шарда)"""
+        self._shared[index] = True
+        return self._shards[index]
+
+    def save(self, employee):
+        index = self._shard_index(employee.id)
+        with self._locks[index]:
+            self._writable_shard(index)[employee.id] = employee
+            self._generations[index] += 1
+
+    def delete(self, emp_id: int):
+        index = self._shard_index(emp_id)
+        with self._locks[index]:
+            if emp_id not in self._shards[index]:
+                return
+            del self._writable_shard(index)[emp_id]
+            self._generations[index] += 1
+
+    def save_many(self, employees) -> list:
+        """Сохраняет сотрудников, захватывая блокировку каждого шарда один раз"""
+        results = []
+        by_shard = {}
+        for emp in employees:
+            try:
+                by_shard.setdefault(self._shard_index(emp.id), []).append(emp)
+                results.append(BatchResult(emp.id, True, emp, None))
+            except Exception as error:
+                results.append(BatchResult(getattr(emp, 'id', None), False, emp, error))
+        for index, shard_employees in by_shard.items():
+            with self._locks[index]:
+                shard = self._writable_shard(index)
+                for emp in shard_employees:
+                    shard[emp.id] = emp
+                self._generations[index] += 1
+        return results
+
+    def delete_many(self, emp_ids) -> list:
+        """Удаляет сотрудников, захватывая блокировку каждого шарда один раз"""
+        emp_ids = list(emp_ids)
+        results = [None] * len(emp_ids)
+        by_shard = {}
+        for position, emp_id in enumerate(emp_ids):
+            by_shard.setdefault(self._shard_index(emp_id), []).append(position)
+        for index, positions in by_shard.items():
+            with self._locks[index]:
+                # Шард без удаляемых сотрудников не копируется и не меняет поколение
+                if not any(emp_ids[position] in self._shards[index] for position in positions):
+                    for position in positions:
+                        emp_id = emp_ids[position]
+                        results[position] = BatchResult(emp_id, False, None, KeyError(emp_id))
+                    continue
+                shard = self._writable_shard(index)
+                for position in positions:
+                    emp_id = emp_ids[position]
+                    if shard.pop(emp_id, None) is None:
+                        results[position] = BatchResult(emp_id, False, None, KeyError(emp_id))
+                    else:
+                        results[position] = BatchResult(emp_id, True, None, None)
+                self._generations[index] += 1
+        return results
+
+    def find_by_id(self, emp_id: int):
+        return self._shards[self._shard_index(emp_id)].get(emp_id)
+
+    def get_all(self) -> list:
+        employees = []
+        for index, lock in enumerate(self._locks):
+            with lock:
+                employees.extend(self._shards[index].values())
+        return employees
+
+    def __iter__(self):
+        # Каждый шард обходится в том виде, в каком он был при переходе к нему
+        for index, lock in enumerate(self._locks):
+            with lock:
+                shard = self._share_shard(index)
+            yield from shard.values()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in list(self._shards))
+
+    @property
+    def generation(self) -> int:
+        """Общее число выполненных изменений"""
+        return sum(self._generations)
+
+    def snapshot(self) -> 'RepositorySnapshot':
+        """Согласованный снимок всех шардов на один момент времени"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            shards = tuple(self._share_shard(index) for index in range(self._shard_count))
+            return RepositorySnapshot(self, shards, self.generation)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+class RepositorySnapshot:
+    """Неизменяемый снимок ConcurrentEmployeeRepository (без копирования данных)"""
+
+    def __init__(self, repository: ConcurrentEmployeeRepository, shards: tuple, generation: int):
+        self._repository = repository
+        self._shards = shards
+        self.generation = generation
+
+    def find_by_id(self, emp_id: int):
+        return self._shards[self._repository._shard_index(emp_id)].get(emp_id)
+
+    def get_all(self) -> list:
+        return list(self)
+
+    def __iter__(self):
+        for shard in self._shards:
+            yield from shard.values()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class SqliteEmployeeRepository(IEmployeeRepository):
+    """Репозиторий в базе SQLite
+
+    Общие поля хранятся в таблице employees, поля конкретных типов - в
+    отдельных таблицах (managers, developers, salespersons) с внешним ключом.
+    Запись идет через одно соединение под блокировкой, чтение - через пул
+    соединений; в режиме WAL читатели не блокируются писателем.
+    Базы в памяти (':memory:') не поддерживаются: каждое соединение пула
+    открыло бы свою пустую базу.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            department TEXT NOT NULL,
+            base_salary REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_employees_department ON employees(department);
+        CREATE INDEX IF NOT EXISTS idx_employees_type ON employees(type);
+        CREATE TABLE IF NOT EXISTS managers (
+            id INTEGER PRIMARY KEY REFERENCES employees(id) ON DELETE CASCADE,
+            bonus REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS developers (
+            id INTEGER PRIMARY KEY REFERENCES employees(id) ON DELETE CASCADE,
+            level TEXT NOT NULL,
+            tech_stack TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS salespersons (
+            id INTEGER PRIMARY KEY REFERENCES employees(id) ON DELETE CASCADE,
+            commission_rate REAL NOT NULL,
+            sales_volume REAL NOT NULL
+        );
+    """
+
+    SELECT = """
+        SELECT e.id, e.type, e.name, e.department, e.base_salary,
+               m.bonus, d.level, d.tech_stack, s.commission_rate, s.sales_volume
+        FROM employees e
+        LEFT JOIN managers m ON m.id = e.id
+        LEFT JOIN developers d ON d.id = e.id
+        LEFT JOIN salespersons s ON s.id = e.id
+    """
+
+    def __init__(self, filename: str, readers: int = 4, batch_size: int = 10000):
+        if filename == ':memory:':
+            raise ValueError("SqliteEmployeeRepository требует файл базы данных")
+        self._filename = filename
+        self._batch_size = batch_size
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.executescript(self.SCHEMA)
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._filename, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        connection = self._readers.get()
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            self._readers.put(connection)
+
+    @staticmethod
+    def _to_employee(row: tuple):
+        from serializers import EmployeeSerializer
+        (emp_id, emp_type, name, department, base_salary,
+         bonus, level, tech_stack, commission_rate, sales_volume) = row
+        data = {'type': emp_type, 'id': emp_id, 'name': name,
+                'department': department, 'base_salary': base_salary}
+        if emp_type == 'Manager':
+            data['bonus'] = bonus
+        elif emp_type == 'Developer':
+            data['level'] = level
+            data['tech_stack'] = json.loads(tech_stack)
+        elif emp_type == 'Salesperson':
+            data['commission_rate'] = commission_rate
+            data['sales_volume'] = sales_volume
+        return EmployeeSerializer.deserialize(data)
+
+    @staticmethod
+    def _to_rows(employee) -> tuple:
+        """Возвращает (строка employees, имя таблицы типа, строка таблицы типа)"""
+        data = employee.to_dict()
+        emp_type = data['type']
+        common = (data['id'], emp_type, data['name'], data['department'], data['base_salary'])
+        if emp_type == 'Manager':
+            return common, 'managers', (data['id'], data['bonus'])
+        if emp_type == 'Developer':
+            return common, 'developers', (data['id'], data['level'],
+                                          json.dumps(data['tech_stack'], ensure_ascii=False))
+        if emp_type == 'Salesperson':
+            return common, 'salespersons', (data['id'], data['commission_rate'],
+                                             data['sales_volume'])
+        return common, None, None
+
+    def _write_batch(self, batch: list):
+        rows = {'employees': [], 'managers': [], 'developers': [], 'salespersons': []}
+        # При повторе id в пакете сохраняется последняя версия сотрудника
+        latest = {common[0]: (common, table, extra) for common, table, extra in batch}
+        for common, table, extra in latest.values():
+            rows['employees'].append(common)
+            if table is not None:
+                rows[table].append(extra)
+        ids = [(row[0],) for row in rows['employees']]
+        cursor = self._writer.cursor()
+        # Удаление каскадно очищает таблицы типов, если тип сотрудника изменился
+        cursor.executemany("DELETE FROM employees WHERE id = ?", ids)
+        cursor.executemany("INSERT INTO employees VALUES (?, ?, ?, ?, ?)", rows['employees'])
+        cursor.executemany("INSERT INTO managers VALUES (?, ?)", rows['managers'])
+        cursor.executemany("INSERT INTO developers VALUES (?, ?, ?)", rows['developers'])
+        cursor.executemany("INSERT INTO salespersons VALUES (?, ?, ?)", rows['salespersons'])
+
+    def save(self, employee):
+        result = self.save_many([employee])[0]
+        if not result.ok:
+            raise result.error
+
+    def save_many(self, employees) -> list:
+        """Сохраняет сотрудников пакетами по batch_size, каждый пакет - одна транзакция
+
+        При ошибке базы откатывается и помечается неуспешным только свой пакет
+        """
+        employees = list(employees)
+        results = [BatchResult(getattr(emp, 'id', None), True, emp, None) for emp in employees]
+        with self._write_lock:
+            for start in range(0, len(employees), self._batch_size):
+                batch = []
+                for position in range(start, min(start + self._batch_size, len(employees))):
+                    try:
+                        batch.append((position, self._to_rows(employees[position])))
+                    except Exception as error:
+                        results[position] = results[position]._replace(ok=False, error=error)
+                self._writer.execute("BEGIN")
+                try:
+                    self._write_batch([rows for _, rows in batch])
+                except BaseException as error:
+                    # Транзакция освобождается при любом исключении, в том числе KeyboardInterrupt
+                    self._writer.execute("ROLLBACK")
+                    if not isinstance(error, Exception):
+                        raise
+                    for position, _ in batch:
+                        results[position] = results[position]._replace(ok=False, error=error)
+                    continue
+                self._writer.execute("COMMIT")
+        return results
+
+    def delete(self, emp_id: int):
+        with self._write_lock:
+            self._writer.execute("DELETE FROM employees WHERE id = ?", (emp_id,))
+
+    def delete_many(self, emp_ids) -> list:
+        emp_ids = list(emp_ids)
+        with self._write_lock:
+            self._writer.execute("BEGIN")
+            try:
+                existing = self._existing_ids(self._writer, emp_ids)
+                self._writer.executemany("DELETE FROM employees WHERE id = ?",
+                                         [(emp_id,) for emp_id in existing])
+            except BaseException as error:
+                self._writer.execute("ROLLBACK")
+                if not isinstance(error, Exception):
+                    raise
+                return [BatchResult(emp_id, False, None, error) for emp_id in emp_ids]
+            self._writer.execute("COMMIT")
+        results = []
+        for emp_id in emp_ids:
+            if emp_id in existing:
+                existing.discard(emp_id)
+                results.append(BatchResult(emp_id, True, None, None))
+            else:
+                results.append(BatchResult(emp_id, False, None, KeyError(emp_id)))
+        return results
+
+    @staticmethod
+    def _id_chunks(emp_ids: list, size: int = 500):
+        """Делит id на порции, укладывающиеся в лимит параметров запроса"""
+        for start in range(0, len(emp_ids), size):
+            chunk = emp_ids[start:start + size]
+            yield chunk, ", ".join("?" * len(chunk))
+
+    def _existing_ids(self, connection: sqlite3.Connection, emp_ids: list) -> set:
+        found = set()
+        for chunk, placeholders in self._id_chunks(emp_ids):
+            rows = connection.execute(
+                f"SELECT id FROM employees WHERE id IN ({placeholders})", chunk).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    def find_by_id(self, emp_id: int):
+        rows = self._query(self.SELECT + " WHERE e.id = ?", (emp_id,))
+        return self._to_employee(rows[0]) if rows else None
+
+    def find_many(self, emp_ids) -> list:
+        """Ищет сотрудников запросами WHERE id IN (...) по 500 id"""
+        emp_ids = list(emp_ids)
+        found = {}
+        for chunk, placeholders in self._id_chunks(emp_ids):
+            for row in self._query(self.SELECT + f" WHERE e.id IN ({placeholders})", tuple(chunk)):
+                found[row[0]] = self._to_employee(row)
+        return [BatchResult(emp_id, True, found[emp_id], None) if emp_id in found
+                else BatchResult(emp_id, False, None, KeyError(emp_id))
+                for emp_id in emp_ids]
+
+    def find_by_department(self, department: str) -> list:
+        rows = self._query(self.SELECT + " WHERE e.department = ? ORDER BY e.id", (department,))
+        return [self._to_employee(row) for row in rows]
+
+    def find_by_type(self, emp_type: str) -> list:
+        rows = self._query(self.SELECT + " WHERE e.type = ? ORDER BY e.id", (emp_type,))
+        return [self._to_employee(row) for row in rows]
+
+    def get_all(self) -> list:
+        return [self._to_employee(row) for row in self._query(self.SELECT + " ORDER BY e.id")]
+
+    def count(self) -> int:
+        return self._query("SELECT COUNT(*) FROM employees")[0][0]
+
+    def close(self):
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -7,12 +7,26 @@ from abc import ABC, abstractmethod
 
 
 class SalaryStrategy(ABC):
-    """Базовый класс стратегии расчета зарплаты"""
+    """Базовый класс стратегии расчета зарплаты
+
+    bind() возвращает функцию без аргументов, которую сотрудник кэширует до
+    изменения параметров; по умолчанию она вызывает calculate. Встроенные
+    стратегии заменяют ее готовой формулой, чтобы не собирать словарь kwargs
+    при каждом расчете, но только если calculate не переопределен в наследнике.
+    """
 
     @abstractmethod
     def calculate(self, base_salary: float, **kwargs) -> float:
         pass
 
+    def bind(self, base_salary: float, **params):
+        calculate = self.calculate
+        return lambda: calculate(base_salary, **params)
+
+    def _own_calculate(self, cls) -> bool:
+        """True, если calculate не переопределен ниже класса cls"""
+        return type(self).calculate is cls.calculate
+
 
 class BaseSalaryStrategy(SalaryStrategy):
     """Стратегия для обычного сотрудника"""
@@ -20,6 +34,11 @@ class BaseSalaryStrategy(SalaryStrategy):
     def calculate(self, base_salary: float, **kwargs) -> float:
         return base_salary
 
+    def bind(self, base_salary: float, **params):
+        if not self._own_calculate(BaseSalaryStrategy):
+            return super().bind(base_salary, **params)
+        return lambda: base_salary
+
 
 class ManagerSalaryStrategy(SalaryStrategy):
     """Стратегия для менеджера (базовая + бонус)"""
@@ -28,6 +47,12 @@ class ManagerSalaryStrategy(SalaryStrategy):
         bonus = kwargs.get('bonus', 0)
         return base_salary + bonus
 
+    def bind(self, base_salary: float, **params):
+        if not self._own_calculate(ManagerSalaryStrategy):
+            return super().bind(base_salary, **params)
+        bonus = params.get('bonus', 0)
+        return lambda: base_salary + bonus
+
 
 class DeveloperSalaryStrategy(SalaryStrategy):
     """Стратегия для разработчика (с коэффициентом по уровню)"""
@@ -43,6 +68,12 @@ class DeveloperSalaryStrategy(SalaryStrategy):
         coefficient = self.LEVEL_COEFFICIENTS.get(level, 1.0)
         return base_salary * coefficient
 
+    def bind(self, base_salary: float, **params):
+        if not self._own_calculate(DeveloperSalaryStrategy):
+            return super().bind(base_salary, **params)
+        coefficient = self.LEVEL_COEFFICIENTS.get(params.get('level', 'junior'), 1.0)
+        return lambda: base_salary * coefficient
+
 
 class SalespersonSalaryStrategy(SalaryStrategy):
     """Стратегия для продавца (базовая + комиссия)"""
@@ -52,6 +83,13 @@ class SalespersonSalaryStrategy(SalaryStrategy):
         sales_volume = kwargs.get('sales_volume', 0)
         return base_salary + (sales_volume * commission_rate)
 
+    def bind(self, base_salary: float, **params):
+        if not self._own_calculate(SalespersonSalaryStrategy):
+            return super().bind(base_salary, **params)
+        commission_rate = params.get('commission_rate', 0)
+        sales_volume = params.get('sales_volume', 0)
+        return lambda: base_salary + (sales_volume * commission_rate)
+
 
 class BonusStrategy(ABC):
     """Стратегия расчета бонусов (OCP)"""
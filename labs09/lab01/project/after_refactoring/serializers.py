@@ -48,3 +48,30 @@ class EmployeeSerializer:
     @staticmethod
     def serialize_list(employees: list) -> list:
         return [emp.to_dict() for emp in employees]
+
+    @staticmethod
+    def deserialize(data: dict, strategies: dict = None):
+        """Восстанавливает сотрудника из словаря to_dict()
+
+        strategies - {имя типа: стратегия}; по умолчанию стратегия соответствует типу
+        """
+        from employees import Employee, Manager, Developer, Salesperson
+        from salary_strategies import (
+            BaseSalaryStrategy, ManagerSalaryStrategy,
+            DeveloperSalaryStrategy, SalespersonSalaryStrategy
+        )
+        emp_type = data.get('type', 'Employee')
+        strategy = (strategies or {}).get(emp_type)
+        args = (data['id'], data['name'], data['department'], data['base_salary'])
+        if emp_type == 'Manager':
+            return Manager(*args, data.get('bonus', 0),
+                           salary_strategy=strategy or ManagerSalaryStrategy())
+        if emp_type == 'Developer':
+            return Developer(*args, data.get('level', 'junior'), list(data.get('tech_stack', [])),
+                             salary_strategy=strategy or DeveloperSalaryStrategy())
+        if emp_type == 'Salesperson':
+            return Salesperson(*args, data.get('commission_rate', 0), data.get('sales_volume', 0),
+                               salary_strategy=strategy or SalespersonSalaryStrategy())
+        if emp_type == 'Employee':
+            return Employee(*args, salary_strategy=strategy or BaseSalaryStrategy())
+        raise ValueError(f"Неизвестный тип сотрудника: {emp_type}")